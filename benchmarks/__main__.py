@@ -0,0 +1,37 @@
+import argparse
+import json
+import sys
+from pathlib import Path
+from .suite import CASES, DEFAULT_SIZES, DEFAULT_THRESHOLD, FULL_SIZES, BenchmarkSuite, compare, load_baseline, to_json
+
+def build_parser() -> argparse.ArgumentParser:
+	parser = argparse.ArgumentParser(prog='python -m benchmarks', description='Measure throughput and peak memory of the core building blocks.')
+	parser.add_argument('--sizes', type=int, nargs='+', default=None, help=f'Dataset sizes in rows (default: {" ".join(map(str, DEFAULT_SIZES))}).')
+	parser.add_argument('--full', action='store_true', help=f'Use the full size range ({" ".join(map(str, FULL_SIZES))}).')
+	parser.add_argument('--cases', choices=[case.name for case in CASES], nargs='+', default=None, help='Only run these benchmarks.')
+	parser.add_argument('--repeat', type=int, default=3, help='Timed repetitions per benchmark; the best is kept (default: 3).')
+	parser.add_argument('-o', '--output', type=str, default=None, help='Write the JSON report to this path instead of stdout.')
+	parser.add_argument('--baseline', type=str, default=None, help='Compare against a stored JSON report and fail on regressions.')
+	parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD, help=f'Allowed throughput drop and peak-memory growth versus the baseline (default: {DEFAULT_THRESHOLD}).')
+	return parser
+
+def main(argv: list[str] | None = None) -> int:
+	args = build_parser().parse_args(argv)
+	sizes = tuple(args.sizes) if args.sizes else FULL_SIZES if args.full else DEFAULT_SIZES
+	suite = BenchmarkSuite(sizes, args.repeat)
+	results = suite.run(set(args.cases) if args.cases else None)
+	report = json.dumps(to_json(results, suite.skipped), indent=2)
+	if args.output:
+		Path(args.output).write_text(report + '\n', encoding='utf-8')
+	else:
+		print(report)
+	if args.baseline:
+		regressions = compare(results, load_baseline(args.baseline), args.threshold)
+		for regression in regressions:
+			print(f'Regression: {regression}', file=sys.stderr)
+		if regressions:
+			return 1
+	return 0
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -0,0 +1,81 @@
+import argparse
+import json
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from srcs.compression import DEFAULT_PREFETCH
+from srcs.dataset import Dataset
+from .suite import _write_csv, synthetic_dataset
+
+DEFAULT_ROWS = 500_000
+DEFAULT_REPEAT = 3
+FORMATS = {'csv': None, 'gz': 'gzip', 'bz2': 'bz2', 'xz': 'lzma'}
+
+@dataclass
+class CompressionResult:
+	format: str
+	prefetch: int
+	rows: int
+	file_bytes: int
+	seconds: float
+	rows_per_second: float
+	megabytes_per_second: float
+	relative_throughput: float
+
+def compress(path: Path, suffix: str) -> Path:
+	module = __import__(FORMATS[suffix])
+	target = path.with_name(f'{path.name}.{suffix}')
+	with path.open('rb') as source, module.open(target, 'wb') as sink:
+		while block := source.read(1 << 20):
+			sink.write(block)
+	return target
+
+def parse(path: Path, prefetch: int) -> int:
+	return Dataset.from_csv(path, prefetch=prefetch).size
+
+def _time(path: Path, prefetch: int, repeat: int) -> tuple[float, int]:
+	best, rows = float('inf'), 0
+	for _ in range(repeat):
+		started = time.perf_counter()
+		rows = parse(path, prefetch)
+		best = min(best, time.perf_counter() - started)
+	return best, rows
+
+def run(rows: int = DEFAULT_ROWS, repeat: int = DEFAULT_REPEAT, formats: tuple[str, ...] = tuple(FORMATS)) -> list[CompressionResult]:
+	results = []
+	with tempfile.TemporaryDirectory() as directory:
+		plain = _write_csv(synthetic_dataset(rows), Path(directory))
+		uncompressed_megabytes = plain.stat().st_size / 1e6
+		baseline, _ = _time(plain, DEFAULT_PREFETCH, repeat)
+		for name in formats:
+			path = plain if FORMATS[name] is None else compress(plain, name)
+			# Prefetch 0 decodes inline; the default overlaps decoding with parsing in a thread
+			for prefetch in ((DEFAULT_PREFETCH,) if FORMATS[name] is None else (0, DEFAULT_PREFETCH)):
+				seconds, parsed = _time(path, prefetch, repeat)
+				results.append(CompressionResult(name, prefetch, parsed, path.stat().st_size, seconds, parsed / seconds, uncompressed_megabytes / seconds, baseline / seconds))
+	return results
+
+def build_parser() -> argparse.ArgumentParser:
+	parser = argparse.ArgumentParser(prog='python -m benchmarks.compression', description='Compare CSV parsing throughput on gzip, bz2 and xz input against uncompressed input.')
+	parser.add_argument('--rows', type=int, default=DEFAULT_ROWS, help=f'Rows of the synthetic dataset (default: {DEFAULT_ROWS}).')
+	parser.add_argument('-r', '--repeat', type=int, default=DEFAULT_REPEAT, help=f'Timed runs per case; the best one is kept (default: {DEFAULT_REPEAT}).')
+	parser.add_argument('--formats', choices=FORMATS, nargs='+', default=list(FORMATS), help='Formats to measure (default: all).')
+	parser.add_argument('-o', '--output', type=str, default=None, help='Write the JSON report to this path instead of stdout.')
+	return parser
+
+def main(argv: list[str] | None = None) -> int:
+	args = build_parser().parse_args(argv)
+	if args.rows <= 0 or args.repeat <= 0:
+		print('Rows and repeat must be positive', file=sys.stderr)
+		return 1
+	report = json.dumps([asdict(result) for result in run(args.rows, args.repeat, tuple(args.formats))], indent=2)
+	if args.output:
+		Path(args.output).write_text(report + '\n', encoding='utf-8')
+	else:
+		print(report)
+	return 0
+
+if __name__ == '__main__':
+	sys.exit(main())
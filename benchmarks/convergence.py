@@ -0,0 +1,87 @@
+import argparse
+import json
+import sys
+import warnings
+from dataclasses import asdict, dataclass
+from importlib.util import find_spec
+from pathlib import Path
+from srcs import ClosedFormTrainer, Dataset, GradientDescentTrainer, LinearRegressionModel, ModelEvaluator, set_backend
+from srcs.backends import BACKENDS
+from srcs.learning_rate_schedules import SCHEDULES
+from srcs.optimizers import OPTIMIZERS
+from .suite import synthetic_dataset
+
+BUNDLED_DATASET = Path(__file__).resolve().parent.parent / 'datasets' / 'data.csv'
+DEFAULT_LEARNING_RATES = (0.01, 0.1, 1.0, 10.0, 100.0, 1000.0)
+DEFAULT_EPOCHS = 2000
+DEFAULT_ROWS = 100_000
+DEFAULT_GAP = 1e-4
+CONFIGURATIONS = tuple((optimizer, 'constant') for optimizer in OPTIMIZERS) + tuple(('sgd', schedule) for schedule in SCHEDULES if schedule != 'constant')
+
+@dataclass
+class ConvergenceResult:
+	dataset: str
+	optimizer: str
+	schedule: str
+	learning_rate: float
+	target_loss: float
+	epochs: int | None
+	final_loss: float
+
+def target_loss(dataset: Dataset, gap: float = DEFAULT_GAP) -> float:
+	optimum = ModelEvaluator().evaluate(dataset, ClosedFormTrainer(LinearRegressionModel()).train(dataset))['MSE']
+	return optimum * (1.0 + gap)
+
+def epochs_to_target(dataset: Dataset, optimizer: str, schedule: str, learning_rate: float, target: float, epochs: int) -> tuple[int | None, float]:
+	trainer = GradientDescentTrainer(LinearRegressionModel(), learning_rate, progress=False, optimizer=OPTIMIZERS[optimizer](), schedule=SCHEDULES[schedule](), target_loss=target)
+	with warnings.catch_warnings():
+		# Diverging runs overflow to inf/nan; they simply never reach the target
+		warnings.simplefilter('ignore', RuntimeWarning)
+		trainer.train(dataset, epochs)
+	reached = trainer.final_loss <= target
+	return (trainer.epochs_run if reached else None), trainer.final_loss
+
+def run(datasets: dict[str, Dataset], learning_rates: tuple[float, ...] = DEFAULT_LEARNING_RATES, epochs: int = DEFAULT_EPOCHS, gap: float = DEFAULT_GAP) -> list[ConvergenceResult]:
+	results = []
+	for name, dataset in datasets.items():
+		target = target_loss(dataset, gap)
+		for optimizer, schedule in CONFIGURATIONS:
+			for learning_rate in learning_rates:
+				reached, final_loss = epochs_to_target(dataset, optimizer, schedule, learning_rate, target, epochs)
+				results.append(ConvergenceResult(name, optimizer, schedule, learning_rate, target, reached, final_loss))
+	return results
+
+def epochs_table(results: list[ConvergenceResult]) -> dict[str, dict[str, dict[str, int | None]]]:
+	# dataset -> optimizer/schedule -> learning rate -> epochs (None when the target was never reached)
+	table: dict[str, dict[str, dict[str, int | None]]] = {}
+	for result in results:
+		row = table.setdefault(result.dataset, {}).setdefault(f'{result.optimizer}/{result.schedule}', {})
+		row[f'{result.learning_rate:g}'] = result.epochs
+	return table
+
+def build_parser() -> argparse.ArgumentParser:
+	parser = argparse.ArgumentParser(prog='python -m benchmarks.convergence', description='Count the epochs each optimizer and schedule needs to reach a target training loss.')
+	parser.add_argument('--rows', type=int, default=DEFAULT_ROWS, help=f'Rows of the synthetic dataset; 0 skips it (default: {DEFAULT_ROWS}).')
+	parser.add_argument('-l', '--learning-rates', type=float, nargs='+', default=list(DEFAULT_LEARNING_RATES), help='Learning rates to try for every configuration.')
+	parser.add_argument('-e', '--epochs', type=int, default=DEFAULT_EPOCHS, help=f'Epoch budget per run (default: {DEFAULT_EPOCHS}).')
+	parser.add_argument('--gap', type=float, default=DEFAULT_GAP, help=f'Target loss as a relative gap above the closed-form optimum (default: {DEFAULT_GAP}).')
+	parser.add_argument('--backend', choices=BACKENDS, default='numpy' if find_spec('numpy') else 'python', help='Compute backend (default: numpy when installed).')
+	parser.add_argument('-o', '--output', type=str, default=None, help='Write the JSON report to this path instead of stdout.')
+	return parser
+
+def main(argv: list[str] | None = None) -> int:
+	args = build_parser().parse_args(argv)
+	set_backend(args.backend)
+	datasets = {'data.csv': Dataset.from_csv(BUNDLED_DATASET)}
+	if args.rows > 0:
+		datasets[f'synthetic-{args.rows}'] = synthetic_dataset(args.rows)
+	results = run(datasets, tuple(args.learning_rates), args.epochs, args.gap)
+	report = json.dumps({'epochs': epochs_table(results), 'results': [asdict(result) for result in results]}, indent=2)
+	if args.output:
+		Path(args.output).write_text(report + '\n', encoding='utf-8')
+	else:
+		print(report)
+	return 0
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -0,0 +1,81 @@
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+ENTRY_POINT = ROOT / 'ft_linear_regression.py'
+FORBIDDEN_MODULES = ('matplotlib', 'matplotx', 'tqdm', 'asyncio')
+
+@dataclass
+class StartupResult:
+	command: str
+	import_seconds: float
+	modules: int
+	slowest: list[tuple[str, float]]
+	forbidden: list[str]
+
+def parse_importtime(stderr: str) -> dict[str, int]:
+	cumulative: dict[str, int] = {}
+	for line in stderr.splitlines():
+		if not line.startswith('import time:'):
+			continue
+		fields = line[len('import time:'):].split('|')
+		if len(fields) != 3 or not fields[1].strip().isdigit():
+			continue
+		cumulative[fields[2].strip()] = int(fields[1])
+	return cumulative
+
+def _top_level(stderr: str) -> int:
+	# Nested imports are indented under their parent; only top-level entries add up to the total
+	total = 0
+	for line in stderr.splitlines():
+		fields = line[len('import time:'):].split('|') if line.startswith('import time:') else []
+		if len(fields) == 3 and fields[1].strip().isdigit() and not fields[2].startswith('  '):
+			total += int(fields[1])
+	return total
+
+def measure(command: list[str], stdin: str = '') -> StartupResult:
+	completed = subprocess.run([sys.executable, '-X', 'importtime', str(ENTRY_POINT), *command], input=stdin, capture_output=True, text=True, cwd=ROOT)
+	if completed.returncode != 0:
+		raise RuntimeError(f'{" ".join(command)} failed: {completed.stdout.strip()} {completed.stderr.strip()[-500:]}')
+	cumulative = parse_importtime(completed.stderr)
+	forbidden = sorted(name for name in cumulative if name.split('.')[0] in FORBIDDEN_MODULES)
+	slowest = sorted(cumulative.items(), key=lambda item: item[1], reverse=True)[:10]
+	return StartupResult(
+		command=' '.join(command),
+		import_seconds=_top_level(completed.stderr) / 1e6,
+		modules=len(cumulative),
+		slowest=[(name, microseconds / 1e6) for name, microseconds in slowest],
+		forbidden=forbidden,
+	)
+
+def measure_predict() -> StartupResult:
+	with tempfile.TemporaryDirectory() as directory:
+		model = Path(directory) / 'model.json'
+		model.write_text(json.dumps({'thetas': [8500.0, -0.02], 'feature_name': 'km', 'target_name': 'price'}), encoding='utf-8')
+		return measure(['predict', '-m', str(model), '-i', '-'], 'km\n1000\n2000\n')
+
+def build_parser() -> argparse.ArgumentParser:
+	parser = argparse.ArgumentParser(prog='python -m benchmarks.startup', description='Profile the import cost of a cold `predict` run with -X importtime.')
+	parser.add_argument('-o', '--output', type=str, default=None, help='Write the JSON report to this path instead of stdout.')
+	return parser
+
+def main(argv: list[str] | None = None) -> int:
+	args = build_parser().parse_args(argv)
+	result = measure_predict()
+	report = json.dumps(asdict(result), indent=2)
+	if args.output:
+		Path(args.output).write_text(report + '\n', encoding='utf-8')
+	else:
+		print(report)
+	if result.forbidden:
+		print(f'Regression: predict imported {", ".join(result.forbidden)}', file=sys.stderr)
+		return 1
+	return 0
+
+if __name__ == '__main__':
+	sys.exit(main())
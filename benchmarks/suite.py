@@ -0,0 +1,164 @@
+import csv
+import gc
+import json
+import random
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from srcs import Dataset, FeatureScaler, GradientDescentTrainer, LinearRegressionModel, ModelEvaluator, RegressionVisualizer, Vector
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+FULL_SIZES = (1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+DEFAULT_THRESHOLD = 0.25
+
+@dataclass
+class BenchmarkResult:
+	name: str
+	rows: int
+	seconds: float
+	rows_per_second: float
+	peak_memory_bytes: int
+
+@dataclass
+class BenchmarkCase:
+	name: str
+	setup: Callable[[Dataset, Path], Callable[[], object]]
+	max_rows: int | None = None
+	passes: int = 1
+
+def synthetic_dataset(rows: int, seed: int = 42) -> Dataset:
+	rng = random.Random(seed)
+	features = [rng.uniform(0.0, 250_000.0) for _ in range(rows)]
+	targets = [8_500.0 - 0.021 * x + rng.gauss(0.0, 600.0) for x in features]
+	return Dataset(features, targets, 'km', 'price')
+
+def _write_csv(dataset: Dataset, directory: Path) -> Path:
+	path = directory / f'synthetic-{dataset.size}.csv'
+	if not path.exists():
+		with path.open('w', newline='') as f:
+			writer = csv.writer(f)
+			writer.writerow([dataset.feature_name, dataset.target_name])
+			writer.writerows(zip(dataset.features, dataset.targets))
+	return path
+
+def _vector_ops(dataset: Dataset, directory: Path) -> Callable[[], object]:
+	features, targets = dataset.features, dataset.targets
+	def run() -> object:
+		residuals = features.affine(-0.021, 8_500.0)
+		residuals.isub(targets)
+		residuals.axpy(0.5, targets)
+		return residuals.dot(features) + targets.squared_distance(features) + residuals.sum()
+	return run
+
+def _from_csv(dataset: Dataset, directory: Path) -> Callable[[], object]:
+	path = _write_csv(dataset, directory)
+	return lambda: Dataset.from_csv(path)
+
+def _scaler(dataset: Dataset, directory: Path) -> Callable[[], object]:
+	return lambda: FeatureScaler.from_vector(dataset.features)
+
+TRAIN_EPOCHS = 5
+
+def _train(dataset: Dataset, directory: Path) -> Callable[[], object]:
+	return lambda: GradientDescentTrainer(LinearRegressionModel(), 0.1, progress=False).train(dataset, TRAIN_EPOCHS)
+
+def _evaluate(dataset: Dataset, directory: Path) -> Callable[[], object]:
+	parameters = Vector([8_500.0, -0.021])
+	return lambda: ModelEvaluator().evaluate(dataset, parameters)
+
+def _plot(dataset: Dataset, directory: Path) -> Callable[[], object]:
+	import matplotlib
+	matplotlib.use('Agg')
+	import matplotlib.pyplot as plt
+	parameters = Vector([8_500.0, -0.021])
+	output = directory / 'plot.png'
+	def run() -> object:
+		figure = RegressionVisualizer().plot(dataset, parameters, save_path=output)
+		plt.close(figure)
+		return figure
+	return run
+
+CASES = (
+	BenchmarkCase('vector_ops', _vector_ops),
+	# Parsing a 1e7-row CSV takes minutes per repeat, so --full stops this case at 1e6 rows
+	BenchmarkCase('dataset_from_csv', _from_csv, max_rows=1_000_000),
+	BenchmarkCase('feature_scaler_from_vector', _scaler),
+	BenchmarkCase('trainer_epoch', _train, passes=TRAIN_EPOCHS),
+	BenchmarkCase('evaluator_evaluate', _evaluate),
+	BenchmarkCase('visualizer_plot', _plot),
+)
+
+class BenchmarkSuite:
+	def __init__(self, sizes: tuple[int, ...] = DEFAULT_SIZES, repeat: int = 3, cases: tuple[BenchmarkCase, ...] = CASES, seed: int = 42) -> None:
+		if repeat <= 0:
+			raise ValueError('Repeat must be positive')
+		self._sizes = sizes
+		self._repeat = repeat
+		self._cases = cases
+		self._seed = seed
+		self._skipped: list[str] = []
+
+	@property
+	def skipped(self) -> list[str]:
+		return list(self._skipped)
+
+	def _measure(self, case: BenchmarkCase, dataset: Dataset, directory: Path) -> BenchmarkResult:
+		run = case.setup(dataset, directory)
+		best = float('inf')
+		for _ in range(self._repeat):
+			gc.collect()
+			started = time.perf_counter()
+			run()
+			best = min(best, time.perf_counter() - started)
+		gc.collect()
+		tracemalloc.start()
+		try:
+			run()
+			_, peak = tracemalloc.get_traced_memory()
+		finally:
+			tracemalloc.stop()
+		seconds = best / case.passes
+		return BenchmarkResult(case.name, dataset.size, seconds, dataset.size / seconds if seconds > 0 else float('inf'), peak)
+
+	def run(self, names: set[str] | None = None) -> list[BenchmarkResult]:
+		results = []
+		self._skipped = []
+		with tempfile.TemporaryDirectory() as td:
+			for size in self._sizes:
+				dataset = synthetic_dataset(size, self._seed)
+				for case in self._cases:
+					if names is not None and case.name not in names:
+						continue
+					if case.max_rows is not None and size > case.max_rows:
+						self._skipped.append(f'{case.name}@{size}: above max_rows={case.max_rows}')
+						continue
+					results.append(self._measure(case, dataset, Path(td)))
+		return results
+
+def to_json(results: list[BenchmarkResult], skipped: list[str] | None = None) -> dict:
+	report: dict = {'results': [asdict(result) for result in results]}
+	if skipped:
+		report['skipped'] = skipped
+	return report
+
+def compare(results: list[BenchmarkResult], baseline: dict, threshold: float = DEFAULT_THRESHOLD) -> list[str]:
+	reference = {(entry['name'], entry['rows']): entry for entry in baseline.get('results', [])}
+	regressions = []
+	for result in results:
+		entry = reference.get((result.name, result.rows))
+		if entry is None:
+			continue
+		floor = entry['rows_per_second'] * (1.0 - threshold)
+		if result.rows_per_second < floor:
+			regressions.append(f'{result.name}@{result.rows}: {result.rows_per_second:.0f} rows/s < {floor:.0f} rows/s (baseline {entry["rows_per_second"]:.0f})')
+		ceiling = entry['peak_memory_bytes'] * (1.0 + threshold)
+		if result.peak_memory_bytes > ceiling:
+			regressions.append(f'{result.name}@{result.rows}: peak memory {result.peak_memory_bytes} B > {ceiling:.0f} B (baseline {entry["peak_memory_bytes"]})')
+	return regressions
+
+def load_baseline(path: Path | str) -> dict:
+	with Path(path).open('r', encoding='utf-8') as f:
+		return json.load(f)
@@ -1,6 +1,11 @@
 import argparse
+import sys
 from pathlib import Path
-from srcs import Dataset, GradientDescentTrainer, LinearRegressionModel, ModelConfiguration, RegressionVisualizer, Vector, ModelEvaluator
+# Only what `predict` needs is imported eagerly; every other command imports
+# its modules on demand so scoring never pays for matplotlib, tqdm or asyncio.
+from srcs import BatchPredictor, Dataset, LinearRegressionModel, ModelConfiguration, Vector
+from srcs.backends import BACKENDS, set_backend
+from srcs.options import DEFAULT_DENSITY_THRESHOLD, METRICS, OPTIMIZER_NAMES, SCHEDULE_NAMES, SOLVERS, STOP_CRITERIA
 
 DEFAULT_LEARNING_RATE = 0.1
 DEFAULT_EPOCHS = 1000
@@ -9,30 +14,142 @@ class CommandLineApplication:
 	def build_parser(self) -> argparse.ArgumentParser:
 		parser = argparse.ArgumentParser(prog='ft_linear_regression', add_help=True, description='Train and use a simple linear regression model.')
 		sub = parser.add_subparsers(dest='command', required=True)
+		compute = argparse.ArgumentParser(add_help=False)
+		compute.add_argument('--backend', choices=BACKENDS, default='python', help='Compute backend for training and scoring kernels (default: python; numpy needs NumPy installed).')
 
-		train = sub.add_parser('train', help='Train a linear regression model from a CSV dataset.')
-		train.add_argument('-d', '--dataset', type=str, required=True, help='Path to CSV dataset (needs at least two columns).')
+		train = sub.add_parser('train', parents=[compute], help='Train a linear regression model from a CSV dataset.')
+		train.add_argument('-d', '--dataset', type=str, required=True, help='Path to CSV dataset (needs at least two columns) or converted .ftlr file.')
+		train.add_argument('-w', '--workers', type=int, default=1, help='Parse the CSV with this many worker processes (default: 1).')
+		train.add_argument('--no-cache', action='store_true', help='Always parse the CSV instead of using the binary dataset cache.')
 		train.add_argument('--feature', type=str, default=None, help='Feature column name (override first column).')
 		train.add_argument('--target', type=str, default=None, help='Target column name (override second column).')
+		train.add_argument('--chunk-size', type=int, default=None, help='Stream the dataset in chunks of this many rows instead of loading it into memory.')
+		train.add_argument('--solver', choices=SOLVERS, default='gd', help='Training solver: closed-form least squares or gradient descent (default: gd).')
 		train.add_argument('-e', '--epochs', type=int, default=1000, help='Number of training epochs (default: 1000).')
+		train.add_argument('-b', '--batch-size', type=int, default=None, help='Mini-batch size for gradient descent (1 for SGD; full batch if omitted).')
+		train.add_argument('--shuffle', action='store_true', help='Shuffle samples before splitting them into mini-batches each epoch (needs --batch-size; with --chunk-size, chunks are reordered and rows shuffled within each chunk).')
+		train.add_argument('--seed', type=int, default=None, help='Random seed for deterministic shuffling.')
+		train.add_argument('--tolerance', type=float, default=None, help='Stop early once the stop criterion falls below this tolerance.')
+		train.add_argument('--stop-on', choices=STOP_CRITERIA, default='gradient', help='Early stopping criterion: gradient norm, relative loss change or parameter change (default: gradient).')
+		train.add_argument('--patience', type=int, default=1, help='Consecutive epochs the stop criterion must hold before stopping (default: 1).')
+		train.add_argument('--optimizer', choices=OPTIMIZER_NAMES, default='sgd', help='Update rule for gradient descent: plain steps, momentum, Nesterov momentum, Adam or backtracking line search (default: sgd).')
+		train.add_argument('--schedule', choices=SCHEDULE_NAMES, default='constant', help='Learning-rate schedule across epochs (default: constant).')
+		train.add_argument('--decay-rate', type=float, default=None, help='Decay factor for the step (default: 0.5) and exponential (default: 0.99) schedules.')
+		train.add_argument('--decay-steps', type=int, default=None, help='Epochs between decays for the step schedule (default: 100).')
+		train.add_argument('--target-loss', type=float, default=None, help='Stop as soon as the training MSE reaches this value.')
+		train.add_argument('--checkpoint', type=str, default=None, help='Enable checkpoints at this path (defaults to the model path with .checkpoint.json when another checkpoint option is given).')
+		train.add_argument('--checkpoint-every', type=int, default=None, help='Write a checkpoint every N epochs.')
+		train.add_argument('--checkpoint-interval', type=float, default=None, help='Write a checkpoint at most every N seconds.')
+		train.add_argument('--resume', action='store_true', help='Continue gradient descent from the last checkpoint, if any, at the cadence it was written with.')
 		train.add_argument('-l', '--learning-rate', type=float, default=None, help='Learning rate (default: 0.01 if omitted).')
 		train.add_argument('-o', '--output', type=str, default=None, help='Output path for model JSON (mirrors dataset under models/ if omitted).')
 		train.add_argument('-p', '--plot', action='store_true', help='Display interactive plot after training.')
 		train.add_argument('-s', '--save-plot', nargs='?', const='', default=None, help='Save regression plot (optional path; defaults to model path with .png).')
+		train.add_argument('--density-threshold', type=int, default=DEFAULT_DENSITY_THRESHOLD, help=f'Plot a 2D density instead of individual points above this many rows; 0 always plots points (default: {DEFAULT_DENSITY_THRESHOLD}).')
+		train.add_argument('--trace', nargs='?', const='', default=None, help='Write a JSONL training trace and a Chrome trace-event file (optional path prefix; defaults to the model path; --solver gd only).')
+		train.add_argument('--trace-every', type=int, default=1, help='Record one traced epoch out of this many (default: 1).')
 		train.add_argument('--statistics', action='store_true', help='Display training statistics (MSR, RMSE, R2, etc.) after training.')
 
-		predict = sub.add_parser('predict', help='Generate predictions from a trained model.')
+		train_all = sub.add_parser('train-all', parents=[compute], help='Fit every feature/target pair of a wide CSV from a single scan.')
+		train_all.add_argument('-d', '--dataset', type=str, required=True, help='Path to CSV dataset (needs at least two columns).')
+		train_all.add_argument('--columns', type=str, nargs='+', default=None, help='Columns to pair up (default: every column).')
+		train_all.add_argument('-w', '--workers', type=int, default=1, help='Scan the CSV with this many worker processes (default: 1).')
+		train_all.add_argument('--chunk-size', type=int, default=65536, help='Rows read per chunk (default: 65536).')
+		train_all.add_argument('--mae', action='store_true', help='Make a second scan to report MAE, which co-moments cannot provide.')
+		train_all.add_argument('-o', '--output', type=str, default=None, help='Output directory for the models and summary.csv (defaults to models/<dataset name>/).')
+
+		predict = sub.add_parser('predict', parents=[compute], help='Generate predictions from a trained model.')
 		predict.add_argument('-m', '--model', type=str, required=True, help='Path to trained model JSON file.')
+		predict.add_argument('-i', '--input', type=str, default=None, help='Score a CSV file (or - for stdin) in batch instead of prompting.')
+		predict.add_argument('-o', '--output', type=str, default='-', help='Where to write batch predictions as CSV (default: - for stdout).')
+		predict.add_argument('-c', '--column', type=str, default=None, help='Input column holding the feature (default: the model feature name).')
+		predict.add_argument('--chunk-size', type=int, default=65536, help='Rows scored per batch (default: 65536).')
+
+		evaluate = sub.add_parser('evaluate', parents=[compute], help='Score a trained model on a held-out dataset in constant memory.')
+		evaluate.add_argument('-m', '--model', type=str, required=True, help='Path to trained model JSON file.')
+		evaluate.add_argument('-d', '--dataset', type=str, required=True, help='Path to a held-out CSV dataset or converted .ftlr file.')
+		evaluate.add_argument('--feature', type=str, default=None, help='Feature column name (default: the model feature name).')
+		evaluate.add_argument('--target', type=str, default=None, help='Target column name (default: the model target name).')
+		evaluate.add_argument('--chunk-size', type=int, default=65536, help='Rows read per chunk (default: 65536).')
+
+		update = sub.add_parser('update', parents=[compute], help='Fold new rows into a model trained with --solver exact.')
+		update.add_argument('-m', '--model', type=str, required=True, help='Path to a model JSON file that stores its training statistics.')
+		update.add_argument('-d', '--dataset', type=str, required=True, help='Path to a CSV (or converted .ftlr file) holding only the new rows.')
+		update.add_argument('--feature', type=str, default=None, help='Feature column name (default: the model feature name).')
+		update.add_argument('--target', type=str, default=None, help='Target column name (default: the model target name).')
+		update.add_argument('--chunk-size', type=int, default=65536, help='Rows read per chunk (default: 65536).')
+		update.add_argument('-o', '--output', type=str, default=None, help='Where to save the updated model (default: overwrite --model).')
+
+		convert = sub.add_parser('convert', help='Convert a CSV dataset to the binary .ftlr format.')
+		convert.add_argument('-d', '--dataset', type=str, required=True, help='Path to CSV dataset (needs at least two columns).')
+		convert.add_argument('--feature', type=str, default=None, help='Feature column name (override first column).')
+		convert.add_argument('--target', type=str, default=None, help='Target column name (override second column).')
+		convert.add_argument('-o', '--output', type=str, default=None, help='Output path (defaults to the dataset path with .ftlr).')
+
+		sweep = sub.add_parser('sweep', parents=[compute], help='Search learning rates, epoch budgets and solvers in parallel.')
+		sweep.add_argument('-d', '--dataset', type=str, required=True, help='Path to CSV dataset (needs at least two columns) or converted .ftlr file.')
+		sweep.add_argument('--feature', type=str, default=None, help='Feature column name (override first column).')
+		sweep.add_argument('--target', type=str, default=None, help='Target column name (override second column).')
+		sweep.add_argument('-l', '--learning-rates', type=float, nargs='+', default=[0.001, 0.01, 0.1, 0.5], help='Learning rates to try (default: 0.001 0.01 0.1 0.5).')
+		sweep.add_argument('-e', '--epochs', type=int, nargs='+', default=[100, 1000], help='Epoch budgets to try (default: 100 1000).')
+		sweep.add_argument('--solvers', choices=SOLVERS, nargs='+', default=['gd'], help='Solvers to try (default: gd).')
+		sweep.add_argument('-b', '--batch-sizes', type=int, nargs='+', default=None, help='Mini-batch sizes to try (full batch if omitted).')
+		sweep.add_argument('--seed', type=int, default=None, help='Random seed for shuffled mini-batches.')
+		sweep.add_argument('--metric', choices=METRICS, default='MSE', help='Metric used to rank configurations (default: MSE).')
+		sweep.add_argument('-w', '--workers', type=int, default=None, help='Number of worker processes (default: CPU count).')
+		sweep.add_argument('--top', type=int, default=10, help='Number of ranked configurations to print (default: 10).')
+		sweep.add_argument('-o', '--output', type=str, default=None, help='Output path for the best model JSON (mirrors dataset under models/ if omitted).')
+		sweep.add_argument('--no-cache', action='store_true', help='Always parse the CSV instead of using the binary dataset cache.')
+
+		cross_validate = sub.add_parser('cross-validate', parents=[compute], help='Estimate held-out error with (repeated) k-fold cross-validation.')
+		cross_validate.add_argument('-d', '--dataset', type=str, required=True, help='Path to CSV dataset (needs at least two columns) or converted .ftlr file.')
+		cross_validate.add_argument('--feature', type=str, default=None, help='Feature column name (override first column).')
+		cross_validate.add_argument('--target', type=str, default=None, help='Target column name (override second column).')
+		cross_validate.add_argument('-k', '--folds', type=int, default=5, help='Number of folds (default: 5).')
+		cross_validate.add_argument('-r', '--repeats', type=int, default=1, help='Number of times to repeat k-fold with a new shuffle (default: 1).')
+		cross_validate.add_argument('--seed', type=int, default=None, help='Random seed for reproducible splits.')
+		cross_validate.add_argument('-w', '--workers', type=int, default=1, help='Number of worker processes for the folds (default: 1).')
+		cross_validate.add_argument('--no-cache', action='store_true', help='Always parse the CSV instead of using the binary dataset cache.')
+
+		serve = sub.add_parser('serve', parents=[compute], help='Serve predictions over HTTP/JSON.')
+		serve.add_argument('-m', '--model', type=str, action='append', required=True, help='Path to a trained model JSON file (repeat to serve several models).')
+		serve.add_argument('--host', type=str, default='127.0.0.1', help='Address to bind (default: 127.0.0.1).')
+		serve.add_argument('--port', type=int, default=8000, help='Port to bind (default: 8000).')
+		serve.add_argument('--max-batch-size', type=int, default=4096, help='Maximum number of features scored per micro-batch (default: 4096).')
+		serve.add_argument('--max-delay-ms', type=float, default=2.0, help='Maximum time to wait while filling a micro-batch (default: 2 ms).')
+		serve.add_argument('--reload-interval', type=float, default=1.0, help='Seconds between checks for changed model files (default: 1).')
 
 		return parser
 
+	def _load_dataset(self, path: Path, feature: str | None, target: str | None, use_cache: bool, workers: int = 1) -> Dataset:
+		from srcs import DatasetCache, ParallelCsvLoader
+		if workers <= 0:
+			raise ValueError('Workers must be positive')
+		if path.suffix == '.ftlr':
+			return Dataset.from_binary(path)
+		if use_cache:
+			return DatasetCache().load(path, feature, target, workers)
+		if workers > 1:
+			return ParallelCsvLoader(workers).load(path, feature, target)
+		return Dataset.from_csv(path, feature, target)
+
+	def _convert(self, args: argparse.Namespace):
+		dataset_path = Path(args.dataset)
+		output = Path(args.output) if args.output else dataset_path.with_suffix('.ftlr')
+		dataset = Dataset.from_csv(dataset_path, args.feature, args.target)
+		dataset.to_binary(output)
+		print(f'Dataset converted: {output} ({dataset.size} rows)')
+
 	def _predict(self, args: argparse.Namespace):
 		try:
 			cfg = ModelConfiguration.from_file(Path(args.model))
 		except FileNotFoundError as e:
-			print(f'Warning: {e.filename}: {e.strerror}. Using default configuration.')
+			print(f'Warning: {e.filename}: {e.strerror}. Using default configuration.', file=sys.stderr)
 			cfg = ModelConfiguration(Vector([0.0, 0.0]), 'feature', 'target')
 		model = LinearRegressionModel(cfg.thetas)
+		if args.input is not None:
+			self._predict_batch(args, cfg, model)
+			return
 		print('Enter a feature value to predict (blank line to quit)')
 		while True:
 			try:
@@ -51,24 +168,211 @@ class CommandLineApplication:
 			except ValueError:
 				print('Error: Invalid number')
 
+	def _predict_batch(self, args: argparse.Namespace, cfg: ModelConfiguration, model: LinearRegressionModel):
+		from srcs.compression import open_text
+		predictor = BatchPredictor(model, args.chunk_size)
+		column = args.column if args.column is not None else cfg.feature_name
+		source = sys.stdin if args.input == '-' else open_text(args.input)
+		sink = sys.stdout if args.output == '-' else open(args.output, 'w', newline='', buffering=1 << 20)
+		try:
+			count = predictor.predict_csv(source, sink, column, cfg.target_name)
+		finally:
+			if source is not sys.stdin:
+				source.close()
+			if sink is not sys.stdout:
+				sink.close()
+		print(f'Scored {count} rows', file=sys.stderr)
+
+	def _model_chunks(self, path: Path, feature: str, target: str, chunk_size: int):
+		from srcs import DatasetStream
+		if path.suffix != '.ftlr':
+			return DatasetStream(path, feature, target, chunk_size)
+		dataset = Dataset.from_binary(path)
+		# A binary file stores one fixed column pair: it must be the one the model expects
+		if (dataset.feature_name, dataset.target_name) != (feature, target):
+			raise ValueError(f'{path} holds columns {dataset.feature_name}/{dataset.target_name}, expected {feature}/{target}')
+		return (dataset,)
+
+	def _evaluate(self, args: argparse.Namespace):
+		from srcs import ModelEvaluator
+		cfg = ModelConfiguration.from_file(Path(args.model))
+		dataset_path = Path(args.dataset)
+		feature = args.feature if args.feature is not None else cfg.feature_name
+		target = args.target if args.target is not None else cfg.target_name
+		chunks = self._model_chunks(dataset_path, feature, target, args.chunk_size)
+		accumulator = ModelEvaluator().accumulate(chunks, cfg.thetas)
+		metrics = accumulator.metrics()
+		print(f'Evaluation ({accumulator.count} samples):')
+		for name, value in metrics.items():
+			print(f'  {name:<16}: {value:.6f}')
+
+	def _update(self, args: argparse.Namespace):
+		from srcs import ClosedFormTrainer
+		model_path = Path(args.model)
+		cfg = ModelConfiguration.from_file(model_path)
+		if cfg.statistics is None:
+			raise ValueError(f'{model_path} has no stored training statistics; retrain it with --solver exact')
+		dataset_path = Path(args.dataset)
+		feature = args.feature if args.feature is not None else cfg.feature_name
+		target = args.target if args.target is not None else cfg.target_name
+		chunks = self._model_chunks(dataset_path, feature, target, args.chunk_size)
+		trainer = ClosedFormTrainer(LinearRegressionModel())
+		parameters = trainer.train_chunks(chunks, cfg.statistics)
+		statistics = trainer.statistics
+		output = Path(args.output) if args.output else model_path
+		ModelConfiguration(parameters, cfg.feature_name, cfg.target_name, statistics).save(output)
+		print(f'Merged {statistics.count - cfg.statistics.count} new rows ({statistics.count} total)')
+		print(f'Model saved: {output}')
+
+	def _train_all(self, args: argparse.Namespace):
+		import csv
+		from srcs import PairwiseTrainer
+		from srcs.pairwise_trainer import model_filename
+		dataset_path = Path(args.dataset)
+		fits = PairwiseTrainer(args.columns, args.workers, args.chunk_size, absolute_errors=args.mae).train(dataset_path)
+		filenames: dict[str, tuple[str, str]] = {}
+		for fit in fits:
+			name = model_filename(fit.feature, fit.target)
+			if name in filenames:
+				raise ValueError(f'Pairs {filenames[name]!r} and {(fit.feature, fit.target)!r} would both be saved as {name}')
+			filenames[name] = (fit.feature, fit.target)
+		output = Path(args.output) if args.output else Path('models') / dataset_path.stem
+		output.mkdir(parents=True, exist_ok=True)
+		metrics = list(fits[0].metrics)
+		rows = []
+		for fit in fits:
+			ModelConfiguration(fit.parameters, fit.feature, fit.target, fit.statistics).save(output / model_filename(fit.feature, fit.target))
+			rows.append([fit.feature, fit.target, fit.parameters[0], fit.parameters[1], *(fit.metrics[name] for name in metrics)])
+		header = ['feature', 'target', 'theta0', 'theta1', *metrics]
+		with (output / 'summary.csv').open('w', newline='', encoding='utf-8') as f:
+			writer = csv.writer(f)
+			writer.writerow(header)
+			writer.writerows(rows)
+		print(f'Fitted {len(fits)} pairs over {fits[0].statistics.count} samples:')
+		print('  ' + ' '.join(f'{name:>14}' for name in header))
+		for row in sorted(rows, key=lambda row: row[-1], reverse=True):
+			print('  ' + ' '.join(f'{value:>14}' if isinstance(value, str) else f'{value:>14.6f}' for value in row))
+		print(f'Models saved: {output}')
+		print(f'Summary saved: {output / "summary.csv"}')
+
+	def _serve(self, args: argparse.Namespace):
+		import asyncio
+		from srcs import PredictionServer
+		server = PredictionServer(args.model, args.max_batch_size, args.max_delay_ms / 1000.0, args.reload_interval)
+		print(f'Serving {len(args.model)} model(s) on http://{args.host}:{args.port}')
+		try:
+			asyncio.run(server.serve_forever(args.host, args.port))
+		except KeyboardInterrupt:
+			print()
+
+	def _cross_validate(self, args: argparse.Namespace):
+		from srcs import CrossValidator
+		dataset = self._load_dataset(Path(args.dataset), args.feature, args.target, not args.no_cache)
+		result = CrossValidator(args.folds, args.repeats, args.seed, args.workers).validate(dataset)
+		def fmt(v: float) -> str:
+			return f"{v:.6f}"
+		print(f'Cross-validation ({args.folds} folds x {args.repeats} repeats, {dataset.size} samples):')
+		for fold in result.folds:
+			print(f"  repeat {fold.repeat} fold {fold.fold}: θ=({fmt(fold.parameters[0])}, {fmt(fold.parameters[1])}) RMSE={fmt(fold.metrics['RMSE'])} R2={fmt(fold.metrics['R2'])}")
+		print('  Mean ± std:')
+		for metric, (mean, std) in result.summary().items():
+			print(f"    {metric:<16}: {fmt(mean)} ± {fmt(std)}")
+
+	def _sweep(self, args: argparse.Namespace):
+		from srcs import HyperparameterSweep
+		dataset_path = Path(args.dataset)
+		dataset = self._load_dataset(dataset_path, args.feature, args.target, not args.no_cache)
+		sweep = HyperparameterSweep(args.learning_rates, args.epochs, args.solvers, args.batch_sizes or [None], args.metric, args.workers, args.seed)
+		results = sweep.run(dataset)
+		print(f'{"rank":>4}  {"solver":<6}  {"learning rate":>13}  {"epochs":>6}  {"batch":>6}  {args.metric:>16}')
+		for rank, result in enumerate(results[:args.top], start=1):
+			configuration = result.configuration
+			rate = '-' if configuration.learning_rate is None else f'{configuration.learning_rate:g}'
+			epochs = '-' if configuration.epochs is None else str(configuration.epochs)
+			batch = 'full' if configuration.batch_size is None else str(configuration.batch_size)
+			print(f'{rank:>4}  {configuration.solver:<6}  {rate:>13}  {epochs:>6}  {batch:>6}  {result.metrics[args.metric]:>16.6f}')
+		best = sweep.best(results)
+		output = Path(args.output) if args.output else Path('models') / (dataset_path.stem + '.json')
+		ModelConfiguration(best.parameters, dataset.feature_name, dataset.target_name).save(output)
+		print(f'Best model saved: {output}')
+
+	def _schedule(self, args: argparse.Namespace):
+		from srcs import CosineAnnealing, ExponentialDecay, LearningRateSchedule, StepDecay
+		if args.decay_rate is not None and args.schedule not in ('step', 'exponential'):
+			raise ValueError(f'--decay-rate only applies to the step and exponential schedules, not {args.schedule}')
+		if args.decay_steps is not None and args.schedule != 'step':
+			raise ValueError(f'--decay-steps only applies to the step schedule, not {args.schedule}')
+		if args.schedule == 'step':
+			return StepDecay(100 if args.decay_steps is None else args.decay_steps, 0.5 if args.decay_rate is None else args.decay_rate)
+		if args.schedule == 'exponential':
+			return ExponentialDecay(0.99 if args.decay_rate is None else args.decay_rate)
+		if args.schedule == 'cosine':
+			return CosineAnnealing()
+		return LearningRateSchedule()
+
 	def _train(self, args: argparse.Namespace):
+		from srcs import Checkpointer, ChromeTraceWriter, ClosedFormTrainer, DatasetStream, GradientDescentTrainer, JsonlTraceWriter, ModelEvaluator, RegressionVisualizer
+		from srcs.optimizers import OPTIMIZERS
 		dataset_path = Path(args.dataset)
 		epochs = int(args.epochs) if args.epochs is not None else DEFAULT_EPOCHS
 		learning_rate = float(args.learning_rate) if args.learning_rate is not None else DEFAULT_LEARNING_RATE
-		dataset = Dataset.from_csv(dataset_path, args.feature, args.target)
+		streaming = args.chunk_size is not None
+		checkpointing = args.resume or args.checkpoint is not None or args.checkpoint_every is not None or args.checkpoint_interval is not None
+		if args.density_threshold < 0:
+			raise ValueError('Density threshold must not be negative')
+		if args.solver == 'exact' and checkpointing:
+			raise ValueError('--checkpoint, --checkpoint-every, --checkpoint-interval and --resume only apply to --solver gd')
+		if args.solver == 'exact' and args.trace is not None:
+			raise ValueError('--trace only applies to --solver gd; the exact solver has no epochs to record')
+		if args.shuffle and args.batch_size is None:
+			raise ValueError('--shuffle needs --batch-size: full-batch gradients do not depend on the row order')
+		if streaming and args.solver == 'gd' and args.optimizer == 'line-search' and args.batch_size is None:
+			# Every backtracking trial evaluates the loss over the whole dataset, which would re-read the file
+			raise ValueError('--optimizer line-search with --chunk-size needs --batch-size')
+		if streaming and (args.plot or args.save_plot is not None):
+			raise ValueError('Plotting requires an in-memory dataset (omit --chunk-size)')
+		# Built up front so invalid --decay-* flags fail before the dataset is read
+		schedule = self._schedule(args)
+		if streaming:
+			dataset = DatasetStream(dataset_path, args.feature, args.target, args.chunk_size)
+		else:
+			dataset = self._load_dataset(dataset_path, args.feature, args.target, not args.no_cache, args.workers)
 		output = Path(args.output) if args.output else None
-
-		trainer = GradientDescentTrainer(LinearRegressionModel(), learning_rate)
-		parameters = trainer.train(dataset, epochs)
 		if output is None:
 			model_dir = Path('models')
 			model_dir.mkdir(parents=True, exist_ok=True)
 			output = model_dir / (dataset_path.stem + '.json')
-		ModelConfiguration(parameters, dataset.feature_name, dataset.target_name).save(output)
+		trace_paths: list[Path] = []
+		callbacks = []
+		if args.trace is not None:
+			prefix = Path(args.trace) if args.trace else output.with_suffix('')
+			trace_paths = [prefix.with_name(prefix.name + '.jsonl'), prefix.with_name(prefix.name + '.trace.json')]
+			callbacks = [JsonlTraceWriter(trace_paths[0], args.trace_every, 0.01), ChromeTraceWriter(trace_paths[1], args.trace_every, 0.01)]
+
+		checkpointer = None
+		if checkpointing:
+			checkpoint_path = Path(args.checkpoint) if args.checkpoint else output.with_suffix('.checkpoint.json')
+			checkpointer = Checkpointer(checkpoint_path, args.checkpoint_every, args.checkpoint_interval)
+
+		statistics = None
+		if args.solver == 'exact':
+			trainer = ClosedFormTrainer(LinearRegressionModel())
+			parameters = trainer.train_chunks(dataset) if streaming else trainer.train(dataset)
+			statistics = trainer.statistics
+		else:
+			trainer = GradientDescentTrainer(LinearRegressionModel(), learning_rate, args.batch_size, args.shuffle, args.seed, args.tolerance, args.stop_on, args.patience, callbacks=callbacks, optimizer=OPTIMIZERS[args.optimizer](), schedule=schedule, target_loss=args.target_loss, checkpointer=checkpointer)
+			if checkpointer is not None and args.resume and checkpointer.path.exists():
+				print(f'Resuming from checkpoint: {checkpointer.path}')
+			parameters = trainer.train_chunks(dataset, epochs, args.resume) if streaming else trainer.train(dataset, epochs, args.resume)
+			print(f'Training ran {trainer.epochs_run}/{epochs} epochs (final loss: {trainer.final_loss:.6f})')
+			if trace_paths:
+				print(f'Training trace saved: {trace_paths[0]}, {trace_paths[1]}')
+		ModelConfiguration(parameters, dataset.feature_name, dataset.target_name, statistics).save(output)
 		print(f'Model saved: {output}')
 
 		if args.statistics:
-			metrics = ModelEvaluator().evaluate(dataset, parameters)
+			evaluator = ModelEvaluator()
+			metrics = evaluator.evaluate_chunks(dataset, parameters) if streaming else evaluator.evaluate(dataset, parameters)
 			def fmt(v: float) -> str:
 				return f"{v:.6f}"
 			print('Training statistics:')
@@ -80,7 +384,7 @@ class CommandLineApplication:
 			print(f"    MAE             : {fmt(metrics['MAE'])}")
 			print(f"    R2              : {fmt(metrics['R2'])}")
 
-		visualizer = RegressionVisualizer()
+		visualizer = RegressionVisualizer(args.density_threshold or None)
 		save_plot_arg = args.save_plot
 		if save_plot_arg is not None:
 			if save_plot_arg == '':
@@ -95,7 +399,10 @@ class CommandLineApplication:
 		parser = self.build_parser()
 		args = parser.parse_args(argv)
 		try:
-			self._predict(args) if args.command == 'predict' else self._train(args)
+			handlers = {'convert': self._convert, 'cross-validate': self._cross_validate, 'evaluate': self._evaluate, 'predict': self._predict, 'serve': self._serve, 'sweep': self._sweep, 'train': self._train, 'train-all': self._train_all, 'update': self._update}
+			if hasattr(args, 'backend'):
+				set_backend(args.backend)
+			handlers[args.command](args)
 		except Exception as e:
 			print(f'Error: {e}')
 			return 1
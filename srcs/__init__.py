@@ -1,8 +1,86 @@
-from .vector import Vector
-from .feature_scaler import FeatureScaler
-from .dataset import Dataset
-from .model_configuration import ModelConfiguration
-from .linear_regression_model import LinearRegressionModel
-from .gradient_descent_trainer import GradientDescentTrainer
-from .regression_visualizer import RegressionVisualizer
-from .model_evaluator import ModelEvaluator
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+	from .vector import Vector
+	from .backends import NumpyBackend, PythonBackend, get_backend, set_backend
+	from .sufficient_statistics import SufficientStatistics
+	from .running_moments import RunningMoments
+	from .feature_scaler import FeatureScaler
+	from .dataset import Dataset
+	from .dataset_stream import DatasetStream
+	from .parallel_csv_loader import ParallelCsvLoader
+	from .dataset_cache import DatasetCache
+	from .model_configuration import ModelConfiguration
+	from .linear_regression_model import LinearRegressionModel
+	from .batch_predictor import BatchPredictor
+	from .prediction_server import PredictionServer
+	from .training_callbacks import ChromeTraceWriter, JsonlTraceWriter, TrainingCallback
+	from .optimizers import Adam, GradientDescent, LineSearch, Momentum, Nesterov, Optimizer
+	from .learning_rate_schedules import CosineAnnealing, ExponentialDecay, LearningRateSchedule, StepDecay
+	from .training_checkpoint import Checkpointer, TrainingCheckpoint
+	from .gradient_descent_trainer import GradientDescentTrainer
+	from .closed_form_trainer import ClosedFormTrainer
+	from .co_moment_matrix import CoMomentMatrix
+	from .pairwise_trainer import PairwiseFit, PairwiseTrainer
+	from .regression_visualizer import RegressionVisualizer
+	from .model_evaluator import EvaluationAccumulator, ModelEvaluator
+	from .hyperparameter_sweep import HyperparameterSweep
+	from .cross_validator import CrossValidator
+
+_EXPORTS = {
+	'Vector': 'vector',
+	'NumpyBackend': 'backends',
+	'PythonBackend': 'backends',
+	'get_backend': 'backends',
+	'set_backend': 'backends',
+	'SufficientStatistics': 'sufficient_statistics',
+	'RunningMoments': 'running_moments',
+	'FeatureScaler': 'feature_scaler',
+	'Dataset': 'dataset',
+	'DatasetStream': 'dataset_stream',
+	'ParallelCsvLoader': 'parallel_csv_loader',
+	'DatasetCache': 'dataset_cache',
+	'ModelConfiguration': 'model_configuration',
+	'LinearRegressionModel': 'linear_regression_model',
+	'BatchPredictor': 'batch_predictor',
+	'PredictionServer': 'prediction_server',
+	'ChromeTraceWriter': 'training_callbacks',
+	'JsonlTraceWriter': 'training_callbacks',
+	'TrainingCallback': 'training_callbacks',
+	'Optimizer': 'optimizers',
+	'GradientDescent': 'optimizers',
+	'Momentum': 'optimizers',
+	'Nesterov': 'optimizers',
+	'Adam': 'optimizers',
+	'LineSearch': 'optimizers',
+	'LearningRateSchedule': 'learning_rate_schedules',
+	'StepDecay': 'learning_rate_schedules',
+	'ExponentialDecay': 'learning_rate_schedules',
+	'CosineAnnealing': 'learning_rate_schedules',
+	'Checkpointer': 'training_checkpoint',
+	'TrainingCheckpoint': 'training_checkpoint',
+	'GradientDescentTrainer': 'gradient_descent_trainer',
+	'ClosedFormTrainer': 'closed_form_trainer',
+	'CoMomentMatrix': 'co_moment_matrix',
+	'PairwiseFit': 'pairwise_trainer',
+	'PairwiseTrainer': 'pairwise_trainer',
+	'RegressionVisualizer': 'regression_visualizer',
+	'EvaluationAccumulator': 'model_evaluator',
+	'ModelEvaluator': 'model_evaluator',
+	'HyperparameterSweep': 'hyperparameter_sweep',
+	'CrossValidator': 'cross_validator',
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name: str):
+	module = _EXPORTS.get(name)
+	if module is None:
+		raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+	value = getattr(import_module(f'.{module}', __name__), name)
+	globals()[name] = value
+	return value
+
+def __dir__() -> list[str]:
+	return sorted(set(globals()) | set(__all__))
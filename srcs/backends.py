@@ -0,0 +1,184 @@
+from collections.abc import Iterable, Sequence
+from importlib.util import find_spec
+from . import Vector
+from .moments import combine, combine_co_moments, combine_means
+
+BACKENDS = ('python', 'numpy')
+DEFAULT_BLOCK_SIZE = 1 << 18
+
+MomentsState = tuple[int, float, float]
+CoMomentsState = tuple[int, float, float, float, float, float]
+ResidualState = tuple[int, float, float, float, float]
+CoMomentMatrixState = tuple[int, list[float], list[float]]
+
+class PythonBackend:
+	name = 'python'
+
+	def epoch_sums(self, features: Vector, targets: Vector, theta0: float, theta1: float, mean: float, std: float) -> tuple[float, float, float]:
+		error_sum, weighted_error_sum, squared_error_sum = 0.0, 0.0, 0.0
+		for x, y in zip(features, targets):
+			scaled = (x - mean) / std
+			error = theta0 + theta1 * scaled - y
+			error_sum += error
+			weighted_error_sum += error * scaled
+			squared_error_sum += error * error
+		return error_sum, weighted_error_sum, squared_error_sum
+
+	def update_moments(self, state: MomentsState, values: Iterable[float]) -> MomentsState:
+		n, mean, m2 = state
+		# Welford's online update: one pass, no centered copy of the column
+		for value in values:
+			n += 1
+			delta = value - mean
+			mean += delta / n
+			m2 += delta * (value - mean)
+		return n, mean, m2
+
+	def update_co_moments(self, state: CoMomentsState, features: Vector, targets: Vector) -> CoMomentsState:
+		n, mean_x, mean_y, m2_x, m2_y, c_xy = state
+		# Welford's online update of means and centered co-moments
+		for x, y in zip(features, targets):
+			n += 1
+			dx = x - mean_x
+			mean_x += dx / n
+			dy = y - mean_y
+			mean_y += dy / n
+			ry = y - mean_y
+			m2_x += dx * (x - mean_x)
+			m2_y += dy * ry
+			c_xy += dx * ry
+		return n, mean_x, mean_y, m2_x, m2_y, c_xy
+
+	def update_co_moment_matrix(self, state: CoMomentMatrixState, columns: Sequence[Vector]) -> CoMomentMatrixState:
+		n, means, comoments = state
+		means, comoments = list(means), list(comoments)
+		size = len(means)
+		pairs = [(i, j, i * size + j) for i in range(size) for j in range(i, size)]
+		# Multivariate Welford update of the upper triangle, mirrored once at the end
+		for row in zip(*columns):
+			n += 1
+			deltas = [value - mean for value, mean in zip(row, means)]
+			means = [mean + delta / n for mean, delta in zip(means, deltas)]
+			residuals = [value - mean for value, mean in zip(row, means)]
+			for i, j, index in pairs:
+				comoments[index] += deltas[i] * residuals[j]
+		for i, j, index in pairs:
+			comoments[j * size + i] = comoments[index]
+		return n, means, comoments
+
+	def update_residuals(self, state: ResidualState, features: Vector, targets: Vector, intercept: float, slope: float) -> ResidualState:
+		n, sse, sae, mean_y, m2_y = state
+		# One fused pass: residual sums plus Welford's update of the target moments
+		for x, y in zip(features, targets):
+			residual = y - intercept - slope * x
+			sse += residual * residual
+			sae += abs(residual)
+			n += 1
+			delta = y - mean_y
+			mean_y += delta / n
+			m2_y += delta * (y - mean_y)
+		return n, sse, sae, mean_y, m2_y
+
+	def affine(self, values: Vector, scale: float, offset: float) -> Vector:
+		return values.affine(scale, offset)
+
+class NumpyBackend(PythonBackend):
+	name = 'numpy'
+
+	def __init__(self, block_size: int = DEFAULT_BLOCK_SIZE) -> None:
+		if block_size <= 0:
+			raise ValueError('Block size must be positive')
+		import numpy
+		self._np = numpy
+		self._block_size = block_size
+
+	def _blocks(self, *vectors: Vector, block_size: int | None = None):
+		# Views share memory with the Vectors; fixed-size blocks bound the temporaries
+		block_size = block_size or self._block_size
+		arrays = [self._np.frombuffer(vector.buffer(), dtype=self._np.float64) for vector in vectors]
+		size = len(arrays[0])
+		for start in range(0, size, block_size):
+			yield [array[start:start + block_size] for array in arrays]
+
+	def epoch_sums(self, features: Vector, targets: Vector, theta0: float, theta1: float, mean: float, std: float) -> tuple[float, float, float]:
+		error_sum, weighted_error_sum, squared_error_sum = 0.0, 0.0, 0.0
+		for x, y in self._blocks(features, targets):
+			scaled = (x - mean) / std
+			error = theta0 + theta1 * scaled - y
+			error_sum += float(error.sum())
+			weighted_error_sum += float(error @ scaled)
+			squared_error_sum += float(error @ error)
+		return error_sum, weighted_error_sum, squared_error_sum
+
+	def update_moments(self, state: MomentsState, values: Iterable[float]) -> MomentsState:
+		if not isinstance(values, Vector):
+			return super().update_moments(state, values)
+		n, mean, m2 = state
+		for (block,) in self._blocks(values):
+			block_mean = float(block.mean())
+			centered = block - block_mean
+			n, mean, m2 = combine(n, mean, m2, len(block), block_mean, float(centered @ centered))
+		return n, mean, m2
+
+	def update_co_moments(self, state: CoMomentsState, features: Vector, targets: Vector) -> CoMomentsState:
+		n, mean_x, mean_y, m2_x, m2_y, c_xy = state
+		for x, y in self._blocks(features, targets):
+			block_mean_x, block_mean_y = float(x.mean()), float(y.mean())
+			dx_block, dy_block = x - block_mean_x, y - block_mean_y
+			n_b = len(x)
+			c_xy = combine_co_moments(n, block_mean_x - mean_x, block_mean_y - mean_y, c_xy, n_b, float(dx_block @ dy_block))
+			_, mean_x, m2_x = combine(n, mean_x, m2_x, n_b, block_mean_x, float(dx_block @ dx_block))
+			n, mean_y, m2_y = combine(n, mean_y, m2_y, n_b, block_mean_y, float(dy_block @ dy_block))
+		return n, mean_x, mean_y, m2_x, m2_y, c_xy
+
+	def update_co_moment_matrix(self, state: CoMomentMatrixState, columns: Sequence[Vector]) -> CoMomentMatrixState:
+		n, means, comoments = state
+		size = len(means)
+		mean = self._np.array(means, dtype=self._np.float64)
+		matrix = self._np.array(comoments, dtype=self._np.float64).reshape(size, size)
+		# Each block is copied into a rows x columns matrix, so keep its total size at block_size values
+		for block in self._blocks(*columns, block_size=max(1, self._block_size // max(size, 1))):
+			values = self._np.column_stack(block)
+			block_mean = values.mean(axis=0)
+			centered = values - block_mean
+			n_b = len(values)
+			delta = block_mean - mean
+			# Broadcasting the mean deltas combines every matrix entry at once
+			matrix = combine_co_moments(n, delta[:, None], delta[None, :], matrix, n_b, centered.T @ centered)
+			mean = combine_means(n, mean, n_b, block_mean)
+			n += n_b
+		return n, mean.tolist(), matrix.ravel().tolist()
+
+	def update_residuals(self, state: ResidualState, features: Vector, targets: Vector, intercept: float, slope: float) -> ResidualState:
+		n, sse, sae, mean_y, m2_y = state
+		for x, y in self._blocks(features, targets):
+			residual = y - (intercept + slope * x)
+			sse += float(residual @ residual)
+			sae += float(self._np.abs(residual).sum())
+			block_mean = float(y.mean())
+			centered = y - block_mean
+			n, mean_y, m2_y = combine(n, mean_y, m2_y, len(y), block_mean, float(centered @ centered))
+		return n, sse, sae, mean_y, m2_y
+
+	def affine(self, values: Vector, scale: float, offset: float) -> Vector:
+		if len(values) == 0:
+			return Vector()
+		array = self._np.frombuffer(values.buffer(), dtype=self._np.float64)
+		return Vector.from_buffer(offset + scale * array)
+
+_backend: PythonBackend = PythonBackend()
+
+def available_backends() -> tuple[str, ...]:
+	return tuple(name for name in BACKENDS if name == 'python' or find_spec(name) is not None)
+
+def get_backend() -> PythonBackend:
+	return _backend
+
+def set_backend(name: str) -> PythonBackend:
+	global _backend
+	if name not in BACKENDS:
+		raise ValueError(f'Backend must be one of: {", ".join(BACKENDS)}')
+	if name == 'numpy' and find_spec('numpy') is None:
+		raise ValueError('The numpy backend requires NumPy to be installed')
+	_backend = NumpyBackend() if name == 'numpy' else PythonBackend()
+	return _backend
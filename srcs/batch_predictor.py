@@ -0,0 +1,52 @@
+import csv
+from array import array
+from collections.abc import Iterable, Iterator
+from typing import TextIO
+from . import LinearRegressionModel, Vector
+from .dataset import DEFAULT_CHUNK_SIZE
+
+class BatchPredictor:
+	def __init__(self, model: LinearRegressionModel, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+		if chunk_size <= 0:
+			raise ValueError('Chunk size must be positive')
+		self._model = model
+		self._chunk_size = chunk_size
+
+	def _chunks(self, rows: Iterable[tuple[int, list[str]]], index: int) -> Iterator[tuple[list[str], array]]:
+		chunk: list[str] = []
+		values = array('d')
+		for line, row in rows:
+			if not row:
+				# Blank lines hold no record, as with csv.DictReader
+				continue
+			if index >= len(row):
+				raise ValueError(f'Row {line}: missing value for the selected column')
+			try:
+				values.append(float(row[index]))
+			except ValueError:
+				raise ValueError(f'Row {line}: invalid number {row[index]!r}') from None
+			chunk.append(row[index])
+			if len(chunk) == self._chunk_size:
+				yield chunk, values
+				chunk, values = [], array('d')
+		if chunk:
+			yield chunk, values
+
+	def predict_csv(self, source: TextIO, sink: TextIO, column: str | None = None, output_name: str = 'prediction') -> int:
+		reader = csv.reader(source)
+		header = next(reader, None)
+		if not header:
+			raise ValueError('Input must contain a header row')
+		column = header[0] if column is None else column
+		if column not in header:
+			raise ValueError(f'Column {column!r} does not exist in input')
+		index = header.index(column)
+		writer = csv.writer(sink, lineterminator='\n')
+		writer.writerow([column, output_name])
+		count = 0
+		# line_num is the last physical line read, so quoted multi-line records report where they end
+		for raw_values, values in self._chunks(((reader.line_num, row) for row in reader), index):
+			predictions = self._model.predict_vector(Vector._wrap(values))
+			writer.writerows(zip(raw_values, predictions))
+			count += len(raw_values)
+		return count
@@ -0,0 +1,24 @@
+from collections.abc import Iterable
+from . import Dataset, LinearRegressionModel, SufficientStatistics, Vector
+
+class ClosedFormTrainer:
+	def __init__(self, model: LinearRegressionModel) -> None:
+		self._model = model
+		self._statistics = SufficientStatistics()
+
+	@property
+	def statistics(self) -> SufficientStatistics:
+		return self._statistics
+
+	def train(self, dataset: Dataset, statistics: SufficientStatistics | None = None) -> Vector:
+		return self.train_chunks((dataset,), statistics)
+
+	def train_chunks(self, chunks: Iterable[Dataset], statistics: SufficientStatistics | None = None) -> Vector:
+		# Continuing Welford's recurrence from stored statistics replays the full history exactly
+		statistics = statistics.copy() if statistics is not None else SufficientStatistics()
+		for chunk in chunks:
+			statistics.update_vectors(chunk.features, chunk.targets)
+		parameters = statistics.fit()
+		self._statistics = statistics
+		self._model.update(parameters)
+		return parameters
@@ -0,0 +1,71 @@
+from collections.abc import Sequence
+from . import SufficientStatistics, Vector
+from .backends import get_backend
+from .moments import combine_co_moments, combine_means
+
+class CoMomentMatrix:
+	def __init__(self, columns: Sequence[str], count: int = 0, means: Sequence[float] | None = None, comoments: Sequence[float] | None = None) -> None:
+		if len(set(columns)) != len(columns):
+			raise ValueError('Column names must be unique')
+		if count < 0:
+			raise ValueError('Count must not be negative')
+		size = len(columns)
+		self._columns = list(columns)
+		self._count = int(count)
+		self._means = [float(mean) for mean in means] if means is not None else [0.0] * size
+		self._comoments = [float(value) for value in comoments] if comoments is not None else [0.0] * (size * size)
+		if len(self._means) != size or len(self._comoments) != size * size:
+			raise ValueError('Means and co-moments must match the number of columns')
+		self._index = {name: index for index, name in enumerate(self._columns)}
+
+	@property
+	def columns(self) -> list[str]:
+		return list(self._columns)
+
+	@property
+	def count(self) -> int:
+		return self._count
+
+	def _position(self, column: str) -> int:
+		if column not in self._index:
+			raise ValueError(f'Unknown column: {column}')
+		return self._index[column]
+
+	def mean(self, column: str) -> float:
+		return self._means[self._position(column)]
+
+	def comoment(self, a: str, b: str) -> float:
+		return self._comoments[self._position(a) * len(self._columns) + self._position(b)]
+
+	def update_columns(self, columns: Sequence[Vector]) -> 'CoMomentMatrix':
+		if len(columns) != len(self._columns):
+			raise ValueError('Expected one vector per column')
+		if any(len(column) != len(columns[0]) for column in columns):
+			raise ValueError('Columns must have the same number of samples')
+		self._count, self._means, self._comoments = get_backend().update_co_moment_matrix((self._count, self._means, self._comoments), columns)
+		return self
+
+	def merge(self, other: 'CoMomentMatrix') -> 'CoMomentMatrix':
+		if other._columns != self._columns:
+			raise ValueError('Cannot merge co-moments over different columns')
+		if other._count == 0:
+			return self
+		if self._count == 0:
+			self._count, self._means, self._comoments = other._count, list(other._means), list(other._comoments)
+			return self
+		n_a, n_b = self._count, other._count
+		size = len(self._columns)
+		deltas = [b - a for a, b in zip(self._means, other._means)]
+		self._comoments = [
+			combine_co_moments(n_a, deltas[index // size], deltas[index % size], c_a, n_b, c_b)
+			for index, (c_a, c_b) in enumerate(zip(self._comoments, other._comoments))
+		]
+		self._means = [combine_means(n_a, a, n_b, b) for a, b in zip(self._means, other._means)]
+		self._count = n_a + n_b
+		return self
+
+	def copy(self) -> 'CoMomentMatrix':
+		return CoMomentMatrix(self._columns, self._count, self._means, self._comoments)
+
+	def statistics(self, feature: str, target: str) -> SufficientStatistics:
+		return SufficientStatistics(self._count, self.mean(feature), self.mean(target), self.comoment(feature, feature), self.comoment(target, target), self.comoment(feature, target))
@@ -0,0 +1,109 @@
+import io
+import queue
+import threading
+from pathlib import Path
+from typing import BinaryIO, TextIO
+
+DEFAULT_READ_SIZE = 1 << 20
+DEFAULT_PREFETCH = 4
+COMPRESSION_MAGIC = {'gzip': b'\x1f\x8b', 'bz2': b'BZh', 'lzma': b'\xfd7zXZ\x00'}
+
+def detect_compression(path: Path | str) -> str | None:
+	with Path(path).open('rb') as f:
+		head = f.read(6)
+	return next((name for name, magic in COMPRESSION_MAGIC.items() if head.startswith(magic)), None)
+
+def _open_decompressor(path: Path | str, compression: str) -> BinaryIO:
+	if compression == 'gzip':
+		import gzip
+		return gzip.open(path, 'rb')
+	if compression == 'bz2':
+		import bz2
+		return bz2.open(path, 'rb')
+	if compression == 'lzma':
+		import lzma
+		return lzma.open(path, 'rb')
+	raise ValueError(f'Unsupported compression: {compression}')
+
+class BackgroundDecompressor(io.RawIOBase):
+	def __init__(self, path: Path | str, compression: str, read_size: int = DEFAULT_READ_SIZE, prefetch: int = DEFAULT_PREFETCH) -> None:
+		if read_size <= 0:
+			raise ValueError('Read size must be positive')
+		if prefetch < 0:
+			raise ValueError('Prefetch must not be negative')
+		super().__init__()
+		self._source = _open_decompressor(path, compression)
+		self._read_size = read_size
+		self._pending = memoryview(b'')
+		self._eof = False
+		self._thread: threading.Thread | None = None
+		if prefetch > 0:
+			# zlib, bz2 and lzma release the GIL, so decoding overlaps with parsing
+			self._queue: queue.Queue = queue.Queue(maxsize=prefetch)
+			self._stopped = threading.Event()
+			self._thread = threading.Thread(target=self._produce, name='decompressor', daemon=True)
+			self._thread.start()
+
+	def _put(self, item: bytes | BaseException) -> bool:
+		while not self._stopped.is_set():
+			try:
+				self._queue.put(item, timeout=0.1)
+				return True
+			except queue.Full:
+				continue
+		return False
+
+	def _produce(self) -> None:
+		try:
+			while True:
+				block = self._source.read(self._read_size)
+				if not self._put(block) or not block:
+					return
+		except BaseException as e:
+			self._put(e)
+
+	def _next_block(self) -> bytes:
+		if self._thread is None:
+			return self._source.read(self._read_size)
+		item = self._queue.get()
+		if isinstance(item, BaseException):
+			self._eof = True
+			raise item
+		return item
+
+	def readable(self) -> bool:
+		return True
+
+	def readinto(self, buffer) -> int:
+		if not self._pending and not self._eof:
+			block = self._next_block()
+			self._eof = not block
+			self._pending = memoryview(block)
+		size = min(len(buffer), len(self._pending))
+		buffer[:size] = self._pending[:size]
+		self._pending = self._pending[size:]
+		return size
+
+	def close(self) -> None:
+		if self.closed:
+			return
+		if self._thread is not None:
+			self._stopped.set()
+			self._thread.join()
+		self._source.close()
+		super().close()
+
+def _open_compressed(path: Path | str, compression: str, read_size: int, prefetch: int) -> io.BufferedReader:
+	return io.BufferedReader(BackgroundDecompressor(path, compression, read_size, prefetch), buffer_size=read_size)
+
+def open_binary(path: Path | str, read_size: int = DEFAULT_READ_SIZE, prefetch: int = DEFAULT_PREFETCH) -> BinaryIO:
+	compression = detect_compression(path)
+	if compression is None:
+		return Path(path).open('rb')
+	return _open_compressed(path, compression, read_size, prefetch)
+
+def open_text(path: Path | str, read_size: int = DEFAULT_READ_SIZE, prefetch: int = DEFAULT_PREFETCH) -> TextIO:
+	compression = detect_compression(path)
+	if compression is None:
+		return Path(path).open(newline='', buffering=read_size)
+	return io.TextIOWrapper(_open_compressed(path, compression, read_size, prefetch), newline='')
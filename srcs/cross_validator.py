@@ -0,0 +1,98 @@
+import math
+import random
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass
+from . import Dataset, SufficientStatistics, Vector
+from .backends import get_backend, set_backend
+from .model_evaluator import EvaluationAccumulator
+from .options import METRICS
+
+@dataclass
+class FoldResult:
+	repeat: int
+	fold: int
+	train_size: int
+	test_size: int
+	parameters: Vector
+	metrics: dict[str, float]
+
+@dataclass
+class CrossValidationResult:
+	folds: list[FoldResult]
+
+	def mean(self, metric: str) -> float:
+		return sum(fold.metrics[metric] for fold in self.folds) / len(self.folds)
+
+	def std(self, metric: str) -> float:
+		mean = self.mean(metric)
+		return math.sqrt(sum((fold.metrics[metric] - mean) ** 2 for fold in self.folds) / len(self.folds))
+
+	def summary(self) -> dict[str, tuple[float, float]]:
+		return {metric: (self.mean(metric), self.std(metric)) for metric in METRICS}
+
+def _fold_statistics(features: Vector, targets: Vector) -> SufficientStatistics:
+	return SufficientStatistics.from_vectors(features, targets)
+
+def _absolute_error_sum(features: Vector, targets: Vector, intercept: float, slope: float) -> float:
+	return EvaluationAccumulator().update_vectors(features, targets, intercept, slope).sae
+
+class CrossValidator:
+	def __init__(self, folds: int = 5, repeats: int = 1, seed: int | None = None, workers: int = 1) -> None:
+		if folds < 2:
+			raise ValueError('Cross-validation needs at least two folds')
+		if repeats <= 0:
+			raise ValueError('Repeats must be positive')
+		if workers <= 0:
+			raise ValueError('Workers must be positive')
+		self._folds = folds
+		self._repeats = repeats
+		self._seed = seed
+		self._workers = workers
+
+	def splits(self, size: int) -> list[list[list[int]]]:
+		if size < self._folds:
+			raise ValueError('Dataset must contain at least one sample per fold')
+		rng = random.Random(self._seed)
+		repeats = []
+		for _ in range(self._repeats):
+			order = list(range(size))
+			rng.shuffle(order)
+			repeats.append([sorted(order[size * fold // self._folds:size * (fold + 1) // self._folds]) for fold in range(self._folds)])
+		return repeats
+
+	def _metrics(self, test: SufficientStatistics, parameters: Vector, absolute_error_sum: float) -> dict[str, float]:
+		n = test.count
+		sse = test.squared_error(parameters)
+		tss = test.m2_y
+		if tss == 0:
+			r2 = 1.0 if sse == 0 else 0.0
+		else:
+			r2 = 1.0 - (sse / tss)
+		return {'MSE': sse / n, 'RMSE': math.sqrt(sse / n), 'MAE': absolute_error_sum / n, 'R2': r2}
+
+	def _map(self, executor: ProcessPoolExecutor | None, func: Callable, *iterables: Iterable) -> list:
+		if executor is None:
+			return list(map(func, *iterables))
+		return list(executor.map(func, *iterables))
+
+	def validate(self, dataset: Dataset) -> CrossValidationResult:
+		splits = self.splits(dataset.size)
+		results: list[FoldResult] = []
+		# Spawned workers start on the default backend, so hand them the active one
+		with ProcessPoolExecutor(max_workers=self._workers, initializer=set_backend, initargs=(get_backend().name,)) if self._workers > 1 else nullcontext() as executor:
+			for repeat, folds in enumerate(splits):
+				features = [dataset.features.take(indices) for indices in folds]
+				targets = [dataset.targets.take(indices) for indices in folds]
+				# One pass collects each fold's partial statistics; training sets are total minus fold
+				partials = self._map(executor, _fold_statistics, features, targets)
+				total = SufficientStatistics()
+				for partial in partials:
+					total.merge(partial)
+				fits = [total.copy().subtract(partial).fit() for partial in partials]
+				absolute_errors = self._map(executor, _absolute_error_sum, features, targets, [fit[0] for fit in fits], [fit[1] for fit in fits])
+				for fold, (partial, fit, absolute_error_sum) in enumerate(zip(partials, fits, absolute_errors)):
+					metrics = self._metrics(partial, fit, absolute_error_sum)
+					results.append(FoldResult(repeat, fold, total.count - partial.count, partial.count, fit, metrics))
+		return CrossValidationResult(results)
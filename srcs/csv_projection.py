@@ -0,0 +1,41 @@
+import csv
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import chain
+from operator import itemgetter
+
+def column_index(header: Sequence[str], name: str) -> int:
+	# csv.DictReader keeps the last of duplicated column names
+	return len(header) - 1 - list(reversed(header)).index(name)
+
+def _getter(indices: Sequence[int]):
+	return itemgetter(*indices) if len(indices) > 1 else (lambda row: (row[indices[0]],))
+
+def project_columns(lines: Iterable[str], indices: Sequence[int], width: int | None = None) -> Iterator[tuple[str | None, ...]]:
+	first, last = min(indices), max(indices)
+	pick = _getter(indices)
+	# Columns near the end of a wide row are cheaper to split off from the right,
+	# which is exact whenever the row has as many fields as the header
+	right = width is not None and width - first < last + 1
+	if right:
+		assert width is not None
+		right_splits = width - first
+		pick_right = _getter([index - first + 1 for index in indices])
+	lines = iter(lines)
+	for line in lines:
+		if '"' in line or '\0' in line:
+			# Quoted fields may hold delimiters or line breaks: the csv module parses this record
+			row = next(csv.reader(chain((line,), lines)), [])
+		else:
+			line = line.rstrip('\r\n')
+			if not line:
+				continue
+			if right and line.count(',') == width - 1:
+				yield pick_right(line.rsplit(',', right_splits))
+				continue
+			# Stop splitting past the last selected column
+			row = line.split(',', last + 1)
+		if len(row) > last:
+			yield pick(row)
+		elif row:
+			# Short rows read missing fields as None, like csv.DictReader
+			yield tuple(row[index] if index < len(row) else None for index in indices)
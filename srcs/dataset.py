@@ -1,12 +1,34 @@
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator, Sequence
 import csv
+import mmap
+import os
+import struct
+import sys
+from array import array
 from pathlib import Path
 from . import Vector
+from .compression import DEFAULT_PREFETCH, open_text
+from .csv_projection import column_index, project_columns
+
+DEFAULT_CHUNK_SIZE = 65536
+BINARY_MAGIC = b'FTLRBIN1'
+BINARY_HEADER = struct.Struct('<8sQII')
 
 class Dataset:
 	def __init__(self, features: Iterable[float], targets: Iterable[float], feature_name: str, target_name: str) -> None:
-		self._features = Vector(features)
-		self._targets = Vector(targets)
+		# Copy, so later in-place changes (isub, imul, axpy) to the caller's vectors cannot leak in
+		self._set_columns(Vector(features), Vector(targets), feature_name, target_name)
+
+	@classmethod
+	def _from_columns(cls, features: Vector, targets: Vector, feature_name: str, target_name: str) -> 'Dataset':
+		# For loaders whose columns nothing else references, such as freshly parsed or memory-mapped ones
+		dataset = cls.__new__(cls)
+		dataset._set_columns(features, targets, feature_name, target_name)
+		return dataset
+
+	def _set_columns(self, features: Vector, targets: Vector, feature_name: str, target_name: str) -> None:
+		self._features = features
+		self._targets = targets
 		self._feature_name = feature_name
 		self._target_name = target_name
 		self._scaler = None
@@ -15,29 +37,98 @@ class Dataset:
 		if len(self._features) != len(self._targets):
 			raise ValueError('Features and targets must have the same number of samples')
 
+	@staticmethod
+	def _resolve_columns(fieldnames: Sequence[str] | None, feature: str | None, target: str | None) -> tuple[str, str]:
+		if fieldnames is None or len(fieldnames) < 2:
+			raise ValueError('Dataset must contain at least two columns')
+		if (feature is None) ^ (target is None):
+			raise ValueError('Both feature and target column names must be provided together')
+		if feature and target:
+			if feature not in fieldnames or target not in fieldnames:
+				raise ValueError('Provided feature/target column names must exist in CSV')
+			if feature == target:
+				raise ValueError('Feature and target column names must be different')
+			return feature, target
+		return fieldnames[0], fieldnames[1]
+
+	@classmethod
+	def from_csv(cls, path: Path | str, feature: str | None = None, target: str | None = None, prefetch: int = DEFAULT_PREFETCH) -> 'Dataset':
+		with open_text(path, prefetch=prefetch) as f:
+			header = next(csv.reader(f), None)
+			feature_name, target_name = cls._resolve_columns(header, feature, target)
+			assert header is not None
+			features, targets = array('d'), array('d')
+			for feature_value, target_value in project_columns(f, (column_index(header, feature_name), column_index(header, target_name)), len(header)):
+				features.append(float(feature_value))
+				targets.append(float(target_value))
+		return cls._from_columns(Vector._wrap(features), Vector._wrap(targets), feature_name, target_name)
+
+	@classmethod
+	def iter_csv(cls, path: Path | str, feature: str | None = None, target: str | None = None, chunk_size: int = DEFAULT_CHUNK_SIZE, prefetch: int = DEFAULT_PREFETCH) -> Iterator['Dataset']:
+		if chunk_size <= 0:
+			raise ValueError('Chunk size must be positive')
+		with open_text(path, prefetch=prefetch) as f:
+			header = next(csv.reader(f), None)
+			feature_name, target_name = cls._resolve_columns(header, feature, target)
+			assert header is not None
+			features, targets = array('d'), array('d')
+			for feature_value, target_value in project_columns(f, (column_index(header, feature_name), column_index(header, target_name)), len(header)):
+				features.append(float(feature_value))
+				targets.append(float(target_value))
+				if len(features) == chunk_size:
+					yield cls._from_columns(Vector._wrap(features), Vector._wrap(targets), feature_name, target_name)
+					features, targets = array('d'), array('d')
+			if features:
+				yield cls._from_columns(Vector._wrap(features), Vector._wrap(targets), feature_name, target_name)
+
+	@staticmethod
+	def _binary_data_offset(names_length: int) -> int:
+		offset = BINARY_HEADER.size + names_length
+		return offset + (-offset % 8)
+
+	@staticmethod
+	def _swapped(data: bytes | memoryview) -> array:
+		values = array('d')
+		values.frombytes(data)
+		values.byteswap()
+		return values
+
 	@classmethod
-	def from_csv(cls, path: Path | str, feature: str | None = None, target: str | None = None) -> 'Dataset':
-		with Path(path).open(newline='') as f:
-			reader = csv.DictReader(f)
-			if reader.fieldnames is None or len(reader.fieldnames) < 2:
-				raise ValueError('Dataset must contain at least two columns')
-			fieldnames = reader.fieldnames
-			if (feature is None) ^ (target is None):
-				raise ValueError('Both feature and target column names must be provided together')
-			if feature and target:
-				if feature not in fieldnames or target not in fieldnames:
-					raise ValueError('Provided feature/target column names must exist in CSV')
-				if feature == target:
-					raise ValueError('Feature and target column names must be different')
-				feature_name, target_name = feature, target
-			else:
-				feature_name, target_name = fieldnames[:2]
-			features: list[float] = []
-			targets: list[float] = []
-			for row in reader:
-				features.append(float(row[feature_name]))
-				targets.append(float(row[target_name]))
-		return cls(features, targets, feature_name, target_name)
+	def from_binary(cls, path: Path | str) -> 'Dataset':
+		with Path(path).open('rb') as f:
+			mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+		view = memoryview(mapping)
+		if len(view) < BINARY_HEADER.size:
+			raise ValueError('Invalid binary dataset: file is truncated')
+		magic, rows, feature_length, target_length = BINARY_HEADER.unpack_from(view)
+		if magic != BINARY_MAGIC:
+			raise ValueError('Invalid binary dataset: unknown file format')
+		names_end = BINARY_HEADER.size + feature_length
+		feature_name = bytes(view[BINARY_HEADER.size:names_end]).decode('utf-8')
+		target_name = bytes(view[names_end:names_end + target_length]).decode('utf-8')
+		offset = cls._binary_data_offset(feature_length + target_length)
+		column_size = 8 * rows
+		if len(view) != offset + 2 * column_size:
+			raise ValueError('Invalid binary dataset: file is truncated')
+		columns = [view[offset:offset + column_size], view[offset + column_size:offset + 2 * column_size]]
+		if sys.byteorder == 'big':
+			columns = [cls._swapped(column) for column in columns]
+		features, targets = (Vector.from_buffer(column) for column in columns)
+		return cls._from_columns(features, targets, feature_name, target_name)
+
+	def to_binary(self, path: Path | str) -> None:
+		p = Path(path)
+		p.parent.mkdir(parents=True, exist_ok=True)
+		feature_name, target_name = self._feature_name.encode('utf-8'), self._target_name.encode('utf-8')
+		header = BINARY_HEADER.pack(BINARY_MAGIC, self.size, len(feature_name), len(target_name)) + feature_name + target_name
+		header += bytes(self._binary_data_offset(len(feature_name) + len(target_name)) - len(header))
+		temporary = p.with_name(f'.{p.name}.{os.getpid()}.tmp')
+		with temporary.open('wb') as f:
+			f.write(header)
+			for column in (self._features, self._targets):
+				data = column.to_bytes()
+				f.write(self._swapped(data).tobytes() if sys.byteorder == 'big' else data)
+		os.replace(temporary, p)
 
 	@property
 	def size(self) -> int:
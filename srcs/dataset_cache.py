@@ -0,0 +1,52 @@
+import hashlib
+import os
+from pathlib import Path
+from . import Dataset, ParallelCsvLoader
+
+def default_cache_directory() -> Path:
+	base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+	return Path(base) / 'ft_linear_regression' / 'datasets'
+
+def _digest(*parts: str) -> str:
+	return hashlib.sha256('\0'.join(parts).encode('utf-8')).hexdigest()[:16]
+
+class DatasetCache:
+	def __init__(self, directory: Path | str | None = None) -> None:
+		self._directory = Path(directory) if directory is not None else default_cache_directory()
+
+	@property
+	def directory(self) -> Path:
+		return self._directory
+
+	def path_for(self, path: Path | str, feature: str | None = None, target: str | None = None) -> Path:
+		# One entry per source and columns; the version part changes whenever the file does
+		source = Path(path).resolve()
+		stat = source.stat()
+		entry = _digest(str(source), feature or '', target or '')
+		version = _digest(str(stat.st_size), str(stat.st_mtime_ns))
+		return self._directory / f'{source.stem}-{entry}-{version}.ftlr'
+
+	def _evict_stale(self, cached: Path) -> None:
+		entry = cached.stem.split('-')[-2]
+		for stale in self._directory.glob(f'*-{entry}-*.ftlr'):
+			if stale != cached:
+				stale.unlink(missing_ok=True)
+
+	def load(self, path: Path | str, feature: str | None = None, target: str | None = None, workers: int = 1) -> Dataset:
+		cached = self.path_for(path, feature, target)
+		if cached.exists():
+			try:
+				return Dataset.from_binary(cached)
+			except (OSError, ValueError):
+				pass
+		if workers > 1:
+			dataset = ParallelCsvLoader(workers).load(path, feature, target)
+		else:
+			dataset = Dataset.from_csv(path, feature, target)
+		try:
+			dataset.to_binary(cached)
+			self._evict_stale(cached)
+		except OSError:
+			# The cache only saves parsing time: an unwritable cache must never fail the load
+			pass
+		return dataset
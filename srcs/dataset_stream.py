@@ -0,0 +1,94 @@
+import csv
+import io
+import locale
+import random
+from array import array
+from collections.abc import Iterator
+from pathlib import Path
+from . import Dataset, Vector
+from .compression import detect_compression, open_text
+from .csv_projection import column_index, project_columns
+from .dataset import DEFAULT_CHUNK_SIZE
+
+class DatasetStream:
+	def __init__(self, path: Path | str, feature: str | None = None, target: str | None = None, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+		if chunk_size <= 0:
+			raise ValueError('Chunk size must be positive')
+		self._path = Path(path)
+		with open_text(self._path) as f:
+			header = next(csv.reader(f), None)
+		self._feature_name, self._target_name = Dataset._resolve_columns(header, feature, target)
+		assert header is not None
+		self._indices = (column_index(header, self._feature_name), column_index(header, self._target_name))
+		self._width = len(header)
+		self._chunk_size = int(chunk_size)
+		self._size: int | None = None
+		self._boundaries: list[int] | None = None
+
+	@property
+	def path(self) -> Path:
+		return self._path
+
+	@property
+	def feature_name(self) -> str:
+		return self._feature_name
+
+	@property
+	def target_name(self) -> str:
+		return self._target_name
+
+	@property
+	def chunk_size(self) -> int:
+		return self._chunk_size
+
+	@property
+	def size(self) -> int:
+		if self._size is None:
+			self._size = sum(chunk.size for chunk in self)
+		return self._size
+
+	def __iter__(self) -> Iterator[Dataset]:
+		return Dataset.iter_csv(self._path, self._feature_name, self._target_name, self._chunk_size)
+
+	def _index(self) -> list[int]:
+		# Byte offsets of every chunk, or nothing when chunks cannot be read out of order
+		if detect_compression(self._path) is not None:
+			return []
+		with self._path.open('rb') as f:
+			f.readline()
+			position, rows = f.tell(), 0
+			boundaries = [position]
+			for line in f:
+				if b'"' in line:
+					# A quoted field may span lines, so line offsets are not record offsets
+					return []
+				position += len(line)
+				if line.rstrip(b'\r\n'):
+					rows += 1
+					if rows % self._chunk_size == 0:
+						boundaries.append(position)
+		if boundaries[-1] != position:
+			boundaries.append(position)
+		return boundaries
+
+	def _read(self, start: int, end: int) -> Dataset:
+		with self._path.open('rb') as f:
+			f.seek(start)
+			data = f.read(end - start).decode(locale.getpreferredencoding(False))
+		features, targets = array('d'), array('d')
+		for feature_value, target_value in project_columns(io.StringIO(data, newline=''), self._indices, self._width):
+			features.append(float(feature_value))
+			targets.append(float(target_value))
+		return Dataset._from_columns(Vector._wrap(features), Vector._wrap(targets), self._feature_name, self._target_name)
+
+	def shuffled(self, rng: random.Random) -> Iterator[Dataset]:
+		if self._boundaries is None:
+			self._boundaries = self._index()
+		if not self._boundaries:
+			# Compressed or quoted files can only be read front to back
+			yield from self
+			return
+		ranges = list(zip(self._boundaries, self._boundaries[1:]))
+		rng.shuffle(ranges)
+		for start, end in ranges:
+			yield self._read(start, end)
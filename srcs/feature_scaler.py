@@ -1,5 +1,5 @@
-import math
-from . import Vector
+from collections.abc import Iterable
+from . import RunningMoments, Vector
 
 class FeatureScaler:
 	def __init__(self, mean_value: float, std_value: float) -> None:
@@ -8,15 +8,21 @@ class FeatureScaler:
 		self._std = std if std > 0 else 1.0
 
 	@classmethod
-	def from_vector(cls, values: Vector) -> 'FeatureScaler':
-		length = len(values)
-		if length == 0:
+	def from_moments(cls, moments: RunningMoments) -> 'FeatureScaler':
+		if moments.count == 0:
 			raise ValueError('Values must not be empty')
-		mean_value = values.sum() / length
-		centered = values.map(lambda value: value - mean_value)
-		variance = centered.dot(centered) / length
-		std_value = math.sqrt(variance)
-		return cls(mean_value, std_value)
+		return cls(moments.mean, moments.std)
+
+	@classmethod
+	def from_vector(cls, values: Vector) -> 'FeatureScaler':
+		return cls.from_moments(RunningMoments.from_values(values))
+
+	@classmethod
+	def from_chunks(cls, chunks: Iterable[Vector]) -> 'FeatureScaler':
+		moments = RunningMoments()
+		for values in chunks:
+			moments.merge(RunningMoments.from_values(values))
+		return cls.from_moments(moments)
 
 	@property
 	def mean(self) -> float:
@@ -1,22 +1,242 @@
-from . import Dataset, FeatureScaler, LinearRegressionModel, Vector
-from tqdm import tqdm
+import json
+import math
+import random
+import time
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from . import Dataset, DatasetStream, FeatureScaler, LinearRegressionModel, TrainingCallback, Vector
+from .backends import PythonBackend, get_backend
+from .learning_rate_schedules import LearningRateSchedule
+from .optimizers import GradientDescent, Optimizer
+from .options import STOP_CRITERIA
+from .training_checkpoint import Checkpointer, TrainingCheckpoint, dataset_fingerprint
+from .training_callbacks import EpochState
 
 class GradientDescentTrainer:
-	def __init__(self, model: LinearRegressionModel, learning_rate: float) -> None:
+	def __init__(self, model: LinearRegressionModel, learning_rate: float, batch_size: int | None = None, shuffle: bool = False, seed: int | None = None, tolerance: float | None = None, stop_criterion: str = 'gradient', patience: int = 1, progress: bool = True, callbacks: Iterable[TrainingCallback] = (), optimizer: Optimizer | None = None, schedule: LearningRateSchedule | None = None, target_loss: float | None = None, checkpointer: Checkpointer | None = None) -> None:
 		if learning_rate <= 0:
 			raise ValueError('Learning rate must be positive')
+		if batch_size is not None and batch_size <= 0:
+			raise ValueError('Batch size must be positive')
+		if shuffle and batch_size is None:
+			raise ValueError('Shuffling requires a batch size; full-batch gradients do not depend on the order')
+		if tolerance is not None and tolerance < 0:
+			raise ValueError('Tolerance must not be negative')
+		if stop_criterion not in STOP_CRITERIA:
+			raise ValueError(f'Stop criterion must be one of: {", ".join(STOP_CRITERIA)}')
+		if patience <= 0:
+			raise ValueError('Patience must be positive')
+		if target_loss is not None and target_loss < 0:
+			raise ValueError('Target loss must not be negative')
 		self._model = model
 		self._learning_rate = float(learning_rate)
+		self._batch_size = batch_size
+		self._shuffle = shuffle
+		self._seed = seed
+		self._tolerance = tolerance
+		self._stop_criterion = stop_criterion
+		self._patience = patience
+		self._progress = progress
+		self._callbacks = list(callbacks)
+		self._optimizer = optimizer if optimizer is not None else GradientDescent()
+		self._schedule = schedule if schedule is not None else LearningRateSchedule()
+		self._target_loss = target_loss
+		self._checkpointer = checkpointer
+		self._epochs_run = 0
+		self._final_loss = math.nan
 
-	def train(self, dataset: Dataset, epochs: int) -> Vector:
-		if epochs <= 0:
-			raise ValueError('Epochs must be positive')
-		scaler = FeatureScaler.from_vector(dataset.features)
-		scaled_features = scaler.scale_vector(dataset.features)
-		for _ in tqdm(range(epochs), unit='epoch'):
-			errors = scaled_features.map(self._model.predict) - dataset.targets
-			gradients = Vector([errors.sum(), errors.dot(scaled_features)]) / len(scaled_features)
-			tmp_theta = self._model.parameters - gradients * self._learning_rate
-			self._model.update(tmp_theta)
+	@property
+	def epochs_run(self) -> int:
+		return self._epochs_run
+
+	@property
+	def final_loss(self) -> float:
+		return self._final_loss
+
+	def _step(self, error_sum: float, weighted_error_sum: float, count: int, learning_rate: float, objective: Callable[[Vector], float]) -> None:
+		gradients = Vector([error_sum, weighted_error_sum]) / count
+		self._model.update(self._optimizer.step(self._model.parameters, gradients, learning_rate, objective))
+
+	@staticmethod
+	def _objective(batches: Callable[[], Iterable[tuple[Vector, Vector]]], backend: PythonBackend, scaler: FeatureScaler) -> Callable[[Vector], float]:
+		# Half mean squared error, the function whose gradient the trainer follows
+		def objective(thetas: Vector) -> float:
+			count, squared_error_sum = 0, 0.0
+			for features, targets in batches():
+				count += len(features)
+				squared_error_sum += backend.epoch_sums(features, targets, thetas[0], thetas[1], scaler.mean, scaler.std)[2]
+			return squared_error_sum / (2 * count)
+		return objective
+
+	def _batches(self, features: Vector, targets: Vector, rng: random.Random) -> Iterator[tuple[Vector, Vector]]:
+		size = len(features)
+		batch_size = self._batch_size or size
+		if batch_size >= size and not self._shuffle or self._batch_size is None:
+			yield features, targets
+			return
+		if not self._shuffle:
+			for start in range(0, size, batch_size):
+				yield features[start:start + batch_size], targets[start:start + batch_size]
+			return
+		order = array('q', range(size))
+		rng.shuffle(order)
+		for start in range(0, size, batch_size):
+			indices = order[start:start + batch_size]
+			yield features.take(indices), targets.take(indices)
+
+	def _epoch_chunks(self, chunks: Iterable[Dataset], rng: random.Random) -> Iterable[Dataset]:
+		# Chunk order changes every epoch; a batch still never spans two chunks
+		if not self._shuffle:
+			return chunks
+		if isinstance(chunks, DatasetStream):
+			return chunks.shuffled(rng)
+		if isinstance(chunks, Sequence):
+			order = list(range(len(chunks)))
+			rng.shuffle(order)
+			return [chunks[index] for index in order]
+		return chunks
+
+	def _has_converged(self, gradient_norm: float, loss: float, previous_loss: float, parameter_delta: float) -> bool:
+		if self._tolerance is None:
+			return False
+		if self._stop_criterion == 'gradient':
+			return gradient_norm <= self._tolerance
+		if self._stop_criterion == 'loss':
+			if math.isinf(previous_loss):
+				return False
+			return abs(previous_loss - loss) <= self._tolerance * max(abs(previous_loss), math.ulp(0.0))
+		return parameter_delta <= self._tolerance
+
+	def _settings(self, epochs: int) -> dict:
+		return {
+			'epochs': epochs,
+			'learning_rate': self._learning_rate,
+			'batch_size': self._batch_size,
+			'shuffle': self._shuffle,
+			'seed': self._seed,
+			'tolerance': self._tolerance,
+			'stop_criterion': self._stop_criterion,
+			'patience': self._patience,
+			'target_loss': self._target_loss,
+			'optimizer': type(self._optimizer).__name__,
+			'schedule': [type(self._schedule).__name__, sorted(vars(self._schedule).items())],
+			'backend': get_backend().name,
+		}
+
+	def _load_checkpoint(self, fingerprint: str, epochs: int) -> TrainingCheckpoint | None:
+		assert self._checkpointer is not None
+		checkpoint = self._checkpointer.load()
+		if checkpoint is None:
+			return None
+		if checkpoint.fingerprint != fingerprint:
+			raise ValueError(f'Checkpoint {self._checkpointer.path} was written for a different dataset')
+		# JSON turns tuples into lists; compare in the same form
+		if checkpoint.settings != json.loads(json.dumps(self._settings(epochs))):
+			raise ValueError(f'Checkpoint {self._checkpointer.path} was written with different training settings')
+		return checkpoint
+
+	def _save_checkpoint(self, epoch: int, loss: float, previous_loss: float, streak: int, scaler: FeatureScaler, rng: random.Random, fingerprint: str, epochs: int) -> None:
+		assert self._checkpointer is not None
+		version, internal, gauss_next = rng.getstate()
+		self._checkpointer.save(TrainingCheckpoint(
+			epoch=epoch,
+			parameters=self._model.parameters,
+			loss=loss,
+			previous_loss=previous_loss,
+			streak=streak,
+			scaler_mean=scaler.mean,
+			scaler_std=scaler.std,
+			optimizer_state=self._optimizer.state(),
+			rng_state=[version, list(internal), gauss_next],
+			fingerprint=fingerprint,
+			settings=self._settings(epochs)
+		))
+
+	def _fit(self, epoch_batches: Callable[[], Iterable[tuple[Vector, Vector]]], scaler: FeatureScaler, epochs: int, rng: random.Random, fingerprint: str | None = None, checkpoint: TrainingCheckpoint | None = None) -> None:
+		from tqdm import tqdm
+		backend = get_backend()
+		self._optimizer.reset()
+		self._epochs_run, self._final_loss = 0, math.nan
+		previous_loss, streak = math.inf, 0
+		if checkpoint is not None:
+			# Restore every piece of state the remaining epochs depend on
+			self._model.update(checkpoint.parameters)
+			self._optimizer.load_state(checkpoint.optimizer_state)
+			if checkpoint.rng_state is not None:
+				version, internal, gauss_next = checkpoint.rng_state
+				rng.setstate((version, tuple(internal), gauss_next))
+			self._epochs_run, self._final_loss = checkpoint.epoch, checkpoint.loss
+			previous_loss, streak = checkpoint.previous_loss, checkpoint.streak
+		start = self._epochs_run
+		state = None
+		for epoch in tqdm(range(start, epochs), unit='epoch', initial=start, total=epochs, disable=not self._progress):
+			learning_rate = self._schedule.rate(self._learning_rate, epoch, epochs)
+			previous_parameters = self._model.parameters
+			started = time.perf_counter()
+			for callback in self._callbacks:
+				callback.on_epoch_start(epoch + 1, self._unscaled_parameters(scaler))
+			count, error_sum, weighted_error_sum, squared_error_sum = 0, 0.0, 0.0, 0.0
+			for features, targets in epoch_batches():
+				thetas = self._model.parameters
+				batch_error_sum, batch_weighted_error_sum, batch_squared_error_sum = backend.epoch_sums(features, targets, thetas[0], thetas[1], scaler.mean, scaler.std)
+				if self._batch_size is not None:
+					batch = ((features, targets),)
+					self._step(batch_error_sum, batch_weighted_error_sum, len(features), learning_rate, self._objective(lambda: batch, backend, scaler))
+				count += len(features)
+				error_sum += batch_error_sum
+				weighted_error_sum += batch_weighted_error_sum
+				squared_error_sum += batch_squared_error_sum
+			if self._batch_size is None:
+				# Full-batch line search evaluates every trial over all of epoch_batches: one pass per trial
+				self._step(error_sum, weighted_error_sum, count, learning_rate, self._objective(epoch_batches, backend, scaler))
+			loss = squared_error_sum / count
+			self._epochs_run, self._final_loss = epoch + 1, loss
+			gradient_norm = math.hypot(error_sum, weighted_error_sum) / count
+			parameter_delta = math.dist(self._model.parameters, previous_parameters)
+			if self._callbacks:
+				state = EpochState(epoch + 1, self._unscaled_parameters(scaler), gradient_norm, loss, started, time.perf_counter() - started)
+				for callback in self._callbacks:
+					callback.on_epoch_end(state)
+			if self._target_loss is not None and loss <= self._target_loss:
+				break
+			streak = streak + 1 if self._has_converged(gradient_norm, loss, previous_loss, parameter_delta) else 0
+			if streak >= self._patience:
+				break
+			previous_loss = loss
+			if self._checkpointer is not None and self._checkpointer.due(epoch + 1):
+				assert fingerprint is not None
+				self._save_checkpoint(epoch + 1, loss, previous_loss, streak, scaler, rng, fingerprint, epochs)
+		if self._checkpointer is not None:
+			self._checkpointer.clear()
+		for callback in self._callbacks:
+			callback.on_train_end(state)
+
+	def _unscaled_parameters(self, scaler: FeatureScaler) -> Vector:
 		thetas, std, mean = self._model.parameters, scaler.std, scaler.mean
 		return Vector([thetas[0] - (thetas[1] / std) * mean, thetas[1] / std])
+
+	def _prepare(self, chunks: Iterable[Dataset], epochs: int, resume: bool, build_scaler: Callable[[], FeatureScaler]) -> tuple[FeatureScaler, str | None, TrainingCheckpoint | None]:
+		if epochs <= 0:
+			raise ValueError('Epochs must be positive')
+		if resume and self._checkpointer is None:
+			raise ValueError('Resuming requires a checkpointer')
+		fingerprint = dataset_fingerprint(chunks) if self._checkpointer is not None else None
+		checkpoint = self._load_checkpoint(fingerprint, epochs) if resume and fingerprint is not None else None
+		# Reuse the checkpointed scaler so a resumed run never depends on recomputing it
+		scaler = FeatureScaler(checkpoint.scaler_mean, checkpoint.scaler_std) if checkpoint is not None else build_scaler()
+		return scaler, fingerprint, checkpoint
+
+	def train(self, dataset: Dataset, epochs: int, resume: bool = False) -> Vector:
+		scaler, fingerprint, checkpoint = self._prepare((dataset,), epochs, resume, lambda: FeatureScaler.from_vector(dataset.features))
+		rng = random.Random(self._seed)
+		self._fit(lambda: self._batches(dataset.features, dataset.targets, rng), scaler, epochs, rng, fingerprint, checkpoint)
+		return self._unscaled_parameters(scaler)
+
+	def train_chunks(self, chunks: Iterable[Dataset], epochs: int, resume: bool = False) -> Vector:
+		scaler, fingerprint, checkpoint = self._prepare(chunks, epochs, resume, lambda: FeatureScaler.from_chunks(chunk.features for chunk in chunks))
+		rng = random.Random(self._seed)
+		def epoch_batches() -> Iterator[tuple[Vector, Vector]]:
+			for chunk in self._epoch_chunks(chunks, rng):
+				yield from self._batches(chunk.features, chunk.targets, rng)
+		self._fit(epoch_batches, scaler, epochs, rng, fingerprint, checkpoint)
+		return self._unscaled_parameters(scaler)
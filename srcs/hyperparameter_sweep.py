@@ -0,0 +1,110 @@
+import itertools
+import math
+import os
+from collections.abc import Iterable
+from dataclasses import dataclass
+from . import ClosedFormTrainer, Dataset, GradientDescentTrainer, LinearRegressionModel, ModelEvaluator, Vector
+from .backends import get_backend, set_backend
+from .options import METRICS, SOLVERS
+
+@dataclass(frozen=True)
+class SweepConfiguration:
+	solver: str
+	learning_rate: float | None = None
+	epochs: int | None = None
+	batch_size: int | None = None
+
+@dataclass
+class SweepResult:
+	configuration: SweepConfiguration
+	parameters: Vector
+	metrics: dict[str, float]
+	epochs_run: int
+
+def _train_shared(buffer: memoryview, size: int, configuration: SweepConfiguration, seed: int | None) -> tuple[list[float], dict[str, float], int]:
+	dataset = Dataset._from_columns(Vector.from_buffer(buffer[:8 * size]), Vector.from_buffer(buffer[8 * size:16 * size]), 'feature', 'target')
+	model = LinearRegressionModel()
+	if configuration.solver == 'exact':
+		parameters, epochs_run = ClosedFormTrainer(model).train(dataset), 0
+	else:
+		assert configuration.learning_rate is not None and configuration.epochs is not None
+		trainer = GradientDescentTrainer(model, configuration.learning_rate, configuration.batch_size, configuration.batch_size is not None, seed, progress=False)
+		parameters = trainer.train(dataset, configuration.epochs)
+		epochs_run = trainer.epochs_run
+	return parameters.to_list(), ModelEvaluator().evaluate(dataset, parameters), epochs_run
+
+def _run_configuration(memory_name: str, size: int, configuration: SweepConfiguration, seed: int | None) -> tuple[list[float], dict[str, float], int]:
+	from multiprocessing import shared_memory
+	memory = shared_memory.SharedMemory(name=memory_name)
+	try:
+		return _train_shared(memory.buf, size, configuration, seed)
+	finally:
+		try:
+			memory.close()
+		except BufferError:
+			# A propagating exception still references views of the shared buffer
+			pass
+
+class HyperparameterSweep:
+	def __init__(self, learning_rates: Iterable[float], epoch_budgets: Iterable[int], solvers: Iterable[str] = ('gd',), batch_sizes: Iterable[int | None] = (None,), metric: str = 'MSE', workers: int | None = None, seed: int | None = None) -> None:
+		self._learning_rates = list(learning_rates)
+		self._epoch_budgets = list(epoch_budgets)
+		self._solvers = list(dict.fromkeys(solvers))
+		self._batch_sizes = list(batch_sizes)
+		if any(solver not in SOLVERS for solver in self._solvers) or not self._solvers:
+			raise ValueError(f'Solvers must be chosen from: {", ".join(SOLVERS)}')
+		if metric not in METRICS:
+			raise ValueError(f'Metric must be one of: {", ".join(METRICS)}')
+		if 'gd' in self._solvers and (not self._learning_rates or not self._epoch_budgets):
+			raise ValueError('Gradient descent needs at least one learning rate and epoch budget')
+		if any(rate <= 0 for rate in self._learning_rates):
+			raise ValueError('Learning rate must be positive')
+		if any(epochs <= 0 for epochs in self._epoch_budgets):
+			raise ValueError('Epochs must be positive')
+		if any(size is not None and size <= 0 for size in self._batch_sizes):
+			raise ValueError('Batch size must be positive')
+		if workers is not None and workers <= 0:
+			raise ValueError('Workers must be positive')
+		self._metric = metric
+		self._workers = workers or os.cpu_count() or 1
+		self._seed = seed
+
+	def configurations(self) -> list[SweepConfiguration]:
+		configurations = []
+		for solver in self._solvers:
+			if solver == 'exact':
+				configurations.append(SweepConfiguration('exact'))
+				continue
+			for rate, epochs, batch_size in itertools.product(self._learning_rates, self._epoch_budgets, self._batch_sizes):
+				configurations.append(SweepConfiguration('gd', rate, epochs, batch_size))
+		return configurations
+
+	def _rank(self, results: list[SweepResult]) -> list[SweepResult]:
+		sign = -1.0 if self._metric == 'R2' else 1.0
+		# Diverged runs end with nan/inf metrics and must never outrank a finite one
+		return sorted(results, key=lambda result: (not math.isfinite(result.metrics[self._metric]), sign * result.metrics[self._metric], result.epochs_run))
+
+	def best(self, results: list[SweepResult]) -> SweepResult:
+		if not results or not math.isfinite(results[0].metrics[self._metric]):
+			raise ValueError(f'No configuration reached a finite {self._metric}; every run diverged')
+		return results[0]
+
+	def run(self, dataset: Dataset) -> list[SweepResult]:
+		# Deferred so the CLI can read SOLVERS and METRICS without loading the process pool
+		from concurrent.futures import ProcessPoolExecutor
+		from multiprocessing import shared_memory
+		size = dataset.size
+		configurations = self.configurations()
+		memory = shared_memory.SharedMemory(create=True, size=16 * size)
+		try:
+			memory.buf[:8 * size] = dataset.features.to_bytes()
+			memory.buf[8 * size:16 * size] = dataset.targets.to_bytes()
+			# Spawned workers start on the default backend, so hand them the active one
+			with ProcessPoolExecutor(max_workers=min(self._workers, len(configurations)), initializer=set_backend, initargs=(get_backend().name,)) as executor:
+				futures = [executor.submit(_run_configuration, memory.name, size, configuration, self._seed) for configuration in configurations]
+				outcomes = [future.result() for future in futures]
+		finally:
+			memory.close()
+			memory.unlink()
+		results = [SweepResult(configuration, Vector(parameters), metrics, epochs_run) for configuration, (parameters, metrics, epochs_run) in zip(configurations, outcomes)]
+		return self._rank(results)
@@ -0,0 +1,43 @@
+import math
+
+class LearningRateSchedule:
+	def rate(self, base_rate: float, epoch: int, epochs: int) -> float:
+		return base_rate
+
+class StepDecay(LearningRateSchedule):
+	def __init__(self, step_size: int = 100, gamma: float = 0.5) -> None:
+		if step_size <= 0:
+			raise ValueError('Step size must be positive')
+		if not 0 < gamma <= 1:
+			raise ValueError('Decay rate must be in (0, 1]')
+		self._step_size = step_size
+		self._gamma = float(gamma)
+
+	def rate(self, base_rate: float, epoch: int, epochs: int) -> float:
+		return base_rate * self._gamma ** (epoch // self._step_size)
+
+class ExponentialDecay(LearningRateSchedule):
+	def __init__(self, gamma: float = 0.99) -> None:
+		if not 0 < gamma <= 1:
+			raise ValueError('Decay rate must be in (0, 1]')
+		self._gamma = float(gamma)
+
+	def rate(self, base_rate: float, epoch: int, epochs: int) -> float:
+		return base_rate * self._gamma ** epoch
+
+class CosineAnnealing(LearningRateSchedule):
+	def __init__(self, min_rate: float = 0.0) -> None:
+		if min_rate < 0:
+			raise ValueError('Minimum learning rate must not be negative')
+		self._min_rate = float(min_rate)
+
+	def rate(self, base_rate: float, epoch: int, epochs: int) -> float:
+		progress = epoch / max(epochs - 1, 1)
+		return self._min_rate + 0.5 * (base_rate - self._min_rate) * (1.0 + math.cos(math.pi * progress))
+
+SCHEDULES: dict[str, type[LearningRateSchedule]] = {
+	'constant': LearningRateSchedule,
+	'step': StepDecay,
+	'exponential': ExponentialDecay,
+	'cosine': CosineAnnealing,
+}
@@ -1,4 +1,5 @@
 from . import Vector
+from .backends import get_backend
 
 class LinearRegressionModel:
 	def __init__(self, thetas: Vector | None = None) -> None:
@@ -18,5 +19,8 @@ class LinearRegressionModel:
 	def predict(self, feature: float) -> float:
 		return self._theta[0] + self._theta[1] * feature
 
+	def predict_vector(self, features: Vector) -> Vector:
+		return get_backend().affine(features, self._theta[1], self._theta[0])
+
 	def update(self, values: Vector) -> None:
 		self._theta = self._build_thetas(values)
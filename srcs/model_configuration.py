@@ -1,13 +1,14 @@
 import json
 from dataclasses import dataclass
 from pathlib import Path
-from . import Vector
+from . import SufficientStatistics, Vector
 
 @dataclass
 class ModelConfiguration:
 	thetas: Vector
 	feature_name: str
 	target_name: str
+	statistics: SufficientStatistics | None = None
 
 	@classmethod
 	def from_file(cls, path: Path | str) -> 'ModelConfiguration':
@@ -16,15 +17,19 @@ class ModelConfiguration:
 		return cls(
 			feature_name=str(data['feature_name']),
 			target_name=str(data['target_name']),
-			thetas=Vector(data['thetas'])
+			thetas=Vector(data['thetas']),
+			statistics=SufficientStatistics.from_json(data['statistics']) if 'statistics' in data else None
 		)
 
 	def to_json(self) -> dict:
-		return {
+		data = {
 			'feature_name': self.feature_name,
 			'target_name': self.target_name,
 			'thetas': self.thetas.to_list()
 		}
+		if self.statistics is not None:
+			data['statistics'] = self.statistics.to_json()
+		return data
 
 	def save(self, path: Path | str) -> None:
 		p = Path(path)
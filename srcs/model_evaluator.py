@@ -1,36 +1,78 @@
 import math
-from . import Dataset, Vector
+from collections.abc import Iterable
+from . import Dataset, RunningMoments, Vector
+from .backends import get_backend
 
-class ModelEvaluator:
-	def _predictions(self, dataset: Dataset, parameters: Vector) -> Vector:
-		if len(parameters) != 2:
-			raise ValueError('Parameters vector must have exactly two elements (intercept and slope)')
-		intercept, slope = parameters[0], parameters[1]
-		return dataset.features.map(lambda x: intercept + slope * x)
+class EvaluationAccumulator:
+	def __init__(self, count: int = 0, sse: float = 0.0, sae: float = 0.0, mean_y: float = 0.0, m2_y: float = 0.0) -> None:
+		self._targets = RunningMoments(count, mean_y, m2_y)
+		self._sse = float(sse)
+		self._sae = float(sae)
 
-	def evaluate(self, dataset: Dataset, parameters: Vector) -> dict[str, float]:
-		n = dataset.size
+	@property
+	def count(self) -> int:
+		return self._targets.count
+
+	@property
+	def sse(self) -> float:
+		return self._sse
+
+	@property
+	def sae(self) -> float:
+		return self._sae
+
+	@property
+	def tss(self) -> float:
+		return self._targets.m2
+
+	def update_vectors(self, features: Vector, targets: Vector, intercept: float, slope: float) -> 'EvaluationAccumulator':
+		if len(features) != len(targets):
+			raise ValueError('Features and targets must have the same number of samples')
+		# The residual sums and the target moments come out of one fused pass
+		state = (self._targets.count, self._sse, self._sae, self._targets.mean, self._targets.m2)
+		n, self._sse, self._sae, mean_y, m2_y = get_backend().update_residuals(state, features, targets, float(intercept), float(slope))
+		self._targets = RunningMoments(n, mean_y, m2_y)
+		return self
+
+	def merge(self, other: 'EvaluationAccumulator') -> 'EvaluationAccumulator':
+		self._targets.merge(other._targets)
+		self._sse += other._sse
+		self._sae += other._sae
+		return self
+
+	def metrics(self) -> dict[str, float]:
+		n = self.count
 		if n == 0:
 			raise ValueError('Dataset must contain at least one sample')
-
-		residuals = dataset.targets - self._predictions(dataset, parameters)
-		sse = residuals.square().sum()
+		sse, tss = self._sse, self.tss
 		mse = sse / n
-		rmse = math.sqrt(mse)
-		mae = residuals.map(abs).sum() / n
-
 		# R2: 1 - SSE / TSS, guarding for constant target values
-		y = dataset.targets
-		mean_y = y.sum() / n
-		tss = (y - Vector([mean_y] * n)).square().sum()
 		if tss == 0:
 			r2 = 1.0 if sse == 0 else 0.0
 		else:
 			r2 = 1.0 - (sse / tss)
-
 		return {
 			'MSE': mse,
-			'RMSE': rmse,
-			'MAE': mae,
+			'RMSE': math.sqrt(mse),
+			'MAE': self._sae / n,
 			'R2': r2,
 		}
+
+class ModelEvaluator:
+	def evaluate(self, dataset: Dataset, parameters: Vector) -> dict[str, float]:
+		n = dataset.size
+		if n == 0:
+			raise ValueError('Dataset must contain at least one sample')
+		return self.evaluate_chunks((dataset,), parameters)
+
+	def evaluate_chunks(self, chunks: Iterable[Dataset], parameters: Vector) -> dict[str, float]:
+		return self.accumulate(chunks, parameters).metrics()
+
+	def accumulate(self, chunks: Iterable[Dataset], parameters: Vector) -> EvaluationAccumulator:
+		if len(parameters) != 2:
+			raise ValueError('Parameters vector must have exactly two elements (intercept and slope)')
+		intercept, slope = parameters[0], parameters[1]
+		accumulator = EvaluationAccumulator()
+		for chunk in chunks:
+			accumulator.update_vectors(chunk.features, chunk.targets, intercept, slope)
+		return accumulator
@@ -0,0 +1,19 @@
+# Chan et al. pairwise combination of (count, mean, centered moments). The
+# helpers only use arithmetic operators, so they accept floats or NumPy arrays.
+
+def combine_means(n_a: int, mean_a: float, n_b: int, mean_b: float) -> float:
+	return mean_a + (mean_b - mean_a) * n_b / (n_a + n_b)
+
+def combine_co_moments(n_a: int, delta_x: float, delta_y: float, c_a: float, n_b: int, c_b: float) -> float:
+	# delta_x/delta_y are the differences of the means (b - a); c_a/c_b the centered co-moments
+	if n_a == 0 or n_b == 0:
+		return c_a + c_b
+	return c_a + (c_b + delta_x * delta_y * (n_a * n_b / (n_a + n_b)))
+
+def combine(n_a: int, mean_a: float, m2_a: float, n_b: int, mean_b: float, m2_b: float) -> tuple[int, float, float]:
+	if n_b == 0:
+		return n_a, mean_a, m2_a
+	if n_a == 0:
+		return n_b, mean_b, m2_b
+	delta = mean_b - mean_a
+	return n_a + n_b, combine_means(n_a, mean_a, n_b, mean_b), combine_co_moments(n_a, delta, delta, m2_a, n_b, m2_b)
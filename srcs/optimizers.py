@@ -0,0 +1,120 @@
+import math
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from . import Vector
+
+Objective = Callable[[Vector], float]
+
+class Optimizer(ABC):
+	def reset(self) -> None:
+		pass
+
+	def state(self) -> dict:
+		return {}
+
+	def load_state(self, state: dict) -> None:
+		pass
+
+	@abstractmethod
+	def step(self, parameters: Vector, gradients: Vector, learning_rate: float, objective: Objective) -> Vector:
+		pass
+
+class GradientDescent(Optimizer):
+	def step(self, parameters: Vector, gradients: Vector, learning_rate: float, objective: Objective) -> Vector:
+		return parameters - gradients * learning_rate
+
+class Momentum(Optimizer):
+	def __init__(self, beta: float = 0.9) -> None:
+		if not 0 <= beta < 1:
+			raise ValueError('Momentum must be in [0, 1)')
+		self._beta = float(beta)
+		self._velocity: Vector | None = None
+
+	def reset(self) -> None:
+		self._velocity = None
+
+	def state(self) -> dict:
+		return {'velocity': None if self._velocity is None else self._velocity.to_list()}
+
+	def load_state(self, state: dict) -> None:
+		velocity = state['velocity']
+		self._velocity = None if velocity is None else Vector(velocity)
+
+	def _update_velocity(self, gradients: Vector) -> Vector:
+		velocity = gradients.clone() if self._velocity is None else (self._velocity * self._beta + gradients)
+		self._velocity = velocity
+		return velocity
+
+	def step(self, parameters: Vector, gradients: Vector, learning_rate: float, objective: Objective) -> Vector:
+		return parameters - self._update_velocity(gradients) * learning_rate
+
+class Nesterov(Momentum):
+	def step(self, parameters: Vector, gradients: Vector, learning_rate: float, objective: Objective) -> Vector:
+		# Look-ahead form: step along the gradient plus the momentum it is about to build
+		velocity = self._update_velocity(gradients)
+		return parameters - (gradients + velocity * self._beta) * learning_rate
+
+class Adam(Optimizer):
+	def __init__(self, beta1: float = 0.9, beta2: float = 0.999, epsilon: float = 1e-8) -> None:
+		if not 0 <= beta1 < 1 or not 0 <= beta2 < 1:
+			raise ValueError('Adam decay rates must be in [0, 1)')
+		if epsilon <= 0:
+			raise ValueError('Epsilon must be positive')
+		self._beta1 = float(beta1)
+		self._beta2 = float(beta2)
+		self._epsilon = float(epsilon)
+		self.reset()
+
+	def reset(self) -> None:
+		self._first = Vector([0.0, 0.0])
+		self._second = Vector([0.0, 0.0])
+		self._steps = 0
+
+	def state(self) -> dict:
+		return {'first': self._first.to_list(), 'second': self._second.to_list(), 'steps': self._steps}
+
+	def load_state(self, state: dict) -> None:
+		self._first = Vector(state['first'])
+		self._second = Vector(state['second'])
+		self._steps = int(state['steps'])
+
+	def step(self, parameters: Vector, gradients: Vector, learning_rate: float, objective: Objective) -> Vector:
+		self._steps += 1
+		self._first = self._first * self._beta1 + gradients * (1.0 - self._beta1)
+		self._second = self._second * self._beta2 + gradients.square() * (1.0 - self._beta2)
+		first = self._first / (1.0 - self._beta1 ** self._steps)
+		second = self._second / (1.0 - self._beta2 ** self._steps)
+		return parameters - Vector(m / (math.sqrt(v) + self._epsilon) for m, v in zip(first, second)) * learning_rate
+
+class LineSearch(Optimizer):
+	def __init__(self, shrink: float = 0.5, sufficient_decrease: float = 1e-4, max_steps: int = 30) -> None:
+		if not 0 < shrink < 1:
+			raise ValueError('Shrink factor must be in (0, 1)')
+		if not 0 < sufficient_decrease < 1:
+			raise ValueError('Sufficient decrease constant must be in (0, 1)')
+		if max_steps <= 0:
+			raise ValueError('Max steps must be positive')
+		self._shrink = float(shrink)
+		self._sufficient_decrease = float(sufficient_decrease)
+		self._max_steps = max_steps
+
+	def step(self, parameters: Vector, gradients: Vector, learning_rate: float, objective: Objective) -> Vector:
+		# Backtrack from the scheduled rate until the Armijo condition holds
+		current = objective(parameters)
+		slope = gradients.sum_of_squares()
+		rate = learning_rate
+		candidate = parameters - gradients * rate
+		for _ in range(self._max_steps):
+			if objective(candidate) <= current - self._sufficient_decrease * rate * slope:
+				break
+			rate *= self._shrink
+			candidate = parameters - gradients * rate
+		return candidate
+
+OPTIMIZERS: dict[str, type[Optimizer]] = {
+	'sgd': GradientDescent,
+	'momentum': Momentum,
+	'nesterov': Nesterov,
+	'adam': Adam,
+	'line-search': LineSearch,
+}
@@ -0,0 +1,8 @@
+# Choices and defaults the CLI parser needs. This module imports nothing, so
+# building the parser for `predict` does not load the trainers behind them.
+STOP_CRITERIA = ('gradient', 'loss', 'parameters')
+SOLVERS = ('gd', 'exact')
+METRICS = ('MSE', 'RMSE', 'MAE', 'R2')
+SCHEDULE_NAMES = ('constant', 'step', 'exponential', 'cosine')
+OPTIMIZER_NAMES = ('sgd', 'momentum', 'nesterov', 'adam', 'line-search')
+DEFAULT_DENSITY_THRESHOLD = 50_000
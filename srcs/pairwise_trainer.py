@@ -0,0 +1,167 @@
+import csv
+import locale
+import os
+import re
+from array import array
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from . import SufficientStatistics, Vector
+from .backends import get_backend, set_backend
+from .co_moment_matrix import CoMomentMatrix
+from .compression import detect_compression, open_binary
+from .csv_projection import column_index, project_columns
+from .dataset import DEFAULT_CHUNK_SIZE
+from .model_evaluator import EvaluationAccumulator
+from .parallel_csv_loader import MIN_RANGE_SIZE, split_ranges
+
+def model_filename(feature: str, target: str) -> str:
+	# Header text may hold separators or '..': keep each name to a single safe path component
+	feature, target = (re.sub(r'[^\w.-]', '_', name) for name in (feature, target))
+	return f'{feature}__{target}.json'
+
+def _lines(path: str, start: int, end: int | None, encoding: str) -> Iterator[str]:
+	with open_binary(path) as f:
+		if end is None:
+			# Compressed streams cannot seek: skip the header and decode to the end
+			f.readline()
+			yield from (line.decode(encoding) for line in f)
+			return
+		f.seek(start)
+		position = start
+		for line in f:
+			if position >= end:
+				break
+			position += len(line)
+			yield line.decode(encoding)
+
+def _column_chunks(path: str, start: int, end: int | None, indices: Sequence[int], width: int, encoding: str, chunk_size: int) -> Iterator[list[Vector]]:
+	columns = [array('d') for _ in indices]
+	for values in project_columns(_lines(path, start, end, encoding), indices, width):
+		for column, value in zip(columns, values):
+			column.append(float(value))
+		if len(columns[0]) == chunk_size:
+			yield [Vector._wrap(column) for column in columns]
+			columns = [array('d') for _ in indices]
+	if columns[0]:
+		yield [Vector._wrap(column) for column in columns]
+
+def _collect_range(path: str, start: int, end: int | None, columns: list[str], indices: list[int], width: int, encoding: str, chunk_size: int) -> CoMomentMatrix:
+	matrix = CoMomentMatrix(columns)
+	for chunk in _column_chunks(path, start, end, indices, width, encoding, chunk_size):
+		matrix.update_columns(chunk)
+	return matrix
+
+def _score_range(path: str, start: int, end: int | None, pairs: list[tuple[int, int, float, float]], indices: list[int], width: int, encoding: str, chunk_size: int) -> list[EvaluationAccumulator]:
+	accumulators = [EvaluationAccumulator() for _ in pairs]
+	for chunk in _column_chunks(path, start, end, indices, width, encoding, chunk_size):
+		for accumulator, (feature, target, intercept, slope) in zip(accumulators, pairs):
+			accumulator.update_vectors(chunk[feature], chunk[target], intercept, slope)
+	return accumulators
+
+@dataclass
+class PairwiseFit:
+	feature: str
+	target: str
+	parameters: Vector
+	statistics: SufficientStatistics
+	metrics: dict[str, float]
+
+@dataclass
+class _ScanPlan:
+	path: str
+	columns: list[str]
+	indices: list[int]
+	width: int
+	encoding: str
+	ranges: list[tuple[int, int | None]]
+
+class PairwiseTrainer:
+	def __init__(self, columns: Sequence[str] | None = None, workers: int = 1, chunk_size: int = DEFAULT_CHUNK_SIZE, min_range_size: int = MIN_RANGE_SIZE, absolute_errors: bool = False) -> None:
+		if columns is not None and len(columns) < 2:
+			raise ValueError('At least two columns are required')
+		if columns is not None and len(set(columns)) != len(columns):
+			raise ValueError('Column names must be unique')
+		if workers <= 0:
+			raise ValueError('Workers must be positive')
+		if chunk_size <= 0:
+			raise ValueError('Chunk size must be positive')
+		self._columns = list(columns) if columns is not None else None
+		self._workers = workers
+		self._chunk_size = chunk_size
+		self._min_range_size = min_range_size
+		self._absolute_errors = absolute_errors
+
+	def _resolve_columns(self, header: list[str] | None) -> list[str]:
+		if header is None or len(header) < 2:
+			raise ValueError('Dataset must contain at least two columns')
+		if self._columns is None:
+			return list(header)
+		missing = [name for name in self._columns if name not in header]
+		if missing:
+			raise ValueError(f'Columns not found in CSV: {", ".join(missing)}')
+		return list(self._columns)
+
+	def _plan(self, path: Path | str) -> _ScanPlan:
+		path = Path(path)
+		encoding = locale.getpreferredencoding(False)
+		compressed = detect_compression(path) is not None
+		ranges: list[tuple[int, int | None]]
+		with open_binary(path) as f:
+			header = next(csv.reader([f.readline().decode(encoding)]), None)
+			columns = self._resolve_columns(header)
+			if compressed:
+				ranges = [(0, None)]
+			else:
+				start = f.tell()
+				size = f.seek(0, os.SEEK_END)
+				ranges = split_ranges(f, start, size, self._workers, self._min_range_size)
+		assert header is not None
+		return _ScanPlan(str(path), columns, [column_index(header, name) for name in columns], len(header), encoding, ranges)
+
+	def _map(self, func: Callable, plan: _ScanPlan, *args) -> list:
+		arguments = [(plan.path, start, end, *args, plan.indices, plan.width, plan.encoding, self._chunk_size) for start, end in plan.ranges]
+		if len(arguments) <= 1:
+			return [func(*args) for args in arguments]
+		# Spawned workers start on the default backend, so hand them the active one
+		with ProcessPoolExecutor(max_workers=min(self._workers, len(arguments)), initializer=set_backend, initargs=(get_backend().name,)) as executor:
+			futures = [executor.submit(func, *args) for args in arguments]
+			return [future.result() for future in futures]
+
+	def _collect(self, plan: _ScanPlan) -> CoMomentMatrix:
+		matrix = CoMomentMatrix(plan.columns)
+		for part in self._map(_collect_range, plan, plan.columns):
+			matrix.merge(part)
+		return matrix
+
+	def collect(self, path: Path | str) -> CoMomentMatrix:
+		return self._collect(self._plan(path))
+
+	def fit(self, matrix: CoMomentMatrix) -> list[PairwiseFit]:
+		fits = []
+		for feature in matrix.columns:
+			for target in matrix.columns:
+				if feature == target:
+					continue
+				statistics = matrix.statistics(feature, target)
+				parameters = statistics.fit()
+				accumulator = EvaluationAccumulator(statistics.count, statistics.squared_error(parameters), 0.0, statistics.mean_y, statistics.m2_y)
+				# MAE depends on every residual's sign, which no moment captures
+				metrics = {name: value for name, value in accumulator.metrics().items() if name != 'MAE'}
+				fits.append(PairwiseFit(feature, target, parameters, statistics, metrics))
+		return fits
+
+	def train(self, path: Path | str) -> list[PairwiseFit]:
+		plan = self._plan(path)
+		fits = self.fit(self._collect(plan))
+		if self._absolute_errors:
+			position = {name: index for index, name in enumerate(plan.columns)}
+			pairs = [(position[fit.feature], position[fit.target], fit.parameters[0], fit.parameters[1]) for fit in fits]
+			accumulators = [EvaluationAccumulator() for _ in fits]
+			for part in self._map(_score_range, plan, pairs):
+				for accumulator, other in zip(accumulators, part):
+					accumulator.merge(other)
+			for fit, accumulator in zip(fits, accumulators):
+				fit.metrics = accumulator.metrics()
+		return fits
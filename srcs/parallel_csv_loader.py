@@ -0,0 +1,83 @@
+import csv
+import io
+import locale
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from . import Dataset, Vector
+from .compression import detect_compression
+from .csv_projection import column_index, project_columns
+
+MIN_RANGE_SIZE = 1 << 20
+QUOTE_SCAN_SIZE = 1 << 20
+
+def _contains_quote(f: io.BufferedReader, start: int, size: int) -> bool:
+	f.seek(start)
+	while f.tell() < size:
+		if b'"' in f.read(QUOTE_SCAN_SIZE):
+			return True
+	return False
+
+def split_ranges(f: io.BufferedReader, start: int, size: int, workers: int, min_range_size: int = MIN_RANGE_SIZE) -> list[tuple[int, int]]:
+	count = max(1, min(workers, (size - start) // min_range_size))
+	if count > 1 and _contains_quote(f, start, size):
+		# A quoted field may span lines, so a boundary at a line start could split a record
+		count = 1
+	boundaries = [start]
+	for index in range(1, count):
+		offset = start + (size - start) * index // count
+		# Move each boundary to the start of the next line
+		f.seek(offset - 1)
+		f.readline()
+		boundaries.append(max(f.tell(), boundaries[-1]))
+	boundaries.append(size)
+	return [(a, b) for a, b in zip(boundaries, boundaries[1:]) if b > a]
+
+def _parse_range(path: str, start: int, end: int, feature_index: int, target_index: int, width: int, encoding: str) -> tuple[bytes, bytes]:
+	with open(path, 'rb') as f:
+		f.seek(start)
+		data = f.read(end - start)
+	features, targets = array('d'), array('d')
+	for feature_value, target_value in project_columns(io.StringIO(data.decode(encoding), newline=''), (feature_index, target_index), width):
+		features.append(float(feature_value))
+		targets.append(float(target_value))
+	return features.tobytes(), targets.tobytes()
+
+class ParallelCsvLoader:
+	def __init__(self, workers: int | None = None, min_range_size: int = MIN_RANGE_SIZE) -> None:
+		if workers is not None and workers <= 0:
+			raise ValueError('Workers must be positive')
+		if min_range_size <= 0:
+			raise ValueError('Minimum range size must be positive')
+		self._workers = workers or os.cpu_count() or 1
+		self._min_range_size = min_range_size
+
+	def load(self, path: Path | str, feature: str | None = None, target: str | None = None) -> Dataset:
+		path = Path(path)
+		if detect_compression(path) is not None:
+			# A compressed stream cannot be decoded from arbitrary byte offsets
+			return Dataset.from_csv(path, feature, target)
+		encoding = locale.getpreferredencoding(False)
+		with path.open('rb') as f:
+			header_line = f.readline()
+			header = next(csv.reader([header_line.decode(encoding)]), None)
+			feature_name, target_name = Dataset._resolve_columns(header, feature, target)
+			start = f.tell()
+			size = f.seek(0, os.SEEK_END)
+			ranges = split_ranges(f, start, size, self._workers, self._min_range_size)
+		assert header is not None
+		arguments = [(str(path), a, b, column_index(header, feature_name), column_index(header, target_name), len(header), encoding) for a, b in ranges]
+		if len(arguments) <= 1:
+			return Dataset.from_csv(path, feature, target)
+		with ProcessPoolExecutor(max_workers=min(self._workers, len(arguments))) as executor:
+			futures = [executor.submit(_parse_range, *args) for args in arguments]
+			parts = [future.result() for future in futures]
+		return self._assemble(parts, feature_name, target_name)
+
+	def _assemble(self, parts: list[tuple[bytes, bytes]], feature_name: str, target_name: str) -> Dataset:
+		features, targets = array('d'), array('d')
+		for feature_bytes, target_bytes in parts:
+			features.frombytes(feature_bytes)
+			targets.frombytes(target_bytes)
+		return Dataset._from_columns(Vector._wrap(features), Vector._wrap(targets), feature_name, target_name)
@@ -0,0 +1,297 @@
+import asyncio
+import json
+import time
+from collections.abc import Iterable
+from itertools import chain
+from pathlib import Path
+from . import LinearRegressionModel, ModelConfiguration, Vector
+
+MAX_BODY_SIZE = 16 * 1024 * 1024
+REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed', 413: 'Payload Too Large', 500: 'Internal Server Error'}
+
+class HttpError(Exception):
+	def __init__(self, status: int, message: str) -> None:
+		super().__init__(message)
+		self.status = status
+
+class ServedModel:
+	def __init__(self, path: Path | str) -> None:
+		self._path = Path(path)
+		self._signature = self._stat()
+		self._configuration = ModelConfiguration.from_file(self._path)
+		self._model = LinearRegressionModel(self._configuration.thetas)
+
+	def _stat(self) -> tuple[int, int]:
+		stat = self._path.stat()
+		return stat.st_mtime_ns, stat.st_size
+
+	@property
+	def name(self) -> str:
+		return self._path.stem
+
+	@property
+	def path(self) -> Path:
+		return self._path
+
+	@property
+	def configuration(self) -> ModelConfiguration:
+		return self._configuration
+
+	@property
+	def model(self) -> LinearRegressionModel:
+		return self._model
+
+	def reload_if_changed(self) -> bool:
+		signature = self._stat()
+		if signature == self._signature:
+			return False
+		configuration = ModelConfiguration.from_file(self._path)
+		model = LinearRegressionModel(configuration.thetas)
+		self._signature, self._configuration, self._model = signature, configuration, model
+		return True
+
+class ServerMetrics:
+	def __init__(self) -> None:
+		self._started = time.monotonic()
+		self.requests = 0
+		self.errors = 0
+		self.predictions = 0
+		self.batches = 0
+		self.reloads = 0
+		self.reload_errors = 0
+		self._latency_total = 0.0
+		self._latency_max = 0.0
+
+	def record_request(self, latency: float, ok: bool) -> None:
+		self.requests += 1
+		if not ok:
+			self.errors += 1
+		self._latency_total += latency
+		self._latency_max = max(self._latency_max, latency)
+
+	def snapshot(self) -> dict[str, float]:
+		uptime = max(time.monotonic() - self._started, 1e-9)
+		return {
+			'uptime_seconds': uptime,
+			'requests': self.requests,
+			'errors': self.errors,
+			'predictions': self.predictions,
+			'batches': self.batches,
+			'reloads': self.reloads,
+			'reload_errors': self.reload_errors,
+			'requests_per_second': self.requests / uptime,
+			'predictions_per_second': self.predictions / uptime,
+			'latency_mean_ms': 1000.0 * self._latency_total / self.requests if self.requests else 0.0,
+			'latency_max_ms': 1000.0 * self._latency_max,
+		}
+
+class PredictionServer:
+	def __init__(self, model_paths: Iterable[Path | str], max_batch_size: int = 4096, max_delay: float = 0.002, reload_interval: float = 1.0) -> None:
+		if max_batch_size <= 0:
+			raise ValueError('Max batch size must be positive')
+		if max_delay < 0:
+			raise ValueError('Max delay must not be negative')
+		if reload_interval <= 0:
+			raise ValueError('Reload interval must be positive')
+		self._models: dict[str, ServedModel] = {}
+		for path in model_paths:
+			served = ServedModel(path)
+			if served.name in self._models:
+				raise ValueError(f'Duplicate model name: {served.name}')
+			self._models[served.name] = served
+		if not self._models:
+			raise ValueError('At least one model is required')
+		self._max_batch_size = max_batch_size
+		self._max_delay = max_delay
+		self._reload_interval = reload_interval
+		self._metrics = ServerMetrics()
+		self._queues: dict[str, asyncio.Queue] = {}
+		self._tasks: list[asyncio.Task] = []
+		self._server: asyncio.Server | None = None
+
+	@property
+	def metrics(self) -> ServerMetrics:
+		return self._metrics
+
+	@property
+	def port(self) -> int:
+		if self._server is None:
+			raise RuntimeError('Server is not running')
+		return self._server.sockets[0].getsockname()[1]
+
+	async def start(self, host: str = '127.0.0.1', port: int = 8000) -> None:
+		for name in self._models:
+			self._queues[name] = asyncio.Queue()
+			self._tasks.append(asyncio.create_task(self._batch_loop(name)))
+		self._tasks.append(asyncio.create_task(self._watch_loop()))
+		self._server = await asyncio.start_server(self._handle_connection, host, port)
+
+	async def serve_forever(self, host: str = '127.0.0.1', port: int = 8000) -> None:
+		await self.start(host, port)
+		try:
+			assert self._server is not None
+			await self._server.serve_forever()
+		finally:
+			await self.close()
+
+	async def close(self) -> None:
+		if self._server is not None:
+			self._server.close()
+			await self._server.wait_closed()
+			self._server = None
+		for task in self._tasks:
+			task.cancel()
+		await asyncio.gather(*self._tasks, return_exceptions=True)
+		self._tasks.clear()
+
+	def reload_changed(self) -> list[str]:
+		reloaded = []
+		for name, served in self._models.items():
+			try:
+				changed = served.reload_if_changed()
+			except (OSError, ValueError, KeyError, TypeError):
+				self._metrics.reload_errors += 1
+				continue
+			if changed:
+				self._metrics.reloads += 1
+				reloaded.append(name)
+		return reloaded
+
+	async def predict(self, name: str, features: Vector) -> list[float]:
+		if name not in self._queues:
+			raise HttpError(404, f'Unknown model: {name}')
+		future = asyncio.get_running_loop().create_future()
+		await self._queues[name].put((features, future))
+		return await future
+
+	async def _watch_loop(self) -> None:
+		while True:
+			await asyncio.sleep(self._reload_interval)
+			self.reload_changed()
+
+	async def _batch_loop(self, name: str) -> None:
+		queue = self._queues[name]
+		loop = asyncio.get_running_loop()
+		while True:
+			items = [await queue.get()]
+			size = len(items[0][0])
+			deadline = loop.time() + self._max_delay
+			while size < self._max_batch_size:
+				if queue.empty():
+					timeout = deadline - loop.time()
+					if timeout <= 0:
+						break
+					try:
+						item = await asyncio.wait_for(queue.get(), timeout)
+					except TimeoutError:
+						break
+				else:
+					item = queue.get_nowait()
+				items.append(item)
+				size += len(item[0])
+			# Snapshot the model so a concurrent reload never splits a batch
+			model = self._models[name].model
+			try:
+				predictions = model.predict_vector(Vector(chain.from_iterable(features for features, _ in items)))
+			except Exception as e:
+				for _, future in items:
+					if not future.done():
+						future.set_exception(e)
+				continue
+			self._metrics.batches += 1
+			self._metrics.predictions += len(predictions)
+			offset = 0
+			for features, future in items:
+				if not future.done():
+					future.set_result(predictions[offset:offset + len(features)].to_list())
+				offset += len(features)
+
+	def _parse_features(self, body: bytes) -> Vector:
+		try:
+			payload = json.loads(body or b'null')
+		except ValueError:
+			raise HttpError(400, 'Body must be valid JSON') from None
+		if isinstance(payload, dict) and 'features' in payload:
+			values = payload['features']
+		elif isinstance(payload, dict) and 'feature' in payload:
+			values = [payload['feature']]
+		else:
+			raise HttpError(400, 'Body must contain "feature" or "features"')
+		if not isinstance(values, list) or not all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in values):
+			raise HttpError(400, 'Features must be a list of numbers')
+		return Vector(values)
+
+	async def _dispatch(self, method: str, target: str, body: bytes) -> dict:
+		path = target.split('?', 1)[0].rstrip('/') or '/'
+		parts = path.strip('/').split('/')
+		if path == '/health':
+			return {'status': 'ok'}
+		if path == '/metrics':
+			return self._metrics.snapshot()
+		if path == '/models':
+			return {'models': {name: {'path': str(served.path), **served.configuration.to_json()} for name, served in self._models.items()}}
+		if path == '/predict' or (len(parts) == 3 and parts[0] == 'models' and parts[2] == 'predict'):
+			if method != 'POST':
+				raise HttpError(405, 'Use POST to request predictions')
+			name = parts[1] if len(parts) == 3 else next(iter(self._models))
+			features = self._parse_features(body)
+			return {'model': name, 'predictions': await self.predict(name, features)}
+		raise HttpError(404, f'Unknown path: {path}')
+
+	async def _read_request(self, reader: asyncio.StreamReader) -> tuple[str, str, str, dict[str, str], bytes] | None:
+		request_line = await reader.readline()
+		if not request_line:
+			return None
+		try:
+			method, target, version = request_line.decode('latin-1').split()
+		except ValueError:
+			raise HttpError(400, 'Malformed request line') from None
+		headers: dict[str, str] = {}
+		while True:
+			line = await reader.readline()
+			if line in (b'\r\n', b'\n', b''):
+				break
+			key, _, value = line.decode('latin-1').partition(':')
+			headers[key.strip().lower()] = value.strip()
+		try:
+			length = int(headers.get('content-length', '0'))
+		except ValueError:
+			raise HttpError(400, 'Invalid Content-Length') from None
+		if length > MAX_BODY_SIZE:
+			raise HttpError(413, 'Request body is too large')
+		body = await reader.readexactly(length) if length > 0 else b''
+		return method, target, version, headers, body
+
+	async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+		try:
+			while True:
+				started: float | None = None
+				keep_alive = False
+				try:
+					request = await self._read_request(reader)
+					if request is None:
+						break
+					# Time from a complete request, not from the idle wait on a keep-alive connection
+					started = time.perf_counter()
+					method, target, version, headers, body = request
+					keep_alive = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+					status, payload = 200, await self._dispatch(method, target, body)
+				except HttpError as e:
+					status, payload = e.status, {'error': str(e)}
+				except (ConnectionError, asyncio.IncompleteReadError):
+					break
+				except Exception as e:
+					status, payload = 500, {'error': str(e)}
+				if started is None:
+					started = time.perf_counter()
+				data = json.dumps(payload).encode('utf-8')
+				head = f'HTTP/1.1 {status} {REASONS[status]}\r\nContent-Type: application/json\r\nContent-Length: {len(data)}\r\nConnection: {"keep-alive" if keep_alive else "close"}\r\n\r\n'
+				writer.write(head.encode('latin-1') + data)
+				await writer.drain()
+				self._metrics.record_request(time.perf_counter() - started, status == 200)
+				if not keep_alive:
+					break
+		except ConnectionError:
+			pass
+		finally:
+			writer.close()
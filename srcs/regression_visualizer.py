@@ -1,19 +1,34 @@
-import matplotlib.pyplot as plt
-import matplotx
 from collections.abc import Iterable
 from pathlib import Path
 from . import Dataset, Vector
+from .options import DEFAULT_DENSITY_THRESHOLD
+
+DEFAULT_DENSITY_BINS = 200
 
 class RegressionVisualizer:
+	def __init__(self, density_threshold: int | None = DEFAULT_DENSITY_THRESHOLD, bins: int = DEFAULT_DENSITY_BINS) -> None:
+		if density_threshold is not None and density_threshold <= 0:
+			raise ValueError('Density threshold must be positive')
+		if bins <= 0:
+			raise ValueError('Bins must be positive')
+		self._density_threshold = density_threshold
+		self._bins = bins
+
+	def uses_density(self, size: int) -> bool:
+		return self._density_threshold is not None and size > self._density_threshold
+
 	def plot(self, dataset: Dataset, parameters: Vector, save_path: str | Path | None = None, show: bool = False):
 		if len(parameters) != 2:
 			raise ValueError('Parameters vector must have exactly two elements (intercept and slope)')
-		features = dataset.features.to_list()
-		targets = dataset.targets.to_list()
+		import matplotlib.pyplot as plt
+		import matplotx
 		with plt.style.context(matplotx.styles.duftify(matplotx.styles.dracula)):
 			figure, axis = plt.subplots(figsize=(9, 5.5), dpi=120)
-			axis.scatter(features, targets, s=60, c='#2563eb', edgecolors='#ffffff', linewidths=0.6, alpha=0.9)
-			line_x = self._build_line_values(features)
+			if self.uses_density(dataset.size):
+				self._draw_density(figure, axis, dataset)
+			else:
+				axis.scatter(dataset.features.to_list(), dataset.targets.to_list(), s=60, c='#2563eb', edgecolors='#ffffff', linewidths=0.6, alpha=0.9)
+			line_x = self._build_line_values(dataset.features)
 			line_y = [parameters[0] + parameters[1] * value for value in line_x]
 			axis.plot(line_x, line_y)
 			axis.set_xlabel(dataset.feature_name, fontweight='semibold')
@@ -31,8 +46,26 @@ class RegressionVisualizer:
 				plt.show()
 			return figure
 
+	def _draw_density(self, figure, axis, dataset: Dataset) -> None:
+		# A fixed-size raster keeps render time and image size flat however many rows there are
+		import numpy as np
+		from matplotlib.colors import LogNorm
+		features = np.frombuffer(dataset.features.buffer(), dtype=np.float64)
+		targets = np.frombuffer(dataset.targets.buffer(), dtype=np.float64)
+		counts, x_edges, y_edges = np.histogram2d(features, targets, bins=self._bins)
+		image = axis.imshow(
+			np.ma.masked_equal(counts.T, 0),
+			origin='lower',
+			extent=(x_edges[0], x_edges[-1], y_edges[0], y_edges[-1]),
+			aspect='auto',
+			interpolation='nearest',
+			cmap='viridis',
+			norm=LogNorm(vmin=1, vmax=max(counts.max(), 1)),
+		)
+		figure.colorbar(image, ax=axis, label='points per bin')
+
 	def _build_line_values(self, features: Iterable[float]) -> list[float]:
-		values = list(features)
+		values = features if isinstance(features, Vector) else list(features)
 		minimum = min(values)
 		maximum = max(values)
 		if minimum == maximum:
@@ -0,0 +1,52 @@
+import math
+from collections.abc import Iterable
+from .backends import get_backend
+from .moments import combine
+
+class RunningMoments:
+	def __init__(self, count: int = 0, mean: float = 0.0, m2: float = 0.0) -> None:
+		if count < 0:
+			raise ValueError('Count must not be negative')
+		self._count = int(count)
+		self._mean = float(mean)
+		self._m2 = float(m2)
+
+	@classmethod
+	def from_values(cls, values: Iterable[float]) -> 'RunningMoments':
+		return cls().update_values(values)
+
+	@property
+	def count(self) -> int:
+		return self._count
+
+	@property
+	def mean(self) -> float:
+		return self._mean
+
+	@property
+	def m2(self) -> float:
+		return self._m2
+
+	@property
+	def variance(self) -> float:
+		if self._count == 0:
+			raise ValueError('Moments must contain at least one sample')
+		return self._m2 / self._count
+
+	@property
+	def std(self) -> float:
+		return math.sqrt(self.variance)
+
+	def update(self, value: float) -> 'RunningMoments':
+		return self.update_values((value,))
+
+	def update_values(self, values: Iterable[float]) -> 'RunningMoments':
+		self._count, self._mean, self._m2 = get_backend().update_moments((self._count, self._mean, self._m2), values)
+		return self
+
+	def merge(self, other: 'RunningMoments') -> 'RunningMoments':
+		self._count, self._mean, self._m2 = combine(self._count, self._mean, self._m2, other._count, other._mean, other._m2)
+		return self
+
+	def copy(self) -> 'RunningMoments':
+		return RunningMoments(self._count, self._mean, self._m2)
@@ -0,0 +1,116 @@
+from . import Vector
+from .backends import get_backend
+from .moments import combine, combine_co_moments
+
+class SufficientStatistics:
+	def __init__(self, count: int = 0, mean_x: float = 0.0, mean_y: float = 0.0, m2_x: float = 0.0, m2_y: float = 0.0, c_xy: float = 0.0) -> None:
+		if count < 0:
+			raise ValueError('Count must not be negative')
+		self._count = int(count)
+		self._mean_x = float(mean_x)
+		self._mean_y = float(mean_y)
+		self._m2_x = float(m2_x)
+		self._m2_y = float(m2_y)
+		self._c_xy = float(c_xy)
+
+	@classmethod
+	def from_vectors(cls, features: Vector, targets: Vector) -> 'SufficientStatistics':
+		return cls().update_vectors(features, targets)
+
+	@classmethod
+	def from_json(cls, data: dict) -> 'SufficientStatistics':
+		return cls(int(data['count']), float(data['mean_x']), float(data['mean_y']), float(data['m2_x']), float(data['m2_y']), float(data['c_xy']))
+
+	def to_json(self) -> dict:
+		return {
+			'count': self._count,
+			'mean_x': self._mean_x,
+			'mean_y': self._mean_y,
+			'm2_x': self._m2_x,
+			'm2_y': self._m2_y,
+			'c_xy': self._c_xy
+		}
+
+	@property
+	def count(self) -> int:
+		return self._count
+
+	@property
+	def mean_x(self) -> float:
+		return self._mean_x
+
+	@property
+	def mean_y(self) -> float:
+		return self._mean_y
+
+	@property
+	def m2_x(self) -> float:
+		return self._m2_x
+
+	@property
+	def m2_y(self) -> float:
+		return self._m2_y
+
+	@property
+	def c_xy(self) -> float:
+		return self._c_xy
+
+	def update(self, x: float, y: float) -> 'SufficientStatistics':
+		return self.update_vectors(Vector([x]), Vector([y]))
+
+	def update_vectors(self, features: Vector, targets: Vector) -> 'SufficientStatistics':
+		if len(features) != len(targets):
+			raise ValueError('Features and targets must have the same number of samples')
+		state = (self._count, self._mean_x, self._mean_y, self._m2_x, self._m2_y, self._c_xy)
+		n, mean_x, mean_y, m2_x, m2_y, c_xy = get_backend().update_co_moments(state, features, targets)
+		self._count, self._mean_x, self._mean_y = n, mean_x, mean_y
+		self._m2_x, self._m2_y, self._c_xy = m2_x, m2_y, c_xy
+		return self
+
+	def merge(self, other: 'SufficientStatistics') -> 'SufficientStatistics':
+		n_a, n_b = self._count, other._count
+		dx, dy = other._mean_x - self._mean_x, other._mean_y - self._mean_y
+		self._c_xy = combine_co_moments(n_a, dx, dy, self._c_xy, n_b, other._c_xy)
+		_, self._mean_x, self._m2_x = combine(n_a, self._mean_x, self._m2_x, n_b, other._mean_x, other._m2_x)
+		self._count, self._mean_y, self._m2_y = combine(n_a, self._mean_y, self._m2_y, n_b, other._mean_y, other._m2_y)
+		return self
+
+	def subtract(self, other: 'SufficientStatistics') -> 'SufficientStatistics':
+		if other._count > self._count:
+			raise ValueError('Cannot remove more samples than the statistics contain')
+		if other._count == 0:
+			return self
+		n, n_b = self._count, other._count
+		n_a = n - n_b
+		if n_a == 0:
+			self._count, self._mean_x, self._mean_y = 0, 0.0, 0.0
+			self._m2_x, self._m2_y, self._c_xy = 0.0, 0.0, 0.0
+			return self
+		# Invert Chan's merge: recover the remaining part from the total and the removed part
+		mean_x = (n * self._mean_x - n_b * other._mean_x) / n_a
+		mean_y = (n * self._mean_y - n_b * other._mean_y) / n_a
+		dx = other._mean_x - mean_x
+		dy = other._mean_y - mean_y
+		weight = n_a * n_b / n
+		self._m2_x = max(self._m2_x - other._m2_x - dx * dx * weight, 0.0)
+		self._m2_y = max(self._m2_y - other._m2_y - dy * dy * weight, 0.0)
+		self._c_xy -= other._c_xy + dx * dy * weight
+		self._count, self._mean_x, self._mean_y = n_a, mean_x, mean_y
+		return self
+
+	def copy(self) -> 'SufficientStatistics':
+		return SufficientStatistics(self._count, self._mean_x, self._mean_y, self._m2_x, self._m2_y, self._c_xy)
+
+	def squared_error(self, parameters: Vector) -> float:
+		if len(parameters) != 2:
+			raise ValueError('Parameters vector must have exactly two elements (intercept and slope)')
+		intercept, slope = parameters[0], parameters[1]
+		bias = self._mean_y - intercept - slope * self._mean_x
+		sse = self._m2_y - 2.0 * slope * self._c_xy + slope * slope * self._m2_x + self._count * bias * bias
+		return max(sse, 0.0)
+
+	def fit(self) -> Vector:
+		if self._count == 0:
+			raise ValueError('Statistics must contain at least one sample')
+		slope = self._c_xy / self._m2_x if self._m2_x > 0 else 0.0
+		return Vector([self._mean_y - slope * self._mean_x, slope])
@@ -0,0 +1,103 @@
+import json
+import os
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TextIO
+from . import Vector
+
+@dataclass(frozen=True)
+class EpochState:
+	epoch: int
+	parameters: Vector
+	gradient_norm: float
+	loss: float
+	started: float
+	seconds: float
+
+	def to_json(self) -> dict:
+		return {
+			'epoch': self.epoch,
+			'thetas': self.parameters.to_list(),
+			'gradient_norm': self.gradient_norm,
+			'loss': self.loss,
+			'seconds': self.seconds,
+		}
+
+class TrainingCallback:
+	def on_epoch_start(self, epoch: int, parameters: Vector) -> None:
+		pass
+
+	def on_epoch_end(self, state: EpochState) -> None:
+		pass
+
+	def on_train_end(self, state: EpochState | None) -> None:
+		pass
+
+class ThrottledCallback(TrainingCallback, ABC):
+	def __init__(self, every: int = 1, min_interval: float = 0.0) -> None:
+		if every <= 0:
+			raise ValueError('Reporting interval must be positive')
+		if min_interval < 0:
+			raise ValueError('Minimum reporting interval must not be negative')
+		self._every = every
+		self._min_interval = min_interval
+		self._last_report = -float('inf')
+		self._last_epoch = 0
+
+	def on_epoch_end(self, state: EpochState) -> None:
+		if state.epoch % self._every != 0:
+			return
+		now = time.perf_counter()
+		if now - self._last_report < self._min_interval:
+			return
+		self._last_report = now
+		self._last_epoch = state.epoch
+		self.report(state)
+
+	def on_train_end(self, state: EpochState | None) -> None:
+		if state is not None and state.epoch != self._last_epoch:
+			self.report(state)
+		self.close()
+
+	@abstractmethod
+	def report(self, state: EpochState) -> None:
+		pass
+
+	def close(self) -> None:
+		pass
+
+class JsonlTraceWriter(ThrottledCallback):
+	def __init__(self, path: Path | str, every: int = 1, min_interval: float = 0.0) -> None:
+		super().__init__(every, min_interval)
+		self._path = Path(path)
+		self._file: TextIO | None = None
+
+	def report(self, state: EpochState) -> None:
+		if self._file is None:
+			self._path.parent.mkdir(parents=True, exist_ok=True)
+			self._file = self._path.open('w', encoding='utf-8', buffering=1 << 16)
+		self._file.write(json.dumps(state.to_json()) + '\n')
+
+	def close(self) -> None:
+		if self._file is not None:
+			self._file.close()
+			self._file = None
+
+class ChromeTraceWriter(ThrottledCallback):
+	def __init__(self, path: Path | str, every: int = 1, min_interval: float = 0.0) -> None:
+		super().__init__(every, min_interval)
+		self._path = Path(path)
+		self._events: list[dict] = []
+
+	def report(self, state: EpochState) -> None:
+		timestamp = state.started * 1e6
+		self._events.append({'name': f'epoch {state.epoch}', 'cat': 'train', 'ph': 'X', 'ts': timestamp, 'dur': state.seconds * 1e6, 'pid': os.getpid(), 'tid': 0, 'args': state.to_json()})
+		self._events.append({'name': 'loss', 'cat': 'train', 'ph': 'C', 'ts': timestamp, 'pid': os.getpid(), 'args': {'loss': state.loss, 'gradient_norm': state.gradient_norm}})
+
+	def close(self) -> None:
+		self._path.parent.mkdir(parents=True, exist_ok=True)
+		with self._path.open('w', encoding='utf-8') as f:
+			json.dump({'traceEvents': self._events, 'displayTimeUnit': 'ms'}, f)
+		self._events = []
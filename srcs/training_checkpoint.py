@@ -0,0 +1,129 @@
+import hashlib
+import json
+import os
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from . import Dataset, Vector
+
+DEFAULT_CHECKPOINT_EVERY = 100
+
+def dataset_fingerprint(chunks: Iterable[Dataset]) -> str:
+	digest = hashlib.sha256()
+	count = 0
+	for chunk in chunks:
+		digest.update(f'{chunk.feature_name}\0{chunk.target_name}\0'.encode('utf-8'))
+		digest.update(chunk.features.buffer())
+		digest.update(chunk.targets.buffer())
+		count += chunk.size
+	return f'{count}:{digest.hexdigest()}'
+
+@dataclass
+class TrainingCheckpoint:
+	epoch: int
+	parameters: Vector
+	loss: float
+	previous_loss: float
+	streak: int
+	scaler_mean: float
+	scaler_std: float
+	optimizer_state: dict
+	rng_state: list | None
+	fingerprint: str
+	settings: dict
+	every: int | None = None
+	interval: float | None = None
+
+	@classmethod
+	def from_file(cls, path: Path | str) -> 'TrainingCheckpoint':
+		with Path(path).open('r', encoding='utf-8') as f:
+			data = json.load(f)
+		return cls(
+			epoch=int(data['epoch']),
+			parameters=Vector(data['parameters']),
+			loss=float(data['loss']),
+			previous_loss=float(data['previous_loss']),
+			streak=int(data['streak']),
+			scaler_mean=float(data['scaler']['mean']),
+			scaler_std=float(data['scaler']['std']),
+			optimizer_state=data['optimizer_state'],
+			rng_state=data['rng_state'],
+			fingerprint=str(data['fingerprint']),
+			settings=data['settings'],
+			every=data.get('every'),
+			interval=data.get('interval')
+		)
+
+	def to_json(self) -> dict:
+		return {
+			'epoch': self.epoch,
+			'parameters': self.parameters.to_list(),
+			'loss': self.loss,
+			'previous_loss': self.previous_loss,
+			'streak': self.streak,
+			'scaler': {'mean': self.scaler_mean, 'std': self.scaler_std},
+			'optimizer_state': self.optimizer_state,
+			'rng_state': self.rng_state,
+			'fingerprint': self.fingerprint,
+			'settings': self.settings,
+			'every': self.every,
+			'interval': self.interval
+		}
+
+	def save(self, path: Path | str) -> None:
+		p = Path(path)
+		p.parent.mkdir(parents=True, exist_ok=True)
+		temporary = p.with_name(f'.{p.name}.{os.getpid()}.tmp')
+		with temporary.open('w', encoding='utf-8') as f:
+			json.dump(self.to_json(), f)
+			f.flush()
+			os.fsync(f.fileno())
+		os.replace(temporary, p)
+
+class Checkpointer:
+	def __init__(self, path: Path | str, every: int | None = None, interval: float | None = None) -> None:
+		if every is not None and every <= 0:
+			raise ValueError('Checkpoint interval in epochs must be positive')
+		if interval is not None and interval <= 0:
+			raise ValueError('Checkpoint interval in seconds must be positive')
+		self._path = Path(path)
+		self._every = every
+		self._interval = interval
+		self._last_save = time.monotonic()
+
+	@property
+	def path(self) -> Path:
+		return self._path
+
+	@property
+	def every(self) -> int | None:
+		return self._every
+
+	@property
+	def interval(self) -> float | None:
+		return self._interval
+
+	def due(self, epoch: int) -> bool:
+		# Without an explicit cadence, checkpoint every DEFAULT_CHECKPOINT_EVERY epochs
+		every = DEFAULT_CHECKPOINT_EVERY if self._every is None and self._interval is None else self._every
+		if every is not None and epoch % every == 0:
+			return True
+		return self._interval is not None and time.monotonic() - self._last_save >= self._interval
+
+	def save(self, checkpoint: TrainingCheckpoint) -> None:
+		checkpoint.every, checkpoint.interval = self._every, self._interval
+		checkpoint.save(self._path)
+		self._last_save = time.monotonic()
+
+	def load(self) -> TrainingCheckpoint | None:
+		if not self._path.exists():
+			return None
+		checkpoint = TrainingCheckpoint.from_file(self._path)
+		# A resumed run keeps checkpointing at the cadence of the run it continues
+		if self._every is None and self._interval is None:
+			self._every, self._interval = checkpoint.every, checkpoint.interval
+		return checkpoint
+
+	def clear(self) -> None:
+		self._path.unlink(missing_ok=True)
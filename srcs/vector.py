@@ -1,49 +1,150 @@
-
+import math
+import operator
+from array import array
 from collections.abc import Callable, Iterable
+from typing import overload
+
+def _python_sumprod(a: Iterable[float], b: Iterable[float]) -> float:
+	return sum(map(operator.mul, a, b))
+
+_sumprod = getattr(math, 'sumprod', _python_sumprod)
 
 class Vector:
 	def __init__(self, values: Iterable[float] | None = None) -> None:
-		self._values = [float(v) for v in values] if values else []
-
-	def _zip_values(self, other: 'Vector') -> Iterable[tuple[float, float]]:
+		self._values = self._coerce(values) if values is not None else array('d')
+
+	@staticmethod
+	def _coerce(values: Iterable[float]) -> array:
+		if isinstance(values, Vector):
+			values = values._values
+		if isinstance(values, array) and values.typecode == 'd':
+			return array('d', values)
+		if isinstance(values, memoryview) and values.format == 'd':
+			result = array('d')
+			result.frombytes(values)
+			return result
+		return array('d', map(float, values))
+
+	@classmethod
+	def _wrap(cls, values: array | memoryview) -> 'Vector':
+		vector = cls.__new__(cls)
+		vector._values = values
+		return vector
+
+	def __reduce__(self):
+		# Views over mapped files or NumPy arrays cannot be pickled: ship an owned array instead
+		values = self._values if isinstance(self._values, array) else array('d', self._values.tobytes())
+		return self.__class__._wrap, (values,)
+
+	@classmethod
+	def from_buffer(cls, buffer) -> 'Vector':
+		view = memoryview(buffer)
+		if view.format != 'd':
+			view = view.cast('B').cast('d')
+		return cls._wrap(view)
+
+	@classmethod
+	def zeros(cls, length: int) -> 'Vector':
+		return cls._wrap(array('d', bytes(8 * length)))
+
+	def _check_length(self, other: 'Vector') -> None:
 		if len(self) != len(other):
 			raise ValueError('Vectors must have the same length')
+
+	def _zip_values(self, other: 'Vector') -> Iterable[tuple[float, float]]:
+		self._check_length(other)
 		return zip(self._values, other._values)
 
 	def clone(self) -> 'Vector':
 		return Vector(self._values)
 
 	def dot(self, other: 'Vector') -> float:
-		return sum(a * b for a, b in self._zip_values(other))
+		self._check_length(other)
+		return _sumprod(self._values, other._values)
+
+	def squared_distance(self, other: 'Vector') -> float:
+		self._check_length(other)
+		return sum((a - b) * (a - b) for a, b in zip(self._values, other._values))
+
+	def sum_of_squares(self) -> float:
+		return _sumprod(self._values, self._values)
+
+	def take(self, indices: Iterable[int]) -> 'Vector':
+		values = self._values
+		return Vector._wrap(array('d', [values[index] for index in indices]))
 
 	def map(self, func: Callable[[float], float]) -> 'Vector':
-		return Vector(func(v) for v in self._values)
+		return Vector._wrap(array('d', map(func, self._values)))
+
+	def affine(self, scale: float, offset: float) -> 'Vector':
+		scale, offset = float(scale), float(offset)
+		return Vector._wrap(array('d', [offset + scale * value for value in self._values]))
 
 	def square(self) -> 'Vector':
-		return Vector(value * value for value in self._values)
+		return Vector._wrap(array('d', map(operator.mul, self._values, self._values)))
 
 	def sum(self) -> float:
 		return sum(self._values)
 
+	def buffer(self) -> memoryview:
+		return memoryview(self._values)
+
 	def to_list(self) -> list[float]:
-		return list(self._values)
+		return self._values.tolist()
+
+	def to_bytes(self) -> bytes:
+		return self._values.tobytes()
+
+	def isub(self, other: 'Vector') -> 'Vector':
+		self._check_length(other)
+		values = self._values
+		for index, value in enumerate(other._values):
+			values[index] -= value
+		return self
+
+	def imul(self, scalar: float) -> 'Vector':
+		values = self._values
+		scalar = float(scalar)
+		for index, value in enumerate(values):
+			values[index] = value * scalar
+		return self
+
+	def axpy(self, alpha: float, other: 'Vector') -> 'Vector':
+		self._check_length(other)
+		values = self._values
+		alpha = float(alpha)
+		for index, value in enumerate(other._values):
+			values[index] += alpha * value
+		return self
 
 	def __add__(self, other: 'Vector') -> 'Vector':
-		return Vector(a + b for a, b in self._zip_values(other))
+		self._check_length(other)
+		return Vector._wrap(array('d', map(operator.add, self._values, other._values)))
 
 	def __sub__(self, other: 'Vector') -> 'Vector':
-		return Vector(a - b for a, b in self._zip_values(other))
+		self._check_length(other)
+		return Vector._wrap(array('d', map(operator.sub, self._values, other._values)))
 
 	def __mul__(self, scalar: float) -> 'Vector':
-		return Vector(a * scalar for a in self._values)
+		scalar = float(scalar)
+		return Vector._wrap(array('d', [a * scalar for a in self._values]))
 
 	def __rmul__(self, scalar: float) -> 'Vector':
 		return self.__mul__(scalar)
 
 	def __truediv__(self, scalar: float) -> 'Vector':
-		return Vector(a / scalar for a in self._values)
+		scalar = float(scalar)
+		return Vector._wrap(array('d', [a / scalar for a in self._values]))
+
+	@overload
+	def __getitem__(self, index: int) -> float: ...
+
+	@overload
+	def __getitem__(self, index: slice) -> 'Vector': ...
 
-	def __getitem__(self, index: int) -> float:
+	def __getitem__(self, index: int | slice) -> 'float | Vector':
+		if isinstance(index, slice):
+			return Vector._wrap(self._values[index])
 		return self._values[index]
 
 	def __iter__(self):
@@ -53,4 +154,4 @@ class Vector:
 		return len(self._values)
 
 	def __repr__(self) -> str:
-		return f"Vector({self._values!r})"
+		return f"Vector({self.to_list()!r})"
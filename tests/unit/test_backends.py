@@ -0,0 +1,92 @@
+import random
+import unittest
+from importlib.util import find_spec
+from srcs import ClosedFormTrainer, Dataset, FeatureScaler, GradientDescentTrainer, LinearRegressionModel, ModelEvaluator, NumpyBackend, PythonBackend, SufficientStatistics, Vector, get_backend, set_backend
+from srcs.backends import available_backends
+
+def _dataset(size: int, seed: int = 7) -> Dataset:
+	rng = random.Random(seed)
+	features = [rng.uniform(0.0, 250_000.0) for _ in range(size)]
+	targets = [8_500.0 - 0.021 * x + rng.gauss(0.0, 600.0) for x in features]
+	return Dataset(features, targets, 'km', 'price')
+
+class TestBackendSelection(unittest.TestCase):
+	def tearDown(self) -> None:
+		set_backend('python')
+
+	def test_python_is_the_default(self) -> None:
+		self.assertIsInstance(get_backend(), PythonBackend)
+		self.assertEqual(get_backend().name, 'python')
+		self.assertIn('python', available_backends())
+
+	def test_unknown_backend_raises(self) -> None:
+		with self.assertRaises(ValueError):
+			set_backend('fortran')
+
+@unittest.skipUnless(find_spec('numpy'), 'NumPy is not installed')
+class TestBackendParity(unittest.TestCase):
+	def setUp(self) -> None:
+		self.python = PythonBackend()
+		# A tiny block size exercises the cross-block merges
+		self.numpy = NumpyBackend(block_size=37)
+		self.dataset = _dataset(1000)
+
+	def tearDown(self) -> None:
+		set_backend('python')
+
+	def assertStatesClose(self, first: tuple, second: tuple) -> None:
+		self.assertEqual(len(first), len(second))
+		for a, b in zip(first, second):
+			self.assertAlmostEqual(a, b, delta=1e-9 * max(abs(a), abs(b), 1.0))
+
+	def test_epoch_sums(self) -> None:
+		arguments = (self.dataset.features, self.dataset.targets, 1200.0, -35.0, 120_000.0, 70_000.0)
+		self.assertStatesClose(self.numpy.epoch_sums(*arguments), self.python.epoch_sums(*arguments))
+
+	def test_update_moments_continues_from_state(self) -> None:
+		state = self.python.update_moments((0, 0.0, 0.0), self.dataset.features[:300])
+		expected = self.python.update_moments(state, self.dataset.features[300:])
+		self.assertStatesClose(self.numpy.update_moments(state, self.dataset.features[300:]), expected)
+
+	def test_update_co_moments_continues_from_state(self) -> None:
+		state = self.python.update_co_moments((0, 0.0, 0.0, 0.0, 0.0, 0.0), self.dataset.features[:300], self.dataset.targets[:300])
+		expected = self.python.update_co_moments(state, self.dataset.features[300:], self.dataset.targets[300:])
+		self.assertStatesClose(self.numpy.update_co_moments(state, self.dataset.features[300:], self.dataset.targets[300:]), expected)
+
+	def test_update_co_moment_matrix_continues_from_state(self) -> None:
+		columns = [self.dataset.features, self.dataset.targets, self.dataset.features.affine(-2.0, 5.0)]
+		state = self.python.update_co_moment_matrix((0, [0.0] * 3, [0.0] * 9), [column[:300] for column in columns])
+		expected = self.python.update_co_moment_matrix(state, [column[300:] for column in columns])
+		n, means, comoments = self.numpy.update_co_moment_matrix(state, [column[300:] for column in columns])
+		self.assertEqual(n, expected[0])
+		self.assertStatesClose(tuple(means), tuple(expected[1]))
+		self.assertStatesClose(tuple(comoments), tuple(expected[2]))
+
+	def test_update_residuals(self) -> None:
+		arguments = ((0, 0.0, 0.0, 0.0, 0.0), self.dataset.features, self.dataset.targets, 8_400.0, -0.02)
+		self.assertStatesClose(self.numpy.update_residuals(*arguments), self.python.update_residuals(*arguments))
+
+	def test_affine(self) -> None:
+		expected = self.python.affine(self.dataset.features, -0.021, 8_500.0).to_list()
+		self.assertStatesClose(tuple(self.numpy.affine(self.dataset.features, -0.021, 8_500.0)), tuple(expected))
+		self.assertEqual(len(self.numpy.affine(Vector(), 2.0, 1.0)), 0)
+
+	def test_lists_fall_back_to_python_loops(self) -> None:
+		values = [1.0, 2.0, 4.0]
+		self.assertEqual(self.numpy.update_moments((0, 0.0, 0.0), values), self.python.update_moments((0, 0.0, 0.0), values))
+
+	def test_training_and_evaluation_match(self) -> None:
+		results = {}
+		for name in ('python', 'numpy'):
+			set_backend(name)
+			scaler = FeatureScaler.from_vector(self.dataset.features)
+			statistics = SufficientStatistics.from_vectors(self.dataset.features, self.dataset.targets)
+			exact = ClosedFormTrainer(LinearRegressionModel()).train(self.dataset)
+			approx = GradientDescentTrainer(LinearRegressionModel(), 0.5, 64, True, 3, progress=False).train(self.dataset, 20)
+			metrics = ModelEvaluator().evaluate(self.dataset, approx)
+			predictions = LinearRegressionModel(exact).predict_vector(self.dataset.features)
+			results[name] = (scaler.mean, scaler.std, *statistics.to_json().values(), *exact, *approx, *metrics.values(), predictions.sum())
+		self.assertStatesClose(results['numpy'], results['python'])
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,54 @@
+import io
+import unittest
+from srcs import BatchPredictor, LinearRegressionModel, Vector
+
+class TestBatchPredictor(unittest.TestCase):
+	def test_predict_csv_scores_selected_column(self) -> None:
+		predictor = BatchPredictor(LinearRegressionModel(Vector([1.0, 2.0])), chunk_size=2)
+		source = io.StringIO('a,km\n9,0\n9,1.5\n9,3\n')
+		sink = io.StringIO()
+		count = predictor.predict_csv(source, sink, 'km', 'price')
+		self.assertEqual(count, 3)
+		self.assertEqual(sink.getvalue(), 'km,price\n0,1.0\n1.5,4.0\n3,7.0\n')
+
+	def test_predict_csv_defaults_to_first_column(self) -> None:
+		predictor = BatchPredictor(LinearRegressionModel(Vector([0.0, 1.0])))
+		sink = io.StringIO()
+		predictor.predict_csv(io.StringIO('x,y\n2,0\n'), sink)
+		self.assertEqual(sink.getvalue(), 'x,prediction\n2,2.0\n')
+
+	def test_predict_csv_raises_on_unknown_column(self) -> None:
+		predictor = BatchPredictor(LinearRegressionModel())
+		with self.assertRaises(ValueError):
+			predictor.predict_csv(io.StringIO('x\n1\n'), io.StringIO(), 'missing')
+
+	def test_predict_csv_raises_on_empty_input(self) -> None:
+		with self.assertRaises(ValueError):
+			BatchPredictor(LinearRegressionModel()).predict_csv(io.StringIO(''), io.StringIO())
+
+	def test_predict_csv_raises_on_invalid_rows(self) -> None:
+		predictor = BatchPredictor(LinearRegressionModel())
+		with self.assertRaises(ValueError):
+			predictor.predict_csv(io.StringIO('x,y\n1,2\n3\n'), io.StringIO(), 'y')
+		with self.assertRaises(ValueError):
+			predictor.predict_csv(io.StringIO('x\nabc\n'), io.StringIO())
+
+	def test_predict_csv_skips_blank_lines(self) -> None:
+		sink = io.StringIO()
+		count = BatchPredictor(LinearRegressionModel(), chunk_size=1).predict_csv(io.StringIO('x\n1\n\n2\n\n'), sink)
+		self.assertEqual(count, 2)
+		self.assertEqual(sink.getvalue().splitlines()[1:], ['1,0.0', '2,0.0'])
+
+	def test_predict_csv_errors_name_the_line(self) -> None:
+		predictor = BatchPredictor(LinearRegressionModel())
+		with self.assertRaisesRegex(ValueError, r'^Row 4: invalid number \'abc\''):
+			predictor.predict_csv(io.StringIO('x\n1\n\nabc\n'), io.StringIO())
+		with self.assertRaisesRegex(ValueError, '^Row 3: missing value'):
+			predictor.predict_csv(io.StringIO('x,y\n1,2\n3\n'), io.StringIO(), 'y')
+
+	def test_invalid_chunk_size_raises(self) -> None:
+		with self.assertRaises(ValueError):
+			BatchPredictor(LinearRegressionModel(), chunk_size=0)
+
+if __name__ == '__main__':
+	unittest.main()
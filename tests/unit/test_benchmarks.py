@@ -0,0 +1,63 @@
+import unittest
+from benchmarks.compression import run as run_compression
+from benchmarks.convergence import epochs_table, run as run_convergence
+from benchmarks.suite import BenchmarkCase, BenchmarkResult, BenchmarkSuite, compare, synthetic_dataset, to_json
+
+class TestBenchmarks(unittest.TestCase):
+	def test_synthetic_dataset_is_deterministic(self) -> None:
+		first = synthetic_dataset(50, seed=1)
+		second = synthetic_dataset(50, seed=1)
+		self.assertEqual(first.features.to_list(), second.features.to_list())
+		self.assertEqual(first.targets.to_list(), second.targets.to_list())
+		self.assertNotEqual(first.features.to_list(), synthetic_dataset(50, seed=2).features.to_list())
+
+	def test_run_reports_throughput_and_memory(self) -> None:
+		results = BenchmarkSuite(sizes=(200,), repeat=1).run({'vector_ops', 'trainer_epoch'})
+		self.assertEqual([result.name for result in results], ['vector_ops', 'trainer_epoch'])
+		for result in results:
+			self.assertEqual(result.rows, 200)
+			self.assertGreater(result.rows_per_second, 0)
+			self.assertGreaterEqual(result.peak_memory_bytes, 0)
+
+	def test_compare_flags_only_regressions_past_threshold(self) -> None:
+		baseline = to_json([BenchmarkResult('a', 10, 1.0, 1000.0, 0), BenchmarkResult('b', 10, 1.0, 1000.0, 0)])
+		results = [BenchmarkResult('a', 10, 1.0, 800.0, 0), BenchmarkResult('b', 10, 1.0, 700.0, 0), BenchmarkResult('c', 10, 1.0, 1.0, 0)]
+		regressions = compare(results, baseline, threshold=0.25)
+		self.assertEqual(len(regressions), 1)
+		self.assertTrue(regressions[0].startswith('b@10'))
+
+	def test_compare_flags_peak_memory_growth(self) -> None:
+		baseline = to_json([BenchmarkResult('a', 10, 1.0, 1000.0, 1000), BenchmarkResult('b', 10, 1.0, 1000.0, 1000)])
+		results = [BenchmarkResult('a', 10, 1.0, 1000.0, 1200), BenchmarkResult('b', 10, 1.0, 1000.0, 1300)]
+		regressions = compare(results, baseline, threshold=0.25)
+		self.assertEqual(len(regressions), 1)
+		self.assertTrue(regressions[0].startswith('b@10: peak memory'))
+
+	def test_run_lists_cases_skipped_by_max_rows(self) -> None:
+		suite = BenchmarkSuite(sizes=(200,), repeat=1, cases=(BenchmarkCase('capped', lambda dataset, directory: lambda: None, max_rows=100),))
+		self.assertEqual(suite.run(), [])
+		self.assertEqual(suite.skipped, ['capped@200: above max_rows=100'])
+		self.assertEqual(to_json([], suite.skipped)['skipped'], suite.skipped)
+
+	def test_convergence_reports_epochs_per_learning_rate(self) -> None:
+		results = run_convergence({'tiny': synthetic_dataset(200)}, learning_rates=(0.1, 1.0), epochs=300)
+		table = epochs_table(results)['tiny']
+		self.assertEqual(set(table['sgd/constant']), {'0.1', '1'})
+		self.assertLessEqual(table['sgd/constant']['1'], 3)
+		self.assertIn('line-search/constant', table)
+		self.assertIn('sgd/cosine', table)
+
+	def test_compression_reports_every_format_against_plain_csv(self) -> None:
+		results = run_compression(rows=200, repeat=1, formats=('csv', 'gz'))
+		self.assertEqual([(result.format, result.prefetch > 0) for result in results], [('csv', True), ('gz', False), ('gz', True)])
+		for result in results:
+			self.assertEqual(result.rows, 200)
+			self.assertGreater(result.relative_throughput, 0)
+		self.assertLess(results[1].file_bytes, results[0].file_bytes)
+
+	def test_invalid_repeat_raises(self) -> None:
+		with self.assertRaises(ValueError):
+			BenchmarkSuite(repeat=0)
+
+if __name__ == '__main__':
+	unittest.main()
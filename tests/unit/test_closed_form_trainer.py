@@ -0,0 +1,56 @@
+import unittest
+from srcs import ClosedFormTrainer, Dataset, GradientDescentTrainer, LinearRegressionModel
+
+class TestClosedFormTrainer(unittest.TestCase):
+	def test_training_recovers_exact_parameters(self) -> None:
+		dataset = Dataset([0.0, 1.0, 2.0, 3.0], [3.0, 5.0, 7.0, 9.0], 'x', 'y')
+		model = LinearRegressionModel()
+		parameters = ClosedFormTrainer(model).train(dataset)
+		self.assertAlmostEqual(parameters[0], 3.0, places=10)
+		self.assertAlmostEqual(parameters[1], 2.0, places=10)
+		self.assertEqual(model.parameters.to_list(), parameters.to_list())
+
+	def test_training_matches_gradient_descent(self) -> None:
+		dataset = Dataset([1.0, 2.0, 4.0, 7.0, 11.0], [2.5, 3.0, 6.5, 8.0, 14.0], 'x', 'y')
+		exact = ClosedFormTrainer(LinearRegressionModel()).train(dataset)
+		approx = GradientDescentTrainer(LinearRegressionModel(), 0.1).train(dataset, 2000)
+		self.assertAlmostEqual(exact[0], approx[0], places=6)
+		self.assertAlmostEqual(exact[1], approx[1], places=6)
+
+	def test_training_handles_constant_feature(self) -> None:
+		dataset = Dataset([5.0, 5.0, 5.0], [9.0, 10.0, 11.0], 'x', 'y')
+		parameters = ClosedFormTrainer(LinearRegressionModel()).train(dataset)
+		self.assertAlmostEqual(parameters[0], 10.0, places=10)
+		self.assertEqual(parameters[1], 0.0)
+
+	def test_training_is_stable_with_large_offsets(self) -> None:
+		offset = 1e9
+		dataset = Dataset([offset + x for x in (0.0, 1.0, 2.0, 3.0)], [1.0, 3.0, 5.0, 7.0], 'x', 'y')
+		parameters = ClosedFormTrainer(LinearRegressionModel()).train(dataset)
+		self.assertAlmostEqual(parameters[1], 2.0, places=6)
+
+	def test_train_chunks_matches_train(self) -> None:
+		features = [1.0, 2.0, 4.0, 7.0, 11.0]
+		targets = [2.5, 3.0, 6.5, 8.0, 14.0]
+		expected = ClosedFormTrainer(LinearRegressionModel()).train(Dataset(features, targets, 'x', 'y'))
+		chunks = [Dataset(features[:2], targets[:2], 'x', 'y'), Dataset(features[2:], targets[2:], 'x', 'y')]
+		parameters = ClosedFormTrainer(LinearRegressionModel()).train_chunks(chunks)
+		self.assertAlmostEqual(parameters[0], expected[0], places=10)
+		self.assertAlmostEqual(parameters[1], expected[1], places=10)
+
+	def test_training_from_stored_statistics_matches_full_retrain(self) -> None:
+		features = [0.3 * i + (i % 7) for i in range(50)]
+		targets = [4.0 - 1.7 * x + (i % 5) * 0.1 for i, x in enumerate(features)]
+		history = Dataset(features[:30], targets[:30], 'x', 'y')
+		new_rows = Dataset(features[30:], targets[30:], 'x', 'y')
+		first = ClosedFormTrainer(LinearRegressionModel())
+		first.train(history)
+		updated = ClosedFormTrainer(LinearRegressionModel())
+		parameters = updated.train(new_rows, first.statistics)
+		full = ClosedFormTrainer(LinearRegressionModel())
+		self.assertEqual(parameters.to_list(), full.train(Dataset(features, targets, 'x', 'y')).to_list())
+		self.assertEqual(updated.statistics.to_json(), full.statistics.to_json())
+		self.assertEqual(first.statistics.count, 30)
+
+if __name__ == '__main__':
+	unittest.main()
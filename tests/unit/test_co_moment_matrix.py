@@ -0,0 +1,49 @@
+import unittest
+from srcs import CoMomentMatrix, SufficientStatistics, Vector
+
+class TestCoMomentMatrix(unittest.TestCase):
+	def setUp(self) -> None:
+		self.columns = [Vector([1.0, 2.0, 4.0, 7.0, 11.0]), Vector([3.0, 1.0, 4.0, 1.0, 5.0]), Vector([2.0, 7.0, 1.0, 8.0, 2.0])]
+
+	def assertStatisticsClose(self, first: SufficientStatistics, second: SufficientStatistics) -> None:
+		self.assertEqual(first.count, second.count)
+		for name in ('mean_x', 'mean_y', 'm2_x', 'm2_y', 'c_xy'):
+			self.assertAlmostEqual(getattr(first, name), getattr(second, name), places=9)
+
+	def test_pair_statistics_match_sufficient_statistics(self) -> None:
+		matrix = CoMomentMatrix(['a', 'b', 'c']).update_columns(self.columns)
+		names = {'a': 0, 'b': 1, 'c': 2}
+		for feature in names:
+			for target in names:
+				if feature != target:
+					with self.subTest(feature=feature, target=target):
+						expected = SufficientStatistics.from_vectors(self.columns[names[feature]], self.columns[names[target]])
+						self.assertStatisticsClose(matrix.statistics(feature, target), expected)
+		self.assertEqual(matrix.comoment('a', 'b'), matrix.comoment('b', 'a'))
+
+	def test_merge_matches_single_pass(self) -> None:
+		expected = CoMomentMatrix(['a', 'b', 'c']).update_columns(self.columns)
+		left = CoMomentMatrix(['a', 'b', 'c']).update_columns([column[:2] for column in self.columns])
+		right = CoMomentMatrix(['a', 'b', 'c']).update_columns([column[2:] for column in self.columns])
+		merged = left.copy().merge(right)
+		self.assertEqual(left.count, 2)
+		self.assertStatisticsClose(merged.statistics('c', 'a'), expected.statistics('c', 'a'))
+		self.assertStatisticsClose(CoMomentMatrix(['a', 'b', 'c']).merge(merged).statistics('b', 'c'), expected.statistics('b', 'c'))
+
+	def test_invalid_inputs_raise(self) -> None:
+		with self.assertRaises(ValueError):
+			CoMomentMatrix(['a', 'a'])
+		with self.assertRaises(ValueError):
+			CoMomentMatrix(['a', 'b'], 1, [0.0], [0.0] * 4)
+		matrix = CoMomentMatrix(['a', 'b'])
+		with self.assertRaises(ValueError):
+			matrix.update_columns(self.columns)
+		with self.assertRaises(ValueError):
+			matrix.update_columns([Vector([1.0]), Vector([1.0, 2.0])])
+		with self.assertRaises(ValueError):
+			matrix.merge(CoMomentMatrix(['a', 'c']))
+		with self.assertRaises(ValueError):
+			matrix.mean('z')
+
+if __name__ == '__main__':
+	unittest.main()
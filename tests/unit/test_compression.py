@@ -0,0 +1,92 @@
+import bz2
+import gzip
+import lzma
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from srcs import Dataset, DatasetStream, ParallelCsvLoader, PairwiseTrainer
+from srcs.compression import BackgroundDecompressor, detect_compression, open_text
+
+TEXT = 'km,price,note\n' + ''.join(f'{i * 1000},{8500 - i * 21.5},"car {i}"\n' for i in range(300))
+FORMATS = {'gz': (gzip, 'gzip'), 'bz2': (bz2, 'bz2'), 'xz': (lzma, 'lzma')}
+
+class TestCompression(unittest.TestCase):
+	def setUp(self) -> None:
+		self._directory = TemporaryDirectory()
+		self.directory = Path(self._directory.name)
+		self.plain = self.directory / 'data.csv'
+		self.plain.write_text(TEXT, encoding='utf-8')
+		self.compressed = {}
+		for suffix, (module, _) in FORMATS.items():
+			path = self.directory / f'data.csv.{suffix}'
+			with module.open(path, 'wt', encoding='utf-8', newline='') as f:
+				f.write(TEXT)
+			self.compressed[suffix] = path
+
+	def tearDown(self) -> None:
+		self._directory.cleanup()
+
+	def test_detects_compression_from_magic_bytes(self) -> None:
+		self.assertIsNone(detect_compression(self.plain))
+		for suffix, (_, name) in FORMATS.items():
+			renamed = self.compressed[suffix].with_suffix('.bin')
+			self.compressed[suffix].rename(renamed)
+			self.assertEqual(detect_compression(renamed), name)
+
+	def test_open_text_decodes_with_and_without_prefetch(self) -> None:
+		for suffix, path in self.compressed.items():
+			for prefetch in (0, 2):
+				with self.subTest(suffix=suffix, prefetch=prefetch), open_text(path, read_size=64, prefetch=prefetch) as f:
+					self.assertEqual(f.read(), TEXT)
+
+	def test_loaders_match_uncompressed_input(self) -> None:
+		expected = Dataset.from_csv(self.plain, 'km', 'price')
+		for suffix, path in self.compressed.items():
+			with self.subTest(suffix=suffix):
+				loaded = [
+					Dataset.from_csv(path, 'km', 'price'),
+					ParallelCsvLoader(workers=3, min_range_size=64).load(path, 'km', 'price'),
+				]
+				for dataset in loaded:
+					self.assertEqual(dataset.features.to_list(), expected.features.to_list())
+					self.assertEqual(dataset.targets.to_list(), expected.targets.to_list())
+				chunks = list(DatasetStream(path, 'km', 'price', chunk_size=128))
+				self.assertEqual([chunk.size for chunk in chunks], [128, 128, 44])
+				self.assertEqual([x for chunk in chunks for x in chunk.features], expected.features.to_list())
+				fits = PairwiseTrainer(['km', 'price'], workers=2, min_range_size=64).train(path)
+				self.assertAlmostEqual(fits[0].parameters[1], PairwiseTrainer(['km', 'price']).train(self.plain)[0].parameters[1], places=12)
+
+	def test_validation_errors_are_unchanged(self) -> None:
+		for suffix, path in self.compressed.items():
+			with self.subTest(suffix=suffix):
+				with self.assertRaises(ValueError) as expected:
+					Dataset.from_csv(self.plain, 'km', 'missing')
+				with self.assertRaises(ValueError) as actual:
+					Dataset.from_csv(path, 'km', 'missing')
+				self.assertEqual(str(actual.exception), str(expected.exception))
+				with self.assertRaises(ValueError):
+					Dataset.from_csv(path, 'km', 'note')
+
+	def test_corrupt_stream_raises(self) -> None:
+		path = self.directory / 'broken.csv.gz'
+		path.write_bytes(self.compressed['gz'].read_bytes()[:200])
+		with self.assertRaises(EOFError):
+			Dataset.from_csv(path)
+
+	def test_close_stops_the_background_thread(self) -> None:
+		reader = BackgroundDecompressor(self.compressed['xz'], 'lzma', read_size=16, prefetch=1)
+		self.assertEqual(reader.read(4), b'km,p')
+		reader.close()
+		self.assertFalse(reader._thread.is_alive())
+		self.assertTrue(reader.closed)
+
+	def test_invalid_settings_raise(self) -> None:
+		with self.assertRaises(ValueError):
+			BackgroundDecompressor(self.compressed['gz'], 'gzip', read_size=0)
+		with self.assertRaises(ValueError):
+			BackgroundDecompressor(self.compressed['gz'], 'gzip', prefetch=-1)
+		with self.assertRaises(ValueError):
+			BackgroundDecompressor(self.compressed['gz'], 'zstd')
+
+if __name__ == '__main__':
+	unittest.main()
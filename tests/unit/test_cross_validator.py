@@ -0,0 +1,52 @@
+import unittest
+from srcs import ClosedFormTrainer, CrossValidator, Dataset, LinearRegressionModel, ModelEvaluator
+
+class TestCrossValidator(unittest.TestCase):
+	def setUp(self) -> None:
+		features = [float(i) for i in range(20)]
+		targets = [3.0 + 2.0 * x + (-1.0) ** i * (i % 3) for i, x in enumerate(features)]
+		self.dataset = Dataset(features, targets, 'x', 'y')
+
+	def test_splits_partition_rows_reproducibly(self) -> None:
+		splits = CrossValidator(folds=4, repeats=2, seed=5).splits(10)
+		self.assertEqual(len(splits), 2)
+		for folds in splits:
+			self.assertEqual(sorted(i for fold in folds for i in fold), list(range(10)))
+			self.assertEqual([len(fold) for fold in folds], [2, 3, 2, 3])
+		self.assertEqual(splits, CrossValidator(folds=4, repeats=2, seed=5).splits(10))
+		self.assertNotEqual(splits[0], splits[1])
+
+	def test_folds_match_retraining_from_scratch(self) -> None:
+		validator = CrossValidator(folds=4, seed=1)
+		result = validator.validate(self.dataset)
+		self.assertEqual(len(result.folds), 4)
+		for fold, indices in zip(result.folds, validator.splits(self.dataset.size)[0]):
+			train = [i for i in range(self.dataset.size) if i not in indices]
+			train_set = Dataset(self.dataset.features.take(train), self.dataset.targets.take(train), 'x', 'y')
+			test_set = Dataset(self.dataset.features.take(indices), self.dataset.targets.take(indices), 'x', 'y')
+			parameters = ClosedFormTrainer(LinearRegressionModel()).train(train_set)
+			expected = ModelEvaluator().evaluate(test_set, parameters)
+			self.assertEqual((fold.train_size, fold.test_size), (len(train), len(indices)))
+			self.assertAlmostEqual(fold.parameters[0], parameters[0], places=8)
+			self.assertAlmostEqual(fold.parameters[1], parameters[1], places=8)
+			for metric, value in expected.items():
+				self.assertAlmostEqual(fold.metrics[metric], value, places=8)
+
+	def test_parallel_matches_serial(self) -> None:
+		serial = CrossValidator(folds=5, repeats=2, seed=2).validate(self.dataset)
+		parallel = CrossValidator(folds=5, repeats=2, seed=2, workers=2).validate(self.dataset)
+		self.assertEqual(serial.summary(), parallel.summary())
+		self.assertEqual(len(parallel.folds), 10)
+
+	def test_invalid_settings_raise(self) -> None:
+		with self.assertRaises(ValueError):
+			CrossValidator(folds=1)
+		with self.assertRaises(ValueError):
+			CrossValidator(repeats=0)
+		with self.assertRaises(ValueError):
+			CrossValidator(workers=0)
+		with self.assertRaises(ValueError):
+			CrossValidator(folds=5).validate(Dataset([1.0, 2.0], [1.0, 2.0], 'x', 'y'))
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,72 @@
+import csv
+import io
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from srcs import Dataset
+from srcs.csv_projection import column_index, project_columns
+
+def _reference(path: Path, feature: str | None = None, target: str | None = None) -> tuple[list[float], list[float]]:
+	with path.open(newline='') as f:
+		reader = csv.DictReader(f)
+		feature_name, target_name = Dataset._resolve_columns(reader.fieldnames, feature, target)
+		features, targets = [], []
+		for row in reader:
+			features.append(float(row[feature_name]))
+			targets.append(float(row[target_name]))
+	return features, targets
+
+CASES = [
+	('a,b,c\n1,2,3\n4,5,6\n', ('a', 'b', 'c')),
+	('a,b,c\r\n1,2,3\r\n\r\n4,5,6', ('a', 'b', 'c')),
+	('a,b,c\n"1","2.5","x,y"\n7,8,"multi\nline"\n9,10,11\n', ('a', 'b')),
+	('a,b,c\n 1 ,2 ,3\n4,5,6,7,8\n', ('a', 'b', 'c')),
+	('a,b,a\n1,2,3\n4,5,6\n', ('a', 'b')),
+	('"a","b","c"\n1,"2",3\n', ('a', 'b', 'c')),
+	('a,b,c\n\n\n1,2,3\n\n', ('a', 'b', 'c')),
+]
+
+class TestCsvProjection(unittest.TestCase):
+	def test_matches_dict_reader(self) -> None:
+		with TemporaryDirectory() as td:
+			p = Path(td) / 'data.csv'
+			for text, names in CASES:
+				for columns in zip(names, names[1:] + names[:1]):
+					with self.subTest(text=text, columns=columns):
+						p.write_bytes(text.encode('utf-8'))
+						expected = _reference(p, *columns)
+						dataset = Dataset.from_csv(p, *columns)
+						self.assertEqual((dataset.features.to_list(), dataset.targets.to_list()), expected)
+						chunks = list(Dataset.iter_csv(p, *columns, chunk_size=1))
+						self.assertEqual([chunk.features[0] for chunk in chunks], expected[0])
+
+	def test_right_split_matches_left_split(self) -> None:
+		lines = ['1,2,3,4,5\n', '6,7,8,9\n', '"1,5",2,3,4,5\n', '10,11,12,13,14,15\n']
+		for indices in ((3, 4), (4, 1), (2,)):
+			with self.subTest(indices=indices):
+				self.assertEqual(list(project_columns(lines, indices, width=5)), list(project_columns(lines, indices)))
+		self.assertEqual(list(project_columns(lines, (4, 3), width=5)), [('5', '4'), (None, '9'), ('5', '4'), ('14', '13')])
+
+	def test_quoted_record_consumes_only_its_lines(self) -> None:
+		lines = io.StringIO('1,"a\nb",2\n3,c,4\n', newline='')
+		self.assertEqual(list(project_columns(lines, (0, 2))), [('1', '2'), ('3', '4')])
+
+	def test_column_index_prefers_last_duplicate(self) -> None:
+		self.assertEqual(column_index(['a', 'b', 'a'], 'a'), 2)
+		self.assertEqual(column_index(['a', 'b', 'a'], 'b'), 1)
+
+	def test_raises_same_errors_as_dict_reader(self) -> None:
+		with TemporaryDirectory() as td:
+			p = Path(td) / 'data.csv'
+			cases = ['a,b\n1,x\n', 'a,b\n1\n', 'a,b\n1,\n', 'a,b\n"1",",x"\n', 'a\n1\n', '', 'a,b\n1,2\n,\n']
+			for text in cases:
+				with self.subTest(text=text):
+					p.write_text(text, encoding='utf-8')
+					with self.assertRaises((ValueError, TypeError)) as expected:
+						_reference(p)
+					with self.assertRaises(type(expected.exception)) as actual:
+						Dataset.from_csv(p)
+					self.assertEqual(str(actual.exception), str(expected.exception))
+
+if __name__ == '__main__':
+	unittest.main()
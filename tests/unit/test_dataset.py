@@ -1,11 +1,21 @@
+import copy
+import pickle
 import unittest
-from srcs import Dataset
+from srcs import Dataset, Vector
 
 class TestLinearRegressionDataset(unittest.TestCase):
 	def test_size_matches_input(self) -> None:
 		dataset = Dataset([1.0, 2.0, 3.0], [2.0, 4.0, 6.0], 'feature', 'target')
 		self.assertEqual(dataset.size, 3)
 
+	def test_copies_vector_columns(self) -> None:
+		features, targets = Vector([1.0, 2.0]), Vector([3.0, 4.0])
+		dataset = Dataset(features, targets, 'feature', 'target')
+		features.imul(10.0)
+		targets.axpy(1.0, targets)
+		self.assertEqual(dataset.features.to_list(), [1.0, 2.0])
+		self.assertEqual(dataset.targets.to_list(), [3.0, 4.0])
+
 	def test_raises_on_mismatched_sizes(self) -> None:
 		with self.assertRaises(ValueError):
 			Dataset([1.0, 2.0], [1.0], 'feature', 'target')
@@ -75,5 +85,67 @@ class TestLinearRegressionDataset(unittest.TestCase):
 			self.assertEqual(dataset.features.to_list(), [2.0, 5.0])
 			self.assertEqual(dataset.targets.to_list(), [3.0, 6.0])
 
+	def test_iter_csv_yields_fixed_size_chunks(self) -> None:
+		from tempfile import TemporaryDirectory
+		from pathlib import Path
+		with TemporaryDirectory() as td:
+			p = Path(td) / 'data.csv'
+			p.write_text('a,b,c\n1,2,3\n4,5,6\n7,8,9\n', encoding='utf-8')
+			chunks = list(Dataset.iter_csv(p, feature='c', target='a', chunk_size=2))
+			self.assertEqual([chunk.size for chunk in chunks], [2, 1])
+			self.assertEqual(chunks[0].features.to_list(), [3.0, 6.0])
+			self.assertEqual(chunks[1].targets.to_list(), [7.0])
+			self.assertEqual(chunks[1].feature_name, 'c')
+			self.assertEqual(chunks[1].target_name, 'a')
+
+	def test_iter_csv_validates_like_from_csv(self) -> None:
+		from tempfile import TemporaryDirectory
+		from pathlib import Path
+		with TemporaryDirectory() as td:
+			p = Path(td) / 'data.csv'
+			p.write_text('x,y\n1.0,2.0\n', encoding='utf-8')
+			with self.assertRaises(ValueError):
+				list(Dataset.iter_csv(p, feature='x', target='x'))
+			with self.assertRaises(ValueError):
+				list(Dataset.iter_csv(p, chunk_size=0))
+
+	def test_loaded_datasets_pickle_and_deepcopy(self) -> None:
+		from tempfile import TemporaryDirectory
+		from pathlib import Path
+		with TemporaryDirectory() as td:
+			p = Path(td) / 'data.csv'
+			p.write_text('x,y\n1.0,2.0\n3.0,4.5\n', encoding='utf-8')
+			Dataset.from_csv(p).to_binary(Path(td) / 'data.ftlr')
+			for dataset in (Dataset.from_csv(p), next(Dataset.iter_csv(p)), Dataset.from_binary(Path(td) / 'data.ftlr')):
+				for clone in (pickle.loads(pickle.dumps(dataset)), copy.deepcopy(dataset)):
+					self.assertEqual(clone.features.to_list(), [1.0, 3.0])
+					self.assertEqual(clone.targets.to_list(), [2.0, 4.5])
+					self.assertEqual((clone.feature_name, clone.target_name), ('x', 'y'))
+
+	def test_binary_roundtrip(self) -> None:
+		from tempfile import TemporaryDirectory
+		from pathlib import Path
+		with TemporaryDirectory() as td:
+			p = Path(td) / 'data.ftlr'
+			Dataset([1.0, 2.5, -3.0], [4.0, 5.0, 6.5], 'kilomètres', 'price').to_binary(p)
+			dataset = Dataset.from_binary(p)
+			self.assertEqual(dataset.feature_name, 'kilomètres')
+			self.assertEqual(dataset.target_name, 'price')
+			self.assertEqual(dataset.features.to_list(), [1.0, 2.5, -3.0])
+			self.assertEqual(dataset.targets.to_list(), [4.0, 5.0, 6.5])
+
+	def test_from_binary_rejects_invalid_files(self) -> None:
+		from tempfile import TemporaryDirectory
+		from pathlib import Path
+		with TemporaryDirectory() as td:
+			p = Path(td) / 'data.ftlr'
+			p.write_bytes(b'not a dataset file at all, definitely')
+			with self.assertRaises(ValueError):
+				Dataset.from_binary(p)
+			Dataset([1.0, 2.0], [3.0, 4.0], 'x', 'y').to_binary(p)
+			p.write_bytes(p.read_bytes()[:-8])
+			with self.assertRaises(ValueError):
+				Dataset.from_binary(p)
+
 if __name__ == '__main__':
 	unittest.main()
@@ -0,0 +1,73 @@
+import os
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+from srcs import Dataset, DatasetCache
+
+class TestDatasetCache(unittest.TestCase):
+	def test_load_parses_once_then_reuses_binary(self) -> None:
+		with TemporaryDirectory() as td:
+			source = Path(td) / 'data.csv'
+			source.write_text('x,y\n1,2\n3,4\n', encoding='utf-8')
+			cache = DatasetCache(Path(td) / 'cache')
+			first = cache.load(source)
+			self.assertTrue(cache.path_for(source).exists())
+			with patch.object(Dataset, 'from_csv', side_effect=AssertionError('CSV parsed again')):
+				second = cache.load(source)
+			self.assertEqual(second.features.to_list(), first.features.to_list())
+			self.assertEqual(second.targets.to_list(), first.targets.to_list())
+			self.assertEqual(second.feature_name, 'x')
+
+	def test_key_changes_with_file_and_columns(self) -> None:
+		with TemporaryDirectory() as td:
+			source = Path(td) / 'data.csv'
+			source.write_text('x,y,z\n1,2,3\n', encoding='utf-8')
+			cache = DatasetCache(Path(td) / 'cache')
+			original = cache.path_for(source)
+			self.assertNotEqual(cache.path_for(source, 'z', 'y'), original)
+			source.write_text('x,y,z\n1,2,3\n4,5,6\n', encoding='utf-8')
+			self.assertNotEqual(cache.path_for(source), original)
+
+	def test_changed_source_replaces_its_entry(self) -> None:
+		with TemporaryDirectory() as td:
+			source = Path(td) / 'data.csv'
+			source.write_text('x,y,z\n1,2,3\n', encoding='utf-8')
+			cache = DatasetCache(Path(td) / 'cache')
+			cache.load(source)
+			other_columns = cache.path_for(source, 'z', 'y')
+			cache.load(source, 'z', 'y')
+			source.write_text('x,y,z\n1,2,3\n4,5,6\n', encoding='utf-8')
+			os.utime(source, ns=(0, 10 ** 18))
+			self.assertEqual(cache.load(source).size, 2)
+			self.assertEqual(sorted(cache.directory.iterdir()), sorted([cache.path_for(source), other_columns]))
+
+	def test_defaults_to_the_user_cache_directory(self) -> None:
+		with TemporaryDirectory() as td:
+			with patch.dict(os.environ, {'XDG_CACHE_HOME': td}):
+				self.assertEqual(DatasetCache().directory, Path(td) / 'ft_linear_regression' / 'datasets')
+
+	def test_unwritable_cache_still_returns_the_dataset(self) -> None:
+		with TemporaryDirectory() as td:
+			source = Path(td) / 'data.csv'
+			source.write_text('x,y\n1,2\n3,4\n', encoding='utf-8')
+			blocker = Path(td) / 'not-a-directory'
+			blocker.write_text('', encoding='utf-8')
+			with patch.dict(os.environ, {'XDG_CACHE_HOME': str(blocker)}):
+				dataset = DatasetCache().load(source)
+			self.assertEqual(dataset.features.to_list(), [1.0, 3.0])
+
+	def test_stale_or_corrupt_entries_are_rebuilt(self) -> None:
+		with TemporaryDirectory() as td:
+			source = Path(td) / 'data.csv'
+			source.write_text('x,y\n1,2\n', encoding='utf-8')
+			cache = DatasetCache(Path(td) / 'cache')
+			cached = cache.path_for(source)
+			cached.parent.mkdir(parents=True)
+			cached.write_bytes(b'garbage')
+			dataset = cache.load(source)
+			self.assertEqual(dataset.features.to_list(), [1.0])
+			self.assertEqual(Dataset.from_binary(cached).targets.to_list(), [2.0])
+
+if __name__ == '__main__':
+	unittest.main()
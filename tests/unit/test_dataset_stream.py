@@ -0,0 +1,65 @@
+import random
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from srcs import DatasetStream
+
+class TestDatasetStream(unittest.TestCase):
+	def test_iteration_is_repeatable(self) -> None:
+		with TemporaryDirectory() as td:
+			p = Path(td) / 'data.csv'
+			p.write_text('x,y\n1,2\n3,4\n5,6\n', encoding='utf-8')
+			stream = DatasetStream(p, chunk_size=2)
+			first = [chunk.features.to_list() for chunk in stream]
+			second = [chunk.features.to_list() for chunk in stream]
+			self.assertEqual(first, [[1.0, 3.0], [5.0]])
+			self.assertEqual(first, second)
+
+	def test_resolves_columns_from_header(self) -> None:
+		with TemporaryDirectory() as td:
+			p = Path(td) / 'data.csv'
+			p.write_text('a,b,c\n1,2,3\n', encoding='utf-8')
+			stream = DatasetStream(p, feature='c', target='b')
+			self.assertEqual(stream.feature_name, 'c')
+			self.assertEqual(stream.target_name, 'b')
+			self.assertEqual(DatasetStream(p).feature_name, 'a')
+
+	def test_size_counts_rows(self) -> None:
+		with TemporaryDirectory() as td:
+			p = Path(td) / 'data.csv'
+			p.write_text('x,y\n1,2\n3,4\n5,6\n', encoding='utf-8')
+			self.assertEqual(DatasetStream(p, chunk_size=2).size, 3)
+
+	def test_shuffled_reads_every_chunk_in_a_new_order(self) -> None:
+		with TemporaryDirectory() as td:
+			p = Path(td) / 'data.csv'
+			p.write_text('x,y\n' + ''.join(f'{i},{2 * i}\n' for i in range(10)) + '\n', encoding='utf-8')
+			stream = DatasetStream(p, chunk_size=3)
+			expected = [chunk.features.to_list() for chunk in stream]
+			rng = random.Random(5)
+			orders = [[chunk.features.to_list() for chunk in stream.shuffled(rng)] for _ in range(4)]
+			for order in orders:
+				self.assertEqual(sorted(order), sorted(expected))
+			self.assertTrue(any(order != expected for order in orders))
+
+	def test_shuffled_keeps_file_order_for_quoted_fields(self) -> None:
+		with TemporaryDirectory() as td:
+			p = Path(td) / 'data.csv'
+			p.write_text('x,y\n1,2\n"3",4\n5,6\n', encoding='utf-8')
+			stream = DatasetStream(p, chunk_size=1)
+			self.assertEqual([chunk.features.to_list() for chunk in stream.shuffled(random.Random(0))], [[1.0], [3.0], [5.0]])
+
+	def test_raises_on_invalid_header(self) -> None:
+		with TemporaryDirectory() as td:
+			p = Path(td) / 'data.csv'
+			p.write_text('only\n1\n', encoding='utf-8')
+			with self.assertRaises(ValueError):
+				DatasetStream(p)
+			p.write_text('x,y\n1,2\n', encoding='utf-8')
+			with self.assertRaises(ValueError):
+				DatasetStream(p, feature='x')
+			with self.assertRaises(ValueError):
+				DatasetStream(p, chunk_size=0)
+
+if __name__ == '__main__':
+	unittest.main()
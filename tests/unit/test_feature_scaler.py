@@ -1,5 +1,5 @@
 import unittest
-from srcs import FeatureScaler, Vector
+from srcs import FeatureScaler, RunningMoments, Vector
 
 class TestFeatureScaler(unittest.TestCase):
 	def test_from_vector_computes_statistics(self) -> None:
@@ -34,5 +34,32 @@ class TestFeatureScaler(unittest.TestCase):
 		unscaled = scaler.unscale_vector(scaled)
 		self.assertEqual(unscaled.to_list(), source.to_list())
 
+	def test_from_chunks_matches_from_vector(self) -> None:
+		values = [3.0, 1.0, 4.0, 1.0, 5.0, 9.0, 2.0]
+		expected = FeatureScaler.from_vector(Vector(values))
+		scaler = FeatureScaler.from_chunks([Vector(values[:3]), Vector([]), Vector(values[3:])])
+		self.assertAlmostEqual(scaler.mean, expected.mean, places=10)
+		self.assertAlmostEqual(scaler.std, expected.std, places=10)
+
+	def test_from_moments_merges_worker_partials(self) -> None:
+		values = [float(i % 11) * 1.5 for i in range(60)]
+		partials = [RunningMoments.from_values(values[i::4]) for i in range(4)]
+		merged = RunningMoments()
+		for partial in partials:
+			merged.merge(partial)
+		expected = FeatureScaler.from_vector(Vector(values))
+		scaler = FeatureScaler.from_moments(merged)
+		self.assertAlmostEqual(scaler.mean, expected.mean, places=10)
+		self.assertAlmostEqual(scaler.std, expected.std, places=10)
+
+	def test_from_chunks_keeps_constant_guard(self) -> None:
+		scaler = FeatureScaler.from_chunks([Vector([5.0, 5.0]), Vector([5.0])])
+		self.assertEqual(scaler.mean, 5.0)
+		self.assertEqual(scaler.std, 1.0)
+
+	def test_from_chunks_raises_on_empty(self) -> None:
+		with self.assertRaises(ValueError):
+			FeatureScaler.from_chunks([])
+
 if __name__ == '__main__':
 	unittest.main()
@@ -1,5 +1,5 @@
 import unittest
-from srcs import Dataset, GradientDescentTrainer, LinearRegressionModel
+from srcs import Dataset, GradientDescentTrainer, LineSearch, LinearRegressionModel, Momentum, StepDecay
 
 class TestGradientDescentTrainer(unittest.TestCase):
 	def test_training_converges_to_expected_parameters(self) -> None:
@@ -30,5 +30,116 @@ class TestGradientDescentTrainer(unittest.TestCase):
 		self.assertAlmostEqual(parameters[0], 10.0, delta=0.1)
 		self.assertAlmostEqual(parameters[1], 0.0, delta=0.1)
 
+	def test_train_chunks_matches_in_memory_training(self) -> None:
+		features = [0.0, 1.0, 2.0, 3.0, 4.0]
+		targets = [1.0, 2.5, 5.5, 7.0, 9.5]
+		expected = GradientDescentTrainer(LinearRegressionModel(), 0.1).train(Dataset(features, targets, 'x', 'y'), 50)
+		chunks = [Dataset(features[:2], targets[:2], 'x', 'y'), Dataset(features[2:], targets[2:], 'x', 'y')]
+		parameters = GradientDescentTrainer(LinearRegressionModel(), 0.1).train_chunks(chunks, 50)
+		self.assertAlmostEqual(parameters[0], expected[0], places=9)
+		self.assertAlmostEqual(parameters[1], expected[1], places=9)
+
+	def test_mini_batch_training_converges(self) -> None:
+		dataset = Dataset([0.0, 1.0, 2.0, 3.0, 4.0, 5.0], [3.0, 5.0, 7.0, 9.0, 11.0, 13.0], 'x', 'y')
+		trainer = GradientDescentTrainer(LinearRegressionModel(), 0.05, batch_size=2, shuffle=True, seed=7)
+		parameters = trainer.train(dataset, 300)
+		self.assertAlmostEqual(parameters[0], 3.0, delta=0.01)
+		self.assertAlmostEqual(parameters[1], 2.0, delta=0.01)
+
+	def test_shuffled_training_is_deterministic_with_seed(self) -> None:
+		dataset = Dataset([0.0, 1.0, 2.0, 3.0, 4.0], [1.0, 2.5, 5.5, 7.0, 9.5], 'x', 'y')
+		first = GradientDescentTrainer(LinearRegressionModel(), 0.1, batch_size=1, shuffle=True, seed=3).train(dataset, 5)
+		second = GradientDescentTrainer(LinearRegressionModel(), 0.1, batch_size=1, shuffle=True, seed=3).train(dataset, 5)
+		self.assertEqual(first.to_list(), second.to_list())
+
+	def test_mini_batch_train_chunks_matches_in_memory_without_shuffle(self) -> None:
+		features = [0.0, 1.0, 2.0, 3.0]
+		targets = [1.0, 2.5, 5.5, 7.0]
+		expected = GradientDescentTrainer(LinearRegressionModel(), 0.1, batch_size=2).train(Dataset(features, targets, 'x', 'y'), 20)
+		chunks = [Dataset(features[:2], targets[:2], 'x', 'y'), Dataset(features[2:], targets[2:], 'x', 'y')]
+		parameters = GradientDescentTrainer(LinearRegressionModel(), 0.1, batch_size=2).train_chunks(chunks, 20)
+		self.assertAlmostEqual(parameters[0], expected[0], places=9)
+		self.assertAlmostEqual(parameters[1], expected[1], places=9)
+
+	def test_shuffled_train_chunks_is_deterministic_with_seed(self) -> None:
+		chunks = [Dataset([float(i), float(i + 1)], [2.0 * i + 1, 2.0 * i + 3], 'x', 'y') for i in range(0, 8, 2)]
+		first = GradientDescentTrainer(LinearRegressionModel(), 0.1, batch_size=2, shuffle=True, seed=4).train_chunks(chunks, 5)
+		second = GradientDescentTrainer(LinearRegressionModel(), 0.1, batch_size=2, shuffle=True, seed=4).train_chunks(chunks, 5)
+		unshuffled = GradientDescentTrainer(LinearRegressionModel(), 0.1, batch_size=2).train_chunks(chunks, 5)
+		self.assertEqual(first.to_list(), second.to_list())
+		self.assertNotEqual(first.to_list(), unshuffled.to_list())
+
+	def test_invalid_batch_size_raises(self) -> None:
+		with self.assertRaises(ValueError):
+			GradientDescentTrainer(LinearRegressionModel(), 0.1, batch_size=0)
+		with self.assertRaises(ValueError):
+			GradientDescentTrainer(LinearRegressionModel(), 0.1, shuffle=True)
+
+	def test_runs_every_epoch_without_tolerance(self) -> None:
+		dataset = Dataset([0.0, 1.0, 2.0], [1.0, 3.0, 5.0], 'x', 'y')
+		trainer = GradientDescentTrainer(LinearRegressionModel(), 0.1)
+		trainer.train(dataset, 25)
+		self.assertEqual(trainer.epochs_run, 25)
+		self.assertGreaterEqual(trainer.final_loss, 0.0)
+
+	def test_early_stopping_on_each_criterion(self) -> None:
+		dataset = Dataset([0.0, 1.0, 2.0, 3.0], [3.0, 5.0, 7.0, 9.0], 'x', 'y')
+		for criterion in ('gradient', 'loss', 'parameters'):
+			with self.subTest(criterion=criterion):
+				trainer = GradientDescentTrainer(LinearRegressionModel(), 0.1, tolerance=1e-6, stop_criterion=criterion)
+				parameters = trainer.train(dataset, 5000)
+				self.assertLess(trainer.epochs_run, 5000)
+				self.assertAlmostEqual(parameters[0], 3.0, delta=1e-3)
+				self.assertAlmostEqual(parameters[1], 2.0, delta=1e-3)
+				self.assertLess(trainer.final_loss, 1e-6)
+
+	def test_patience_delays_stopping(self) -> None:
+		dataset = Dataset([0.0, 1.0, 2.0, 3.0], [3.0, 5.0, 7.0, 9.0], 'x', 'y')
+		eager = GradientDescentTrainer(LinearRegressionModel(), 0.1, tolerance=1e-3)
+		eager.train(dataset, 5000)
+		patient = GradientDescentTrainer(LinearRegressionModel(), 0.1, tolerance=1e-3, patience=10)
+		patient.train(dataset, 5000)
+		self.assertEqual(patient.epochs_run, eager.epochs_run + 9)
+
+	def test_invalid_stopping_settings_raise(self) -> None:
+		with self.assertRaises(ValueError):
+			GradientDescentTrainer(LinearRegressionModel(), 0.1, tolerance=-1.0)
+		with self.assertRaises(ValueError):
+			GradientDescentTrainer(LinearRegressionModel(), 0.1, stop_criterion='unknown')
+		with self.assertRaises(ValueError):
+			GradientDescentTrainer(LinearRegressionModel(), 0.1, patience=0)
+
+	def test_target_loss_stops_training(self) -> None:
+		dataset = Dataset([0.0, 1.0, 2.0, 3.0, 4.0], [1.2, 2.9, 5.1, 7.0, 8.8], 'x', 'y')
+		trainer = GradientDescentTrainer(LinearRegressionModel(), 0.1, progress=False, target_loss=0.05)
+		trainer.train(dataset, 1000)
+		self.assertLess(trainer.epochs_run, 1000)
+		self.assertLessEqual(trainer.final_loss, 0.05)
+		with self.assertRaises(ValueError):
+			GradientDescentTrainer(LinearRegressionModel(), 0.1, target_loss=-1.0)
+
+	def test_momentum_needs_fewer_epochs_at_small_rates(self) -> None:
+		dataset = Dataset([0.0, 1.0, 2.0, 3.0, 4.0], [1.2, 2.9, 5.1, 7.0, 8.8], 'x', 'y')
+		plain = GradientDescentTrainer(LinearRegressionModel(), 0.01, progress=False, target_loss=0.02)
+		plain.train(dataset, 5000)
+		momentum = GradientDescentTrainer(LinearRegressionModel(), 0.01, progress=False, optimizer=Momentum(), target_loss=0.02)
+		momentum.train(dataset, 5000)
+		self.assertLess(momentum.epochs_run, plain.epochs_run)
+
+	def test_line_search_tames_large_learning_rates(self) -> None:
+		dataset = Dataset([0.0, 1.0, 2.0, 3.0], [1.0, 3.0, 5.0, 7.0], 'x', 'y')
+		for batch_size in (None, 2):
+			with self.subTest(batch_size=batch_size):
+				parameters = GradientDescentTrainer(LinearRegressionModel(), 50.0, batch_size, progress=False, optimizer=LineSearch()).train(dataset, 300)
+				self.assertAlmostEqual(parameters[0], 1.0, places=5)
+				self.assertAlmostEqual(parameters[1], 2.0, places=5)
+
+	def test_schedule_sets_the_step_size(self) -> None:
+		dataset = Dataset([0.0, 1.0, 2.0, 3.0], [1.0, 3.0, 5.0, 7.0], 'x', 'y')
+		# A schedule that zeroes the rate after the first epoch freezes the parameters
+		frozen = GradientDescentTrainer(LinearRegressionModel(), 0.5, progress=False, schedule=StepDecay(step_size=1, gamma=1e-300))
+		single = GradientDescentTrainer(LinearRegressionModel(), 0.5, progress=False)
+		self.assertEqual(frozen.train(dataset, 5).to_list(), single.train(dataset, 1).to_list())
+
 if __name__ == '__main__':
 	unittest.main()
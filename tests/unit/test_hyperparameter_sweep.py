@@ -0,0 +1,71 @@
+import math
+import unittest
+from srcs import Dataset, HyperparameterSweep
+from srcs.hyperparameter_sweep import SweepConfiguration
+
+class TestHyperparameterSweep(unittest.TestCase):
+	def setUp(self) -> None:
+		self.dataset = Dataset([0.0, 1.0, 2.0, 3.0, 4.0], [1.2, 2.9, 5.1, 7.0, 8.8], 'x', 'y')
+
+	def test_configurations_cover_grid(self) -> None:
+		sweep = HyperparameterSweep([0.01, 0.1], [10, 100], solvers=['gd', 'exact', 'gd'], batch_sizes=[None, 2])
+		configurations = sweep.configurations()
+		self.assertEqual(len(configurations), 9)
+		self.assertIn(SweepConfiguration('exact'), configurations)
+		self.assertIn(SweepConfiguration('gd', 0.1, 10, 2), configurations)
+
+	def test_run_ranks_by_metric(self) -> None:
+		sweep = HyperparameterSweep([0.001, 0.1], [5, 200], solvers=['gd', 'exact'], workers=2)
+		results = sweep.run(self.dataset)
+		self.assertEqual(len(results), 5)
+		errors = [result.metrics['MSE'] for result in results]
+		self.assertEqual(errors, sorted(errors))
+		worst = results[-1].configuration
+		self.assertEqual((worst.learning_rate, worst.epochs), (0.001, 5))
+
+	def test_r2_ranks_descending(self) -> None:
+		sweep = HyperparameterSweep([0.001, 0.1], [50], metric='R2', workers=1)
+		results = sweep.run(self.dataset)
+		self.assertGreaterEqual(results[0].metrics['R2'], results[1].metrics['R2'])
+		self.assertEqual(results[0].configuration.learning_rate, 0.1)
+
+	def test_diverged_runs_rank_last(self) -> None:
+		for metric in ('MSE', 'R2'):
+			with self.subTest(metric=metric):
+				sweep = HyperparameterSweep([10000.0, 0.1, 0.01], [3000], metric=metric, workers=1)
+				results = sweep.run(self.dataset)
+				self.assertFalse(math.isfinite(results[-1].metrics[metric]))
+				self.assertEqual(results[-1].configuration.learning_rate, 10000.0)
+				self.assertIs(sweep.best(results), results[0])
+				self.assertTrue(math.isfinite(results[0].metrics[metric]))
+
+	def test_best_refuses_when_every_run_diverged(self) -> None:
+		sweep = HyperparameterSweep([10000.0], [3000], workers=1)
+		results = sweep.run(self.dataset)
+		with self.assertRaises(ValueError):
+			sweep.best(results)
+
+	def test_best_result_matches_direct_training(self) -> None:
+		results = HyperparameterSweep([], [], solvers=['exact'], workers=1).run(self.dataset)
+		self.assertEqual(len(results), 1)
+		self.assertAlmostEqual(results[0].parameters[1], 1.93, places=6)
+		self.assertEqual(results[0].epochs_run, 0)
+
+	def test_invalid_settings_raise(self) -> None:
+		with self.assertRaises(ValueError):
+			HyperparameterSweep([0.1], [10], solvers=['newton'])
+		with self.assertRaises(ValueError):
+			HyperparameterSweep([0.1], [10], metric='MAPE')
+		with self.assertRaises(ValueError):
+			HyperparameterSweep([], [10])
+		with self.assertRaises(ValueError):
+			HyperparameterSweep([0.0], [10])
+		with self.assertRaises(ValueError):
+			HyperparameterSweep([0.1], [0])
+		with self.assertRaises(ValueError):
+			HyperparameterSweep([0.1], [10], batch_sizes=[0])
+		with self.assertRaises(ValueError):
+			HyperparameterSweep([0.1], [10], workers=0)
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,38 @@
+import unittest
+from srcs import CosineAnnealing, ExponentialDecay, LearningRateSchedule, StepDecay
+from srcs.learning_rate_schedules import SCHEDULES
+from srcs.options import SCHEDULE_NAMES
+
+class TestLearningRateSchedules(unittest.TestCase):
+	def test_constant_schedule(self) -> None:
+		self.assertEqual(LearningRateSchedule().rate(0.1, 500, 1000), 0.1)
+
+	def test_step_decay(self) -> None:
+		schedule = StepDecay(step_size=10, gamma=0.5)
+		self.assertEqual(schedule.rate(1.0, 9, 100), 1.0)
+		self.assertEqual(schedule.rate(1.0, 10, 100), 0.5)
+		self.assertEqual(schedule.rate(1.0, 25, 100), 0.25)
+
+	def test_exponential_decay(self) -> None:
+		self.assertAlmostEqual(ExponentialDecay(gamma=0.9).rate(2.0, 3, 100), 2.0 * 0.9 ** 3)
+
+	def test_cosine_annealing_reaches_minimum_on_last_epoch(self) -> None:
+		schedule = CosineAnnealing(min_rate=0.01)
+		self.assertAlmostEqual(schedule.rate(1.0, 0, 11), 1.0)
+		self.assertAlmostEqual(schedule.rate(1.0, 5, 11), 0.505)
+		self.assertAlmostEqual(schedule.rate(1.0, 10, 11), 0.01)
+		self.assertAlmostEqual(schedule.rate(1.0, 0, 1), 1.0)
+
+	def test_invalid_settings_raise(self) -> None:
+		with self.assertRaises(ValueError):
+			StepDecay(step_size=0)
+		with self.assertRaises(ValueError):
+			ExponentialDecay(gamma=0.0)
+		with self.assertRaises(ValueError):
+			CosineAnnealing(min_rate=-1.0)
+
+	def test_cli_choices_match_the_registry(self) -> None:
+		self.assertEqual(tuple(SCHEDULES), SCHEDULE_NAMES)
+
+if __name__ == '__main__':
+	unittest.main()
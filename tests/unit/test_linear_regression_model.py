@@ -22,6 +22,10 @@ class TestLinearRegressionModel(unittest.TestCase):
 		batch = Vector([1.0, 2.0, 3.0]).map(model.predict)
 		self.assertEqual(batch.to_list(), [1.5, 2.5, 3.5])
 
+	def test_predict_vector_matches_predict(self) -> None:
+		model = LinearRegressionModel(Vector([0.5, 1.0]))
+		self.assertEqual(model.predict_vector(Vector([1.0, 2.0, 3.0])).to_list(), [1.5, 2.5, 3.5])
+
 	def test_update_validates_length(self) -> None:
 		model = LinearRegressionModel()
 		with self.assertRaises(ValueError):
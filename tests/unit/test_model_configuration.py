@@ -2,7 +2,7 @@ import json
 import unittest
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from srcs import ModelConfiguration, Vector
+from srcs import ModelConfiguration, SufficientStatistics, Vector
 
 class TestModelConfiguration(unittest.TestCase):
 	def test_from_file_reads_values(self):
@@ -57,5 +57,19 @@ class TestModelConfiguration(unittest.TestCase):
 			with self.assertRaises(KeyError):
 				ModelConfiguration.from_file(p)
 
+	def test_statistics_round_trip(self):
+		with TemporaryDirectory() as td:
+			p = Path(td) / 'cfg.json'
+			statistics = SufficientStatistics.from_vectors(Vector([1.0, 2.0, 4.0]), Vector([2.0, 3.0, 7.5]))
+			ModelConfiguration(Vector([0.5, 1.5]), 'x', 'y', statistics).save(p)
+			cfg = ModelConfiguration.from_file(p)
+			self.assertIsNotNone(cfg.statistics)
+			self.assertEqual(cfg.statistics.to_json(), statistics.to_json())
+
+	def test_statistics_are_optional(self):
+		cfg = ModelConfiguration(Vector([0, 1]), 'a', 'b')
+		self.assertIsNone(cfg.statistics)
+		self.assertNotIn('statistics', cfg.to_json())
+
 if __name__ == '__main__':
 	unittest.main()
@@ -1,6 +1,6 @@
 import unittest
 from typing import cast
-from srcs import Dataset, Vector, ModelEvaluator
+from srcs import Dataset, EvaluationAccumulator, Vector, ModelEvaluator
 
 class TestModelEvaluator(unittest.TestCase):
 	def test_perfect_fit_metrics(self) -> None:
@@ -33,5 +33,44 @@ class TestModelEvaluator(unittest.TestCase):
 		with self.assertRaises(ValueError):
 			ModelEvaluator().evaluate(cast(Dataset, EmptyDataset()), Vector([0.0, 1.0]))
 
+	def test_evaluate_chunks_matches_evaluate(self) -> None:
+		features = [0.0, 1.0, 2.0, 3.0, 4.0]
+		targets = [1.5, 2.0, 5.5, 6.0, 10.0]
+		params = Vector([1.0, 2.0])
+		expected = ModelEvaluator().evaluate(Dataset(features, targets, 'x', 'y'), params)
+		chunks = [Dataset(features[:3], targets[:3], 'x', 'y'), Dataset(features[3:], targets[3:], 'x', 'y')]
+		metrics = ModelEvaluator().evaluate_chunks(chunks, params)
+		for key, value in expected.items():
+			self.assertAlmostEqual(metrics[key], value, places=10)
+
+	def test_evaluate_chunks_raises_on_empty_stream(self) -> None:
+		with self.assertRaises(ValueError):
+			ModelEvaluator().evaluate_chunks([], Vector([0.0, 1.0]))
+
+	def test_merged_accumulators_match_single_pass(self) -> None:
+		features = [float(i) for i in range(30)]
+		targets = [0.5 + 1.5 * x + (-1.0) ** i * (i % 4) for i, x in enumerate(features)]
+		params = Vector([0.4, 1.6])
+		expected = ModelEvaluator().evaluate(Dataset(features, targets, 'x', 'y'), params)
+		merged = EvaluationAccumulator()
+		for start in range(0, 30, 8):
+			part = EvaluationAccumulator().update_vectors(Vector(features[start:start + 8]), Vector(targets[start:start + 8]), 0.4, 1.6)
+			merged.merge(part)
+		self.assertEqual(merged.count, 30)
+		for key, value in merged.metrics().items():
+			self.assertAlmostEqual(value, expected[key], places=10)
+
+	def test_accumulate_streams_chunks(self) -> None:
+		chunks = (Dataset([float(i), float(i + 1)], [2.0 * i, 2.0 * i + 2.0], 'x', 'y') for i in range(0, 10, 2))
+		accumulator = ModelEvaluator().accumulate(chunks, Vector([0.0, 2.0]))
+		self.assertEqual(accumulator.count, 10)
+		self.assertEqual(accumulator.sse, 0.0)
+		self.assertEqual(accumulator.sae, 0.0)
+		self.assertAlmostEqual(accumulator.tss, sum((2.0 * i - 9.0) ** 2 for i in range(10)), places=9)
+
+	def test_accumulator_rejects_mismatched_lengths(self) -> None:
+		with self.assertRaises(ValueError):
+			EvaluationAccumulator().update_vectors(Vector([1.0]), Vector([1.0, 2.0]), 0.0, 1.0)
+
 if __name__ == '__main__':
 	unittest.main()
@@ -0,0 +1,25 @@
+import unittest
+from srcs.moments import combine, combine_co_moments
+
+class TestMoments(unittest.TestCase):
+	def test_combine_matches_single_pass(self) -> None:
+		values = [1.5, -2.0, 4.0, 0.25, 7.0, 3.5]
+		def moments(part: list[float]) -> tuple[int, float, float]:
+			mean = sum(part) / len(part)
+			return len(part), mean, sum((value - mean) ** 2 for value in part)
+		count, mean, m2 = combine(*moments(values[:2]), *moments(values[2:]))
+		expected = moments(values)
+		self.assertEqual(count, expected[0])
+		self.assertAlmostEqual(mean, expected[1], places=12)
+		self.assertAlmostEqual(m2, expected[2], places=12)
+
+	def test_combine_with_an_empty_side_returns_the_other(self) -> None:
+		self.assertEqual(combine(0, 0.0, 0.0, 3, 2.0, 5.0), (3, 2.0, 5.0))
+		self.assertEqual(combine(3, 2.0, 5.0, 0, 0.0, 0.0), (3, 2.0, 5.0))
+
+	def test_combine_co_moments_adds_the_cross_term(self) -> None:
+		self.assertAlmostEqual(combine_co_moments(2, 1.0, 3.0, 0.5, 2, 0.25), 0.5 + 0.25 + 3.0, places=12)
+		self.assertEqual(combine_co_moments(0, 1.0, 3.0, 0.0, 2, 0.25), 0.25)
+
+if __name__ == '__main__':
+	unittest.main()
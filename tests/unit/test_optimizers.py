@@ -0,0 +1,86 @@
+import unittest
+from srcs import Adam, GradientDescent, LineSearch, Momentum, Nesterov, Optimizer, Vector
+from srcs.optimizers import OPTIMIZERS
+from srcs.options import OPTIMIZER_NAMES
+
+def _quadratic(thetas: Vector) -> float:
+	return 0.5 * ((thetas[0] - 3.0) ** 2 + 4.0 * (thetas[1] + 1.0) ** 2)
+
+def _gradient(thetas: Vector) -> Vector:
+	return Vector([thetas[0] - 3.0, 4.0 * (thetas[1] + 1.0)])
+
+def _minimize(optimizer, learning_rate: float, steps: int) -> Vector:
+	thetas = Vector([0.0, 0.0])
+	optimizer.reset()
+	for _ in range(steps):
+		thetas = optimizer.step(thetas, _gradient(thetas), learning_rate, _quadratic)
+	return thetas
+
+class TestOptimizers(unittest.TestCase):
+	def test_gradient_descent_takes_plain_steps(self) -> None:
+		thetas = GradientDescent().step(Vector([1.0, 2.0]), Vector([0.5, -1.0]), 0.1, _quadratic)
+		self.assertEqual(thetas.to_list(), [1.0 - 0.05, 2.0 + 0.1])
+
+	def test_momentum_accumulates_velocity(self) -> None:
+		optimizer = Momentum(beta=0.5)
+		gradients = Vector([1.0, 0.0])
+		first = optimizer.step(Vector([0.0, 0.0]), gradients, 1.0, _quadratic)
+		second = optimizer.step(first, gradients, 1.0, _quadratic)
+		self.assertEqual(first.to_list(), [-1.0, 0.0])
+		self.assertEqual(second.to_list(), [-2.5, 0.0])
+		optimizer.reset()
+		self.assertEqual(optimizer.step(Vector([0.0, 0.0]), gradients, 1.0, _quadratic).to_list(), [-1.0, 0.0])
+
+	def test_nesterov_looks_ahead(self) -> None:
+		optimizer = Nesterov(beta=0.5)
+		thetas = optimizer.step(Vector([0.0, 0.0]), Vector([1.0, 0.0]), 1.0, _quadratic)
+		self.assertEqual(thetas.to_list(), [-1.5, 0.0])
+
+	def test_adam_first_step_is_learning_rate_sized(self) -> None:
+		thetas = Adam().step(Vector([0.0, 0.0]), Vector([100.0, -0.01]), 0.1, _quadratic)
+		self.assertAlmostEqual(thetas[0], -0.1, places=6)
+		self.assertAlmostEqual(thetas[1], 0.1, places=4)
+
+	def test_line_search_shrinks_diverging_steps(self) -> None:
+		# A fixed step of 1.0 diverges on the steep axis; backtracking does not
+		self.assertGreater(abs(_minimize(GradientDescent(), 1.0, 20)[1]), 1e3)
+		thetas = _minimize(LineSearch(), 1.0, 50)
+		self.assertAlmostEqual(thetas[0], 3.0, places=6)
+		self.assertAlmostEqual(thetas[1], -1.0, places=6)
+
+	def test_all_optimizers_converge(self) -> None:
+		for optimizer, rate, steps in ((GradientDescent(), 0.2, 200), (Momentum(), 0.05, 300), (Nesterov(), 0.05, 300), (Adam(), 0.1, 2000), (LineSearch(), 0.4, 200)):
+			with self.subTest(optimizer=type(optimizer).__name__):
+				thetas = _minimize(optimizer, rate, steps)
+				self.assertAlmostEqual(thetas[0], 3.0, places=3)
+				self.assertAlmostEqual(thetas[1], -1.0, places=3)
+
+	def test_state_round_trip_continues_identically(self) -> None:
+		for make in (Momentum, Nesterov, Adam, GradientDescent):
+			with self.subTest(optimizer=make.__name__):
+				original, restored = make(), make()
+				thetas = Vector([0.0, 0.0])
+				for _ in range(3):
+					thetas = original.step(thetas, _gradient(thetas), 0.05, _quadratic)
+				restored.load_state(original.state())
+				self.assertEqual(restored.step(thetas, _gradient(thetas), 0.05, _quadratic).to_list(), original.step(thetas, _gradient(thetas), 0.05, _quadratic).to_list())
+
+	def test_invalid_settings_raise(self) -> None:
+		with self.assertRaises(ValueError):
+			Momentum(beta=1.0)
+		with self.assertRaises(ValueError):
+			Adam(epsilon=0.0)
+		with self.assertRaises(ValueError):
+			LineSearch(shrink=1.0)
+		with self.assertRaises(ValueError):
+			LineSearch(max_steps=0)
+
+	def test_optimizer_requires_step(self) -> None:
+		with self.assertRaises(TypeError):
+			Optimizer()
+
+	def test_cli_choices_match_the_registry(self) -> None:
+		self.assertEqual(tuple(OPTIMIZERS), OPTIMIZER_NAMES)
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,84 @@
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from srcs import ClosedFormTrainer, Dataset, LinearRegressionModel, ModelEvaluator, PairwiseTrainer
+from srcs.pairwise_trainer import model_filename
+
+class TestPairwiseTrainer(unittest.TestCase):
+	def _write(self, directory: str) -> Path:
+		p = Path(directory) / 'wide.csv'
+		rows = ''.join(f'{i},{(i * 7) % 13 + 0.5 * i},row {i},{(i * i) % 17}\n' for i in range(400))
+		p.write_text('a,b,note,c\n' + rows, encoding='utf-8')
+		return p
+
+	def assertMetricsClose(self, first: dict[str, float], second: dict[str, float]) -> None:
+		self.assertEqual(first.keys(), second.keys())
+		for name in first:
+			self.assertAlmostEqual(first[name], second[name], delta=1e-9 * max(abs(second[name]), 1.0))
+
+	def test_every_pair_matches_a_dedicated_fit(self) -> None:
+		with TemporaryDirectory() as td:
+			p = self._write(td)
+			fits = PairwiseTrainer(['a', 'b', 'c'], absolute_errors=True).train(p)
+			self.assertEqual([(fit.feature, fit.target) for fit in fits], [('a', 'b'), ('a', 'c'), ('b', 'a'), ('b', 'c'), ('c', 'a'), ('c', 'b')])
+			for fit in fits:
+				with self.subTest(feature=fit.feature, target=fit.target):
+					dataset = Dataset.from_csv(p, fit.feature, fit.target)
+					parameters = ClosedFormTrainer(LinearRegressionModel()).train(dataset)
+					self.assertAlmostEqual(fit.parameters[0], parameters[0], places=9)
+					self.assertAlmostEqual(fit.parameters[1], parameters[1], places=9)
+					self.assertEqual(fit.statistics.count, 400)
+					self.assertMetricsClose(fit.metrics, ModelEvaluator().evaluate(dataset, parameters))
+
+	def test_single_scan_omits_mae(self) -> None:
+		with TemporaryDirectory() as td:
+			p = self._write(td)
+			fits = PairwiseTrainer(['c', 'a']).train(p)
+			self.assertEqual(len(fits), 2)
+			expected = ModelEvaluator().evaluate(Dataset.from_csv(p, 'c', 'a'), fits[0].parameters)
+			del expected['MAE']
+			self.assertMetricsClose(fits[0].metrics, expected)
+
+	def test_workers_match_a_single_scan(self) -> None:
+		with TemporaryDirectory() as td:
+			p = self._write(td)
+			expected = PairwiseTrainer(['a', 'b', 'c'], absolute_errors=True).train(p)
+			fits = PairwiseTrainer(['a', 'b', 'c'], workers=3, chunk_size=50, min_range_size=256, absolute_errors=True).train(p)
+			for fit, reference in zip(fits, expected):
+				self.assertAlmostEqual(fit.parameters[1], reference.parameters[1], places=9)
+				self.assertMetricsClose(fit.metrics, reference.metrics)
+
+	def test_workers_keep_quoted_multiline_records_whole(self) -> None:
+		with TemporaryDirectory() as td:
+			p = Path(td) / 'quoted.csv'
+			note = '"' + 'k,k,z\n' * 50 + '"'
+			p.write_text('a,b,note\n' + ''.join(f'{i},{3 * i + 1},{note}\n' for i in range(8)), encoding='utf-8')
+			fits = PairwiseTrainer(['a', 'b'], workers=4, min_range_size=100, absolute_errors=True).train(p)
+			self.assertEqual(fits[0].statistics.count, 8)
+			self.assertAlmostEqual(fits[0].parameters[1], 3.0, places=9)
+
+	def test_invalid_columns_raise(self) -> None:
+		with TemporaryDirectory() as td:
+			p = self._write(td)
+			with self.assertRaises(ValueError):
+				PairwiseTrainer(['a', 'z']).train(p)
+			with self.assertRaises(ValueError):
+				PairwiseTrainer().train(p)
+			empty = Path(td) / 'empty.csv'
+			empty.write_text('a,b\n', encoding='utf-8')
+			with self.assertRaises(ValueError):
+				PairwiseTrainer().train(empty)
+		with self.assertRaises(ValueError):
+			PairwiseTrainer(['a'])
+		with self.assertRaises(ValueError):
+			PairwiseTrainer(['a', 'a'])
+		with self.assertRaises(ValueError):
+			PairwiseTrainer(workers=0)
+
+	def test_model_filename_stays_in_the_directory(self) -> None:
+		self.assertEqual(model_filename('km', 'price'), 'km__price.json')
+		self.assertEqual(model_filename('../../etc/x', 'a\\b'), '.._.._etc_x__a_b.json')
+		self.assertNotIn('/', model_filename('/', '..'))
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,87 @@
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from srcs import Dataset, ParallelCsvLoader
+from srcs.parallel_csv_loader import split_ranges
+
+class TestParallelCsvLoader(unittest.TestCase):
+	def _write(self, directory: str, text: str) -> Path:
+		p = Path(directory) / 'data.csv'
+		p.write_text(text, encoding='utf-8')
+		return p
+
+	def test_load_matches_from_csv_in_row_order(self) -> None:
+		with TemporaryDirectory() as td:
+			rows = ''.join(f'{i},{i * 0.5},note {i}\n' for i in range(500))
+			p = self._write(td, 'a,b,c\n' + rows + '\n')
+			expected = Dataset.from_csv(p, feature='b', target='a')
+			dataset = ParallelCsvLoader(workers=4, min_range_size=64).load(p, feature='b', target='a')
+			self.assertEqual(dataset.feature_name, 'b')
+			self.assertEqual(dataset.target_name, 'a')
+			self.assertEqual(dataset.features.to_list(), expected.features.to_list())
+			self.assertEqual(dataset.targets.to_list(), expected.targets.to_list())
+
+	def test_quoted_fields_spanning_ranges_match_from_csv(self) -> None:
+		note = '"' + 'k,k,z\n' * 50 + '"'
+		for closing in ('', '\n'):
+			with self.subTest(closing_on_own_line=bool(closing)):
+				with TemporaryDirectory() as td:
+					rows = ''.join(f'{i},{i * 2},{note[:-1]}{closing}"\n' for i in range(8))
+					p = self._write(td, 'a,b,note\n' + rows)
+					expected = Dataset.from_csv(p)
+					dataset = ParallelCsvLoader(workers=4, min_range_size=100).load(p)
+					self.assertEqual(dataset.size, 8)
+					self.assertEqual(dataset.features.to_list(), expected.features.to_list())
+					self.assertEqual(dataset.targets.to_list(), expected.targets.to_list())
+
+	def test_load_small_file_without_pool(self) -> None:
+		with TemporaryDirectory() as td:
+			p = self._write(td, 'x,y\n1,2\n3,4')
+			dataset = ParallelCsvLoader(workers=4).load(p)
+			self.assertEqual(dataset.features.to_list(), [1.0, 3.0])
+			self.assertEqual(dataset.targets.to_list(), [2.0, 4.0])
+
+	def test_raises_same_validation_errors(self) -> None:
+		loader = ParallelCsvLoader(workers=2, min_range_size=8)
+		with TemporaryDirectory() as td:
+			cases = [
+				('only\n1\n', {}),
+				('x,y\n1,2\n', {'feature': 'x'}),
+				('x,y\n1,2\n', {'feature': 'x', 'target': 'x'}),
+				('x,y\n1,2\n', {'feature': 'x', 'target': 'z'}),
+				('x,y\n', {}),
+				('x,y\n1,2\n3,4\n5,6\n7,abc\n', {}),
+				('x,y\n1,2\n3,4\n5,6\n7\n', {}),
+			]
+			for text, kwargs in cases:
+				with self.subTest(text=text, kwargs=kwargs):
+					p = self._write(td, text)
+					with self.assertRaises((ValueError, TypeError)) as expected:
+						Dataset.from_csv(p, **kwargs)
+					with self.assertRaises(type(expected.exception)) as actual:
+						loader.load(p, **kwargs)
+					self.assertEqual(str(actual.exception), str(expected.exception))
+
+	def test_invalid_settings_raise(self) -> None:
+		with self.assertRaises(ValueError):
+			ParallelCsvLoader(workers=0)
+		with self.assertRaises(ValueError):
+			ParallelCsvLoader(min_range_size=0)
+
+	def test_split_ranges_cover_whole_lines(self) -> None:
+		with TemporaryDirectory() as td:
+			p = Path(td) / 'data.csv'
+			p.write_bytes(b'x,y\n' + b''.join(b'%d,%d\n' % (i, i * i) for i in range(100)))
+			with p.open('rb') as f:
+				start = len(f.readline())
+				size = p.stat().st_size
+				ranges = split_ranges(f, start, size, 4, 64)
+			data = p.read_bytes()
+			self.assertEqual(len(ranges), 4)
+			self.assertEqual((ranges[0][0], ranges[-1][1]), (start, size))
+			for (_, end), (next_start, _) in zip(ranges, ranges[1:]):
+				self.assertEqual(end, next_start)
+				self.assertEqual(data[end - 1:end], b'\n')
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,108 @@
+import asyncio
+import json
+import os
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from srcs import ModelConfiguration, PredictionServer, Vector
+
+async def http_request(port: int, method: str, path: str, payload: object | None = None) -> tuple[int, dict]:
+	reader, writer = await asyncio.open_connection('127.0.0.1', port)
+	body = b'' if payload is None else json.dumps(payload).encode('utf-8')
+	writer.write(f'{method} {path} HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\nContent-Length: {len(body)}\r\n\r\n'.encode('latin-1') + body)
+	await writer.drain()
+	response = await reader.read()
+	writer.close()
+	head, _, data = response.partition(b'\r\n\r\n')
+	status = int(head.split()[1])
+	return status, json.loads(data)
+
+class TestPredictionServer(unittest.IsolatedAsyncioTestCase):
+	async def asyncSetUp(self) -> None:
+		self._directory = TemporaryDirectory()
+		self.model_path = Path(self._directory.name) / 'cars.json'
+		ModelConfiguration(Vector([1.0, 2.0]), 'km', 'price').save(self.model_path)
+		self.server = PredictionServer([self.model_path], reload_interval=0.01)
+		await self.server.start('127.0.0.1', 0)
+
+	async def asyncTearDown(self) -> None:
+		await self.server.close()
+		self._directory.cleanup()
+
+	async def test_predicts_single_and_many_features(self) -> None:
+		status, payload = await http_request(self.server.port, 'POST', '/models/cars/predict', {'features': [0, 1.5]})
+		self.assertEqual(status, 200)
+		self.assertEqual(payload, {'model': 'cars', 'predictions': [1.0, 4.0]})
+		status, payload = await http_request(self.server.port, 'POST', '/predict', {'feature': 3})
+		self.assertEqual(payload['predictions'], [7.0])
+
+	async def test_concurrent_requests_are_micro_batched(self) -> None:
+		results = await asyncio.gather(*(self.server.predict('cars', Vector([float(i)])) for i in range(50)))
+		self.assertEqual(results, [[1.0 + 2.0 * i] for i in range(50)])
+		self.assertLess(self.server.metrics.batches, 50)
+		self.assertEqual(self.server.metrics.predictions, 50)
+
+	async def test_reloads_model_when_file_changes(self) -> None:
+		ModelConfiguration(Vector([0.0, 10.0]), 'km', 'price').save(self.model_path)
+		stat = self.model_path.stat()
+		os.utime(self.model_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+		for _ in range(100):
+			if self.server.metrics.reloads:
+				break
+			await asyncio.sleep(0.01)
+		status, payload = await http_request(self.server.port, 'POST', '/predict', {'feature': 1})
+		self.assertEqual(payload['predictions'], [10.0])
+
+	async def test_keeps_serving_when_reload_fails(self) -> None:
+		self.model_path.write_text('{broken', encoding='utf-8')
+		self.assertEqual(self.server.reload_changed(), [])
+		self.assertEqual(self.server.metrics.reload_errors, 1)
+		status, payload = await http_request(self.server.port, 'POST', '/predict', {'feature': 1})
+		self.assertEqual(payload['predictions'], [3.0])
+
+	async def test_reports_errors_and_metrics(self) -> None:
+		status, payload = await http_request(self.server.port, 'POST', '/models/unknown/predict', {'feature': 1})
+		self.assertEqual(status, 404)
+		status, _ = await http_request(self.server.port, 'POST', '/predict', {'features': ['x']})
+		self.assertEqual(status, 400)
+		status, _ = await http_request(self.server.port, 'GET', '/predict')
+		self.assertEqual(status, 405)
+		status, payload = await http_request(self.server.port, 'GET', '/metrics')
+		self.assertEqual(status, 200)
+		self.assertEqual(payload['requests'], 3)
+		self.assertEqual(payload['errors'], 3)
+		self.assertGreaterEqual(payload['latency_max_ms'], 0.0)
+
+	async def test_lists_models(self) -> None:
+		status, payload = await http_request(self.server.port, 'GET', '/models')
+		self.assertEqual(status, 200)
+		self.assertEqual(payload['models']['cars']['thetas'], [1.0, 2.0])
+
+	async def test_keep_alive_connection_serves_several_requests(self) -> None:
+		reader, writer = await asyncio.open_connection('127.0.0.1', self.server.port)
+		for _ in range(2):
+			writer.write(b'GET /health HTTP/1.1\r\nHost: localhost\r\n\r\n')
+			await writer.drain()
+			head = await reader.readuntil(b'\r\n\r\n')
+			length = int(head.split(b'Content-Length: ')[1].split(b'\r\n')[0])
+			self.assertEqual(json.loads(await reader.readexactly(length)), {'status': 'ok'})
+		writer.close()
+
+	async def test_latency_excludes_keep_alive_idle_time(self) -> None:
+		reader, writer = await asyncio.open_connection('127.0.0.1', self.server.port)
+		for _ in range(2):
+			writer.write(b'GET /health HTTP/1.1\r\nHost: localhost\r\n\r\n')
+			await writer.drain()
+			head = await reader.readuntil(b'\r\n\r\n')
+			await reader.readexactly(int(head.split(b'Content-Length: ')[1].split(b'\r\n')[0]))
+			await asyncio.sleep(0.3)
+		writer.close()
+		_, payload = await http_request(self.server.port, 'GET', '/metrics')
+		self.assertLess(payload['latency_max_ms'], 250.0)
+
+	def test_rejects_duplicate_model_names(self) -> None:
+		with self.assertRaises(ValueError):
+			PredictionServer([self.model_path, self.model_path])
+
+if __name__ == '__main__':
+	unittest.main()
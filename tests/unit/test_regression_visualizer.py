@@ -68,5 +68,35 @@ class TestRegressionVisualizer(unittest.TestCase):
 		with self.assertRaises(ValueError):
 			visualizer.plot(dataset, Vector([1.0, 2.0, 3.0]))
 
+	def test_plot_switches_to_density_above_threshold(self) -> None:
+		features = [float(i % 50) for i in range(400)]
+		dataset = Dataset(features, [2.0 * x + 1.0 for x in features], 'km', 'price')
+		visualizer = RegressionVisualizer(density_threshold=100, bins=20)
+		self.assertTrue(visualizer.uses_density(dataset.size))
+		figure = visualizer.plot(dataset, Vector([1.0, 2.0]))
+		axis = figure.axes[0]
+		self.assertEqual(len(axis.collections), 0)
+		image = axis.get_images()[0]
+		self.assertEqual(image.get_array().shape, (20, 20))
+		self.assertEqual(image.get_array().sum(), dataset.size)
+		self.assertEqual(axis.get_xlabel(), 'km')
+		self.assertEqual(axis.get_ylabel(), 'price')
+		line = axis.get_lines()[0]
+		x_data = list(cast(Iterable[float], line.get_xdata()))
+		y_data = list(cast(Iterable[float], line.get_ydata()))
+		self.assertEqual(len(x_data), 200)
+		self.assertAlmostEqual(y_data[-1], 1.0 + 2.0 * x_data[-1], places=6)
+
+	def test_density_can_be_disabled(self) -> None:
+		visualizer = RegressionVisualizer(density_threshold=None)
+		self.assertFalse(visualizer.uses_density(10_000_000))
+		self.assertFalse(RegressionVisualizer().uses_density(1_000))
+
+	def test_invalid_density_settings_raise(self) -> None:
+		with self.assertRaises(ValueError):
+			RegressionVisualizer(density_threshold=0)
+		with self.assertRaises(ValueError):
+			RegressionVisualizer(bins=0)
+
 if __name__ == '__main__':
 	unittest.main()
@@ -0,0 +1,48 @@
+import math
+import unittest
+from srcs import RunningMoments, Vector
+
+class TestRunningMoments(unittest.TestCase):
+	def test_from_values_computes_mean_and_variance(self) -> None:
+		moments = RunningMoments.from_values(Vector([2.0, 4.0, 4.0, 4.0, 5.0, 5.0, 7.0, 9.0]))
+		self.assertEqual(moments.count, 8)
+		self.assertAlmostEqual(moments.mean, 5.0, places=12)
+		self.assertAlmostEqual(moments.variance, 4.0, places=12)
+		self.assertAlmostEqual(moments.std, 2.0, places=12)
+
+	def test_merge_matches_single_pass(self) -> None:
+		values = [0.5 * i * i - 3.0 * i for i in range(40)]
+		expected = RunningMoments.from_values(values)
+		merged = RunningMoments()
+		for start in range(0, 40, 7):
+			merged.merge(RunningMoments.from_values(values[start:start + 7]))
+		self.assertEqual(merged.count, expected.count)
+		self.assertAlmostEqual(merged.mean, expected.mean, places=10)
+		self.assertAlmostEqual(merged.m2, expected.m2, delta=1e-9 * expected.m2)
+
+	def test_merge_with_empty_is_identity(self) -> None:
+		moments = RunningMoments.from_values([1.0, 2.0])
+		moments.merge(RunningMoments())
+		self.assertEqual((moments.count, moments.mean, moments.m2), (2, 1.5, 0.5))
+		empty = RunningMoments().merge(moments)
+		self.assertEqual((empty.count, empty.mean, empty.m2), (2, 1.5, 0.5))
+
+	def test_stable_with_large_offsets(self) -> None:
+		moments = RunningMoments.from_values([1e9 + x for x in (4.0, 7.0, 13.0, 16.0)])
+		self.assertAlmostEqual(moments.variance, 22.5, places=6)
+
+	def test_update_and_copy(self) -> None:
+		moments = RunningMoments().update(3.0).update(5.0)
+		copy = moments.copy().update(10.0)
+		self.assertEqual(moments.count, 2)
+		self.assertEqual(copy.count, 3)
+		self.assertTrue(math.isclose(copy.mean, 6.0))
+
+	def test_empty_variance_raises(self) -> None:
+		with self.assertRaises(ValueError):
+			RunningMoments().variance
+		with self.assertRaises(ValueError):
+			RunningMoments(count=-1)
+
+if __name__ == '__main__':
+	unittest.main()
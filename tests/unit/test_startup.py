@@ -0,0 +1,35 @@
+import subprocess
+import sys
+import unittest
+from benchmarks.startup import FORBIDDEN_MODULES, measure_predict, parse_importtime
+
+class TestStartup(unittest.TestCase):
+	def test_parse_importtime_reads_cumulative_microseconds(self) -> None:
+		stderr = 'import time: self [us] | cumulative | imported package\nimport time:       120 |        450 | srcs\nimport time:        30 |         30 |   srcs.vector\n'
+		self.assertEqual(parse_importtime(stderr), {'srcs': 450, 'srcs.vector': 30})
+
+	def test_importing_package_defers_submodules(self) -> None:
+		code = 'import sys, srcs; print(sorted(m for m in sys.modules if m.startswith("srcs.") or m.split(".")[0] in %r))' % (FORBIDDEN_MODULES,)
+		completed = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+		self.assertEqual(completed.stdout.strip(), '[]')
+
+	def test_cli_parser_skips_training_modules(self) -> None:
+		code = 'import sys, ft_linear_regression; ft_linear_regression.CommandLineApplication().build_parser(); print(sorted(m for m in sys.modules if m.startswith("srcs.")))'
+		completed = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+		for module in ('gradient_descent_trainer', 'hyperparameter_sweep', 'optimizers', 'learning_rate_schedules', 'regression_visualizer'):
+			self.assertNotIn(f'srcs.{module}', completed.stdout)
+
+	def test_lazy_attributes_resolve(self) -> None:
+		import srcs
+		self.assertIs(srcs.Vector, sys.modules['srcs.vector'].Vector)
+		self.assertIn('RegressionVisualizer', dir(srcs))
+		with self.assertRaises(AttributeError):
+			srcs.Missing
+
+	def test_predict_never_imports_heavy_modules(self) -> None:
+		result = measure_predict()
+		self.assertEqual(result.forbidden, [])
+		self.assertGreater(result.modules, 0)
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,75 @@
+import json
+import unittest
+from srcs import SufficientStatistics, Vector
+
+class TestSufficientStatistics(unittest.TestCase):
+	def test_from_vectors_computes_moments(self) -> None:
+		stats = SufficientStatistics.from_vectors(Vector([1.0, 2.0, 3.0]), Vector([2.0, 4.0, 9.0]))
+		self.assertEqual(stats.count, 3)
+		self.assertAlmostEqual(stats.mean_x, 2.0)
+		self.assertAlmostEqual(stats.mean_y, 5.0)
+		self.assertAlmostEqual(stats.m2_x, 2.0)
+		self.assertAlmostEqual(stats.m2_y, 26.0)
+		self.assertAlmostEqual(stats.c_xy, 7.0)
+
+	def test_merge_matches_single_pass(self) -> None:
+		xs = [1.0, 4.0, 2.0, 8.0, 5.0]
+		ys = [3.0, 1.0, 7.0, 2.0, 6.0]
+		full = SufficientStatistics.from_vectors(Vector(xs), Vector(ys))
+		merged = SufficientStatistics.from_vectors(Vector(xs[:2]), Vector(ys[:2]))
+		merged.merge(SufficientStatistics.from_vectors(Vector(xs[2:]), Vector(ys[2:])))
+		for name in ('count', 'mean_x', 'mean_y', 'm2_x', 'm2_y', 'c_xy'):
+			self.assertAlmostEqual(getattr(merged, name), getattr(full, name), places=10)
+
+	def test_merge_with_empty(self) -> None:
+		stats = SufficientStatistics.from_vectors(Vector([1.0, 2.0]), Vector([1.0, 3.0]))
+		self.assertIs(stats.merge(SufficientStatistics()), stats)
+		empty = SufficientStatistics().merge(stats)
+		self.assertEqual(empty.count, 2)
+		self.assertAlmostEqual(empty.c_xy, 1.0)
+
+	def test_update_single_sample(self) -> None:
+		stats = SufficientStatistics().update(1.0, 2.0).update(3.0, 6.0)
+		self.assertEqual(stats.fit().to_list(), [0.0, 2.0])
+
+	def test_subtract_inverts_merge(self) -> None:
+		xs = [1.0, 4.0, 2.0, 8.0, 5.0]
+		ys = [3.0, 1.0, 7.0, 2.0, 6.0]
+		total = SufficientStatistics.from_vectors(Vector(xs), Vector(ys))
+		removed = SufficientStatistics.from_vectors(Vector(xs[3:]), Vector(ys[3:]))
+		remaining = total.copy().subtract(removed)
+		expected = SufficientStatistics.from_vectors(Vector(xs[:3]), Vector(ys[:3]))
+		for name in ('count', 'mean_x', 'mean_y', 'm2_x', 'm2_y', 'c_xy'):
+			self.assertAlmostEqual(getattr(remaining, name), getattr(expected, name), places=10)
+		self.assertEqual(total.count, 5)
+
+	def test_subtract_everything_or_too_much(self) -> None:
+		stats = SufficientStatistics.from_vectors(Vector([1.0, 2.0]), Vector([1.0, 3.0]))
+		with self.assertRaises(ValueError):
+			SufficientStatistics().subtract(stats)
+		self.assertEqual(stats.copy().subtract(stats).count, 0)
+
+	def test_squared_error_matches_residuals(self) -> None:
+		xs = Vector([1.0, 4.0, 2.0, 8.0])
+		ys = Vector([3.0, 1.0, 7.0, 2.0])
+		parameters = Vector([2.0, 0.5])
+		expected = ys.squared_distance(xs.affine(0.5, 2.0))
+		self.assertAlmostEqual(SufficientStatistics.from_vectors(xs, ys).squared_error(parameters), expected, places=10)
+		with self.assertRaises(ValueError):
+			SufficientStatistics().squared_error(Vector([1.0]))
+
+	def test_fit_raises_when_empty(self) -> None:
+		with self.assertRaises(ValueError):
+			SufficientStatistics().fit()
+
+	def test_update_vectors_raises_on_mismatched_sizes(self) -> None:
+		with self.assertRaises(ValueError):
+			SufficientStatistics().update_vectors(Vector([1.0]), Vector([1.0, 2.0]))
+
+	def test_json_round_trip_is_exact(self) -> None:
+		statistics = SufficientStatistics.from_vectors(Vector([0.1, 0.7, 2.3]), Vector([1.9, 0.2, 5.5]))
+		restored = SufficientStatistics.from_json(json.loads(json.dumps(statistics.to_json())))
+		self.assertEqual(restored.to_json(), statistics.to_json())
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,73 @@
+import json
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from srcs import ChromeTraceWriter, Dataset, GradientDescentTrainer, JsonlTraceWriter, LinearRegressionModel, TrainingCallback, Vector
+from srcs.training_callbacks import EpochState, ThrottledCallback
+
+class RecordingCallback(TrainingCallback):
+	def __init__(self) -> None:
+		self.events: list[tuple] = []
+
+	def on_epoch_start(self, epoch: int, parameters: Vector) -> None:
+		self.events.append(('start', epoch))
+
+	def on_epoch_end(self, state: EpochState) -> None:
+		self.events.append(('end', state.epoch, state.loss, state.gradient_norm))
+
+	def on_train_end(self, state: EpochState | None) -> None:
+		self.events.append(('train_end', state.epoch if state else None))
+
+class TestTrainingCallbacks(unittest.TestCase):
+	def setUp(self) -> None:
+		self.dataset = Dataset([0.0, 1.0, 2.0, 3.0], [3.0, 5.0, 7.0, 9.0], 'x', 'y')
+
+	def test_trainer_invokes_hooks_in_order(self) -> None:
+		callback = RecordingCallback()
+		trainer = GradientDescentTrainer(LinearRegressionModel(), 0.1, progress=False, callbacks=[callback])
+		trainer.train(self.dataset, 3)
+		self.assertEqual([event[:2] for event in callback.events], [('start', 1), ('end', 1), ('start', 2), ('end', 2), ('start', 3), ('end', 3), ('train_end', 3)])
+		losses = [event[2] for event in callback.events if event[0] == 'end']
+		self.assertEqual(losses, sorted(losses, reverse=True))
+		self.assertEqual(losses[-1], trainer.final_loss)
+
+	def test_epoch_state_reports_unscaled_parameters(self) -> None:
+		states: list[EpochState] = []
+		class Capture(TrainingCallback):
+			def on_epoch_end(self, state: EpochState) -> None:
+				states.append(state)
+		parameters = GradientDescentTrainer(LinearRegressionModel(), 0.1, progress=False, callbacks=[Capture()]).train(self.dataset, 5)
+		self.assertEqual(states[-1].parameters.to_list(), parameters.to_list())
+		self.assertGreaterEqual(states[-1].seconds, 0.0)
+
+	def test_jsonl_writer_throttles_and_records_final_epoch(self) -> None:
+		with TemporaryDirectory() as td:
+			path = Path(td) / 'trace' / 'train.jsonl'
+			GradientDescentTrainer(LinearRegressionModel(), 0.1, progress=False, callbacks=[JsonlTraceWriter(path, every=4)]).train(self.dataset, 10)
+			records = [json.loads(line) for line in path.read_text(encoding='utf-8').splitlines()]
+			self.assertEqual([record['epoch'] for record in records], [4, 8, 10])
+			self.assertEqual(set(records[0]), {'epoch', 'thetas', 'gradient_norm', 'loss', 'seconds'})
+
+	def test_chrome_trace_writer_emits_trace_events(self) -> None:
+		with TemporaryDirectory() as td:
+			path = Path(td) / 'train.trace.json'
+			GradientDescentTrainer(LinearRegressionModel(), 0.1, progress=False, callbacks=[ChromeTraceWriter(path)]).train(self.dataset, 3)
+			trace = json.loads(path.read_text(encoding='utf-8'))
+			spans = [event for event in trace['traceEvents'] if event['ph'] == 'X']
+			counters = [event for event in trace['traceEvents'] if event['ph'] == 'C']
+			self.assertEqual(len(spans), 3)
+			self.assertEqual(len(counters), 3)
+			self.assertLessEqual(spans[0]['ts'], spans[1]['ts'])
+
+	def test_invalid_throttling_raises(self) -> None:
+		with self.assertRaises(ValueError):
+			JsonlTraceWriter('trace.jsonl', every=0)
+		with self.assertRaises(ValueError):
+			ChromeTraceWriter('trace.json', min_interval=-1.0)
+
+	def test_throttled_callback_requires_report(self) -> None:
+		with self.assertRaises(TypeError):
+			ThrottledCallback()
+
+if __name__ == '__main__':
+	unittest.main()
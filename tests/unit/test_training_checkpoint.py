@@ -0,0 +1,110 @@
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from srcs import Adam, Checkpointer, CosineAnnealing, Dataset, GradientDescentTrainer, LinearRegressionModel, TrainingCallback, TrainingCheckpoint, Vector
+from srcs.training_callbacks import EpochState
+from srcs.training_checkpoint import DEFAULT_CHECKPOINT_EVERY, dataset_fingerprint
+
+class _Interrupt(TrainingCallback):
+	def __init__(self, epoch: int) -> None:
+		self._epoch = epoch
+
+	def on_epoch_end(self, state: EpochState) -> None:
+		if state.epoch == self._epoch:
+			raise KeyboardInterrupt
+
+def _dataset() -> Dataset:
+	features = [float(i % 13) + 0.1 * i for i in range(120)]
+	return Dataset(features, [3.0 * x - 4.0 + (i % 7) for i, x in enumerate(features)], 'x', 'y')
+
+def _trainer(checkpointer: Checkpointer | None = None, callbacks: tuple = (), learning_rate: float = 0.05) -> GradientDescentTrainer:
+	return GradientDescentTrainer(LinearRegressionModel(), learning_rate, 16, True, 5, progress=False, callbacks=callbacks, optimizer=Adam(), schedule=CosineAnnealing(), checkpointer=checkpointer)
+
+class TestTrainingCheckpoint(unittest.TestCase):
+	def test_checkpoint_round_trip(self) -> None:
+		with TemporaryDirectory() as td:
+			path = Path(td) / 'nested' / 'run.checkpoint.json'
+			checkpoint = TrainingCheckpoint(3, Vector([0.1, 0.2]), 1.5, float('inf'), 0, 2.0, 0.5, {'steps': 3}, [3, [1, 2], None], '4:abc', {'epochs': 10})
+			checkpoint.save(path)
+			self.assertEqual(list(path.parent.iterdir()), [path])
+			loaded = TrainingCheckpoint.from_file(path)
+			self.assertEqual(loaded.to_json(), checkpoint.to_json())
+
+	def test_checkpointer_due_every_n_epochs(self) -> None:
+		checkpointer = Checkpointer('unused.json', every=5)
+		self.assertEqual([epoch for epoch in range(1, 16) if checkpointer.due(epoch)], [5, 10, 15])
+		self.assertFalse(Checkpointer('unused.json', interval=3600.0).due(1))
+		self.assertFalse(Checkpointer('unused.json').due(1))
+		self.assertTrue(Checkpointer('unused.json').due(DEFAULT_CHECKPOINT_EVERY))
+		with self.assertRaises(ValueError):
+			Checkpointer('unused.json', every=0)
+
+	def test_fingerprint_tracks_content_and_names(self) -> None:
+		dataset = _dataset()
+		self.assertEqual(dataset_fingerprint((dataset,)), dataset_fingerprint((_dataset(),)))
+		changed = Dataset(dataset.features.to_list()[:-1] + [0.0], dataset.targets, 'x', 'y')
+		self.assertNotEqual(dataset_fingerprint((dataset,)), dataset_fingerprint((changed,)))
+		renamed = Dataset(dataset.features, dataset.targets, 'x', 'z')
+		self.assertNotEqual(dataset_fingerprint((dataset,)), dataset_fingerprint((renamed,)))
+
+	def test_resume_is_bit_identical_to_uninterrupted_run(self) -> None:
+		dataset = _dataset()
+		expected = _trainer().train(dataset, 60)
+		with TemporaryDirectory() as td:
+			path = Path(td) / 'run.checkpoint.json'
+			with self.assertRaises(KeyboardInterrupt):
+				_trainer(Checkpointer(path, every=7), (_Interrupt(25),)).train(dataset, 60)
+			self.assertEqual(TrainingCheckpoint.from_file(path).epoch, 21)
+			trainer = _trainer(Checkpointer(path, every=7))
+			parameters = trainer.train(dataset, 60, resume=True)
+			self.assertEqual(parameters.to_list(), expected.to_list())
+			self.assertEqual(trainer.epochs_run, 60)
+			self.assertFalse(path.exists())
+
+	def test_resume_streamed_chunks(self) -> None:
+		dataset = _dataset()
+		chunks = [Dataset(dataset.features[i:i + 50], dataset.targets[i:i + 50], 'x', 'y') for i in range(0, dataset.size, 50)]
+		expected = _trainer().train_chunks(chunks, 30)
+		with TemporaryDirectory() as td:
+			path = Path(td) / 'run.checkpoint.json'
+			with self.assertRaises(KeyboardInterrupt):
+				_trainer(Checkpointer(path, every=4), (_Interrupt(10),)).train_chunks(chunks, 30)
+			self.assertEqual(_trainer(Checkpointer(path)).train_chunks(chunks, 30, resume=True).to_list(), expected.to_list())
+
+	def test_resumed_run_keeps_the_checkpoint_cadence(self) -> None:
+		dataset = _dataset()
+		expected = _trainer().train(dataset, 60)
+		with TemporaryDirectory() as td:
+			path = Path(td) / 'run.checkpoint.json'
+			with self.assertRaises(KeyboardInterrupt):
+				_trainer(Checkpointer(path, every=7), (_Interrupt(10),)).train(dataset, 60)
+			self.assertEqual(TrainingCheckpoint.from_file(path).every, 7)
+			with self.assertRaises(KeyboardInterrupt):
+				_trainer(Checkpointer(path), (_Interrupt(40),)).train(dataset, 60, resume=True)
+			self.assertEqual(TrainingCheckpoint.from_file(path).epoch, 35)
+			self.assertEqual(_trainer(Checkpointer(path)).train(dataset, 60, resume=True).to_list(), expected.to_list())
+
+	def test_resume_rejects_mismatches(self) -> None:
+		dataset = _dataset()
+		with TemporaryDirectory() as td:
+			path = Path(td) / 'run.checkpoint.json'
+			with self.assertRaises(KeyboardInterrupt):
+				_trainer(Checkpointer(path, every=2), (_Interrupt(3),)).train(dataset, 10)
+			other = Dataset(dataset.features, dataset.targets.affine(2.0, 0.0), 'x', 'y')
+			with self.assertRaisesRegex(ValueError, 'different dataset'):
+				_trainer(Checkpointer(path)).train(other, 10, resume=True)
+			with self.assertRaisesRegex(ValueError, 'different training settings'):
+				_trainer(Checkpointer(path), learning_rate=0.1).train(dataset, 10, resume=True)
+			with self.assertRaisesRegex(ValueError, 'different training settings'):
+				_trainer(Checkpointer(path)).train(dataset, 11, resume=True)
+
+	def test_resume_without_checkpoint_starts_fresh(self) -> None:
+		dataset = _dataset()
+		with TemporaryDirectory() as td:
+			resumed = _trainer(Checkpointer(Path(td) / 'missing.json')).train(dataset, 20, resume=True)
+		self.assertEqual(resumed.to_list(), _trainer().train(dataset, 20).to_list())
+		with self.assertRaises(ValueError):
+			_trainer().train(dataset, 20, resume=True)
+
+if __name__ == '__main__':
+	unittest.main()
@@ -1,3 +1,4 @@
+import pickle
 import unittest
 from srcs import Vector
 
@@ -42,6 +43,10 @@ class TestVector(unittest.TestCase):
 		w = v.map(lambda x: x + 0.5)
 		self.assertEqual(w.to_list(), [1.5, 2.5, 3.5])
 
+	def test_affine(self):
+		v = Vector([1, 2])
+		self.assertEqual(v.affine(3, 0.5).to_list(), [3.5, 6.5])
+
 	def test_square(self):
 		v = Vector([1, -2, 3])
 		self.assertEqual(v.square().to_list(), [1.0, 4.0, 9.0])
@@ -100,6 +105,15 @@ class TestVector(unittest.TestCase):
 		with self.assertRaises(IndexError):
 			_ = v[3]
 
+	def test_getitem_slice_returns_vector(self):
+		v = Vector([10, 20, 30])
+		self.assertEqual(v[1:].to_list(), [20.0, 30.0])
+		self.assertIsInstance(v[:1], Vector)
+
+	def test_take(self):
+		v = Vector([10, 20, 30])
+		self.assertEqual(v.take([2, 0]).to_list(), [30.0, 10.0])
+
 	def test_iter(self):
 		v = Vector([1, 2, 3])
 		self.assertEqual(list(iter(v)), [1.0, 2.0, 3.0])
@@ -109,9 +123,77 @@ class TestVector(unittest.TestCase):
 		self.assertEqual(len(Vector()), 0)
 		self.assertEqual(len(Vector([1, 2, 3])), 3)
 
+	def test_init_from_vector_copies(self):
+		v = Vector([1, 2])
+		w = Vector(v)
+		w.isub(Vector([1, 1]))
+		self.assertEqual(v.to_list(), [1.0, 2.0])
+		self.assertEqual(w.to_list(), [0.0, 1.0])
+
+	def test_from_buffer_shares_memory(self):
+		from array import array
+		source = array('d', [1.0, 2.0, 3.0])
+		v = Vector.from_buffer(source)
+		source[0] = 10.0
+		self.assertEqual(v.to_list(), [10.0, 2.0, 3.0])
+		self.assertEqual(Vector.from_buffer(bytearray(source.tobytes())).to_list(), [10.0, 2.0, 3.0])
+
+	def test_zeros(self):
+		self.assertEqual(Vector.zeros(3).to_list(), [0.0, 0.0, 0.0])
+
+	def test_isub_in_place(self):
+		v = Vector([5, 7])
+		result = v.isub(Vector([3, 4]))
+		self.assertIs(result, v)
+		self.assertEqual(v.to_list(), [2.0, 3.0])
+		with self.assertRaises(ValueError):
+			v.isub(Vector([1]))
+
+	def test_imul_in_place(self):
+		v = Vector([1, -2])
+		self.assertIs(v.imul(3), v)
+		self.assertEqual(v.to_list(), [3.0, -6.0])
+
+	def test_axpy_in_place(self):
+		v = Vector([1, 1])
+		self.assertIs(v.axpy(2, Vector([3, -1])), v)
+		self.assertEqual(v.to_list(), [7.0, -1.0])
+		with self.assertRaises(ValueError):
+			v.axpy(1, Vector([1, 2, 3]))
+
+	def test_squared_distance(self):
+		v1 = Vector([1, 2, 3])
+		v2 = Vector([2, 0, 3])
+		self.assertEqual(v1.squared_distance(v2), 5.0)
+		self.assertEqual(v1.squared_distance(v2), (v1 - v2).square().sum())
+		with self.assertRaises(ValueError):
+			v1.squared_distance(Vector([1]))
+
+	def test_sum_of_squares(self):
+		self.assertEqual(Vector([1, -2, 3]).sum_of_squares(), 14.0)
+
+	def test_dot_length_mismatch_raises(self):
+		with self.assertRaises(ValueError):
+			Vector([1, 2]).dot(Vector([1]))
+
 	def test_repr(self):
 		v = Vector([1, 2])
 		self.assertEqual(repr(v), "Vector([1.0, 2.0])")
 
+	def test_buffer_exposes_values_without_copy(self) -> None:
+		v = Vector([1.0, 2.5])
+		view = v.buffer()
+		self.assertEqual(view.format, 'd')
+		self.assertEqual(view.tolist(), [1.0, 2.5])
+		v.imul(2.0)
+		self.assertEqual(view.tolist(), [2.0, 5.0])
+
+	def test_buffer_backed_vectors_pickle_as_owned_copies(self) -> None:
+		source = bytearray(Vector([1.5, -2.0]).to_bytes())
+		clone = pickle.loads(pickle.dumps(Vector.from_buffer(source)))
+		self.assertEqual(clone.to_list(), [1.5, -2.0])
+		clone.imul(2.0)
+		self.assertEqual(Vector.from_buffer(source).to_list(), [1.5, -2.0])
+
 if __name__ == '__main__':
 	unittest.main()